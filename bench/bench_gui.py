@@ -0,0 +1,180 @@
+"""Latency of the Qt UI, run headless on the offscreen platform.
+
+Usage:
+    python -m bench.bench_gui [--quick] [--only NAME] [--compare OLD.json]
+
+Times CtrlLord.show_launcher until the window is exposed,
+prepare_task_preview with large generated descriptions, the
+adjust_height_to_content cost of one keystroke, TaskDashboard.load_tasks
+with 10k rows and the PlaybookDashboard log at 100k lines. Options and
+the result file (bench/results/<commit>-gui.json) are the same as for
+``python -m bench.run``.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import toml
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+from bench import run
+from bench.run import measure, registrar, result
+from services import config
+from services.task_loader import TaskRow
+from services.task_record import TaskRecord
+
+BENCHMARKS = {}
+benchmark = registrar(BENCHMARKS)
+
+
+def _app() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def _launcher(data_dir: str):
+    """Create a CtrlLord window with a mock-mode config in data_dir."""
+    from ui.launcher import CtrlLord
+
+    path = os.path.join(data_dir, "config.toml")
+    settings = run._config(data_dir)
+    settings["llm"]["mode"] = "mock"
+    with open(path, "w") as f:
+        toml.dump(settings, f)
+    # load_config reads CONFIG_PATH on every call, so this covers all services
+    with patch.object(config, "CONFIG_PATH", path):
+        return CtrlLord()
+
+
+def _description(size: int) -> str:
+    section = "## Context\n\n" + "- lorem ipsum dolor sit amet, consectetur adipiscing\n" * 20
+    return "# Generated\n\n" + section * (size // len(section) + 1)
+
+
+@benchmark
+def bench_show_launcher(sizes):
+    app = _app()
+    with tempfile.TemporaryDirectory() as data_dir:
+        window = _launcher(data_dir)
+
+        def show():
+            window.hide()
+            app.processEvents()
+            window.show_launcher()
+            QTest.qWaitForWindowExposed(window)
+            app.processEvents()
+
+        yield result("show_launcher", {}, measure(show, repeat=20))
+        window._shutdown_worker()
+
+
+@benchmark
+def bench_prepare_task_preview(sizes):
+    app = _app()
+    with tempfile.TemporaryDirectory() as data_dir:
+        window = _launcher(data_dir)
+        window.show_launcher()
+        for size in (10_000, 100_000, 1_000_000)[:len(sizes)]:
+            payload = {"summary": "Generated summary", "description": _description(size),
+                       "type": "Task"}
+            window.generator.build_task_payload = lambda _summary: payload
+            times = []
+            for _ in range(3):
+                window.reset_ui()
+                window.show_launcher()
+                window.input.setText("Summary")
+                app.processEvents()
+                start = time.perf_counter()
+                window.prepare_task_preview()
+                app.processEvents()  # the deferred adjust_height_to_content
+                times.append(time.perf_counter() - start)
+            yield result("prepare_task_preview", {"bytes": len(payload["description"])},
+                         {"min": min(times), "median": sorted(times)[1], "max": max(times)})
+        window._shutdown_worker()
+
+
+@benchmark
+def bench_keystroke(sizes):
+    app = _app()
+    with tempfile.TemporaryDirectory() as data_dir:
+        window = _launcher(data_dir)
+        window.show_launcher()
+        for size in (1_000, 10_000, 100_000)[:len(sizes)]:
+            window.reset_ui()
+            window.show_launcher()
+            window.input.setText("Summary")
+            window.generator.build_task_payload = lambda _summary: {
+                "summary": "Summary", "description": _description(size), "type": "Task"}
+            window.prepare_task_preview()
+            app.processEvents()
+            # Each key press changes the text and resizes through textChanged
+            yield result("keystroke", {"bytes": len(window.textarea.toPlainText())},
+                         measure(lambda: QTest.keyClick(window.textarea, Qt.Key_A), repeat=50))
+            yield result("adjust_height_to_content", {"bytes": len(window.textarea.toPlainText())},
+                         measure(window.adjust_height_to_content, repeat=50))
+        window._shutdown_worker()
+
+
+@benchmark
+def bench_task_dashboard(sizes):
+    from ui.dashboard import TaskDashboard
+
+    app = _app()
+    count = 10_000
+    with tempfile.TemporaryDirectory() as data_dir:
+        # Only the selected row's file is read, so one file serves every row
+        path = os.path.join(data_dir, "TASK.json")
+        with open(path, "w") as f:
+            json.dump(TaskRecord("TASK-1", "Summary", _description(10_000)).to_dict(), f)
+        rows = [TaskRow(f"TASK-{n}", f"Summary of task {n}", "2026-01-01T00:00:00+00:00", path)
+                for n in range(count, 0, -1)]
+        dashboard = TaskDashboard()
+        dashboard.show_at(0, 0)
+
+        def load():
+            dashboard.load_tasks(rows)
+            app.processEvents()
+
+        yield result("task_dashboard.load_tasks", {"rows": count}, measure(load, repeat=5),
+                     ops=count)
+        dashboard.hide()
+
+
+@benchmark
+def bench_playbook_log(sizes):
+    from ui.playbook_dashboard import PlaybookDashboard
+
+    app = _app()
+    count = 100_000 if len(sizes) > 2 else 10_000
+    playbook = {"name": "Bench", "steps": [{"name": "Step", "run": "true"}], "params": [],
+                "file_path": "/tmp/bench.yml"}
+    dashboard = PlaybookDashboard()
+    dashboard.load_playbooks([playbook])
+    dashboard.show_at(0, 0)
+
+    def stream():
+        # Lines arrive as queued signals; repaint about as often as the event loop would
+        for n in range(count):
+            dashboard._on_log_line(playbook["file_path"], f"[{n}] building target {n % 97}")
+            if n % 1000 == 0:
+                app.processEvents()
+        app.processEvents()
+
+    yield result("playbook_dashboard.log_lines", {"lines": count},
+                 measure(stream, repeat=1), ops=count)
+    dashboard.hide()
+
+
+def main(argv=None):
+    _app()
+    return run.main(argv, benchmarks=BENCHMARKS, suite="gui")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Scale test of run_jenkins_jobs.py against the in-process fake Jenkins.
+
+Usage:
+    python -m bench.bench_jenkins --jobs 500
+    python -m bench.bench_jenkins --jobs 500 --engine threads --build-seconds 5 --stream-logs
+
+Runs ``--jobs`` independent jobs in parallel mode and reports the wall
+time, the requests made per route and per job, the peak number of client
+threads and the most requests the server handled at once, so changes to
+the polling schedule or the engines can be compared. ``--output`` also
+writes the report as JSON.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from bench.fake_jenkins import FakeJenkins
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "playbooks", "tools"))
+
+import run_jenkins_jobs as rjj  # noqa: E402
+
+ENGINES = ("async", "threads")
+CONFIG = {"jenkins": {"user": "bench", "token": "token"}}
+
+
+class ThreadSampler:
+    """Tracks the peak number of threads, not counting the fake server's own."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="thread-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            client = [t for t in threading.enumerate()
+                      if t is not self._thread and "process_request_thread" not in t.name
+                      and t.name != "fake-jenkins"]
+            self.peak = max(self.peak, len(client))
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stopped.set()
+        self._thread.join()
+
+
+def run_scale(jobs: int, engine: str = "async", build_seconds: float = 2.0, queue_seconds: float = 0.5,
+              max_connections: int = rjj.DEFAULT_MAX_CONNECTIONS, max_concurrency: int = 0,
+              stream_logs: bool = False, latency: dict | None = None) -> dict:
+    """Run ``jobs`` parallel jobs against a fresh FakeJenkins and return the report."""
+    job_list = [{"name": f"scale/job-{n}"} for n in range(jobs)]
+    with FakeJenkins(build_seconds, queue_seconds, latency=latency) as jenkins:
+        start = time.perf_counter()
+        with ThreadSampler() as threads, contextlib.redirect_stdout(io.StringIO()):
+            if engine == "async":
+                results = asyncio.run(rjj.run_with_client(
+                    CONFIG, jenkins.url, job_list, 600, "parallel", False,
+                    max_concurrency, max_connections, stream_logs,
+                ))
+            else:
+                session = rjj.make_session(CONFIG)
+                crumb = rjj.get_crumb(session, jenkins.url)
+                results = rjj.run_parallel(session, jenkins.url, job_list, crumb, 600,
+                                           max_concurrency, stream_logs)
+        wall = time.perf_counter() - start
+
+    total = sum(jenkins.requests.values())
+    return {
+        "jobs": jobs,
+        "engine": engine,
+        "build_seconds": build_seconds,
+        "queue_seconds": queue_seconds,
+        "stream_logs": stream_logs,
+        "wall_s": wall,
+        "results": dict(Counter(result for _name, result, _url in results)),
+        "requests": dict(sorted(jenkins.requests.items())),
+        "requests_total": total,
+        "requests_per_job": total / jobs if jobs else 0.0,
+        "peak_threads": threads.peak,
+        "server_max_in_flight": jenkins.max_in_flight,
+    }
+
+
+def format_report(report: dict) -> str:
+    results = ", ".join(f"{name}: {count}" for name, count in sorted(report["results"].items()))
+    lines = [
+        f"jobs       {report['jobs']} in parallel ({report['engine']} engine, "
+        f"{report['build_seconds']:g}s builds, {report['queue_seconds']:g}s queued)",
+        f"results    {results}",
+        f"wall time  {report['wall_s']:.2f}s",
+        f"requests   {report['requests_total']} ({report['requests_per_job']:.1f} per job)",
+    ]
+    lines += [f"  {route:<28} {count}" for route, count in report["requests"].items()]
+    lines += [
+        f"threads    {report['peak_threads']} peak in this process",
+        f"server     {report['server_max_in_flight']} requests in flight at most",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scale-test run_jenkins_jobs against a fake Jenkins")
+    parser.add_argument("--jobs", type=int, default=500, help="Parallel jobs (default: 500)")
+    parser.add_argument("--engine", choices=ENGINES, default="async")
+    parser.add_argument("--build-seconds", type=float, default=2.0, help="Build duration (default: 2)")
+    parser.add_argument("--queue-seconds", type=float, default=0.5, help="Queue delay (default: 0.5)")
+    parser.add_argument("--max-connections", type=int, default=rjj.DEFAULT_MAX_CONNECTIONS,
+                        help="Async client connection pool size")
+    parser.add_argument("--max-concurrency", type=int, default=0, help="Jobs in flight (0: all)")
+    parser.add_argument("--stream-logs", action="store_true", help="Also poll progressiveText")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Server latency per request")
+    parser.add_argument("--output", help="Also write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    report = run_scale(args.jobs, args.engine, args.build_seconds, args.queue_seconds,
+                       args.max_connections, args.max_concurrency, args.stream_logs,
+                       latency={"latency_ms": args.latency_ms})
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Throughput of the Jira paths against the in-process fake Jira server.
+
+Usage:
+    python -m bench.bench_jira [--quick] [--only NAME] [--compare OLD.json]
+
+Times JiraService.submit_task in live mode, and jira_release.py's search
+pagination and link-issues fan-out, with and without simulated network
+latency (see bench/fake_jira.py). Options and the result file
+(bench/results/<commit>-jira.json) are the same as for ``python -m bench.run``.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+import requests
+
+from bench import run
+from bench.fake_jira import FakeJira
+from bench.run import measure, registrar, result
+from services.jira_service import JiraService
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "playbooks", "tools"))
+
+import jira_release  # noqa: E402
+
+BENCHMARKS = {}
+benchmark = registrar(BENCHMARKS)
+
+LATENCIES_MS = (0, 20)
+
+
+def _session() -> requests.Session:
+    session = requests.Session()
+    session.auth = ("bench", "token")
+    session.headers["Content-Type"] = "application/json"
+    return session
+
+
+@benchmark
+def bench_submit_task(sizes):
+    count = 100
+    for latency_ms in LATENCIES_MS:
+        with tempfile.TemporaryDirectory() as data_dir, FakeJira(latency={"latency_ms": latency_ms}) as jira:
+            config = run._config(data_dir)
+            config["jira"].update(base_url=jira.url, project_key=jira.project, mode="live",
+                                  username="bench", token="token")
+            with patch("services.jira_service.load_config", return_value=config):
+                service = JiraService()
+
+            def submit_all():
+                service.submit_tasks([(f"Task {n}", "Description", "Task", "Core") for n in range(count)])
+                service.flush()
+
+            yield result("jira_submit_task", {"tasks": count, "latency_ms": latency_ms},
+                         measure(submit_all, repeat=3), ops=count)
+
+
+@benchmark
+def bench_search(sizes):
+    with FakeJira() as jira:
+        jira.add_issues(sizes[-1] // 10)
+        session = _session()
+
+        def search_all():
+            return sum(1 for _ in jira_release.iter_issues(session, jira.url, "project = PROJ"))
+
+        yield result("jira_search", {"issues": len(jira.issues), "page_size": jira_release.SEARCH_PAGE_SIZE},
+                     measure(search_all, repeat=3), ops=len(jira.issues))
+
+
+@benchmark
+def bench_link_issues(sizes):
+    count = 500
+    for latency_ms in LATENCIES_MS:
+        for workers in (1, 8):
+            with tempfile.TemporaryDirectory() as tmp, FakeJira(latency={"latency_ms": latency_ms}) as jira:
+                ticket_file = os.path.join(tmp, "ticket.txt")
+                jira.add_issues(count, fixVersion="1.0")
+                args = argparse.Namespace(jql="fixVersion = 1.0", link_type="Relates",
+                                          workers=workers, rate=0, page_size=jira_release.SEARCH_PAGE_SIZE)
+
+                def link_all():
+                    # A fresh release ticket each round, so every issue gets linked again
+                    with open(ticket_file, "w") as f:
+                        f.write(jira.add_issue("Release 1.0", "Release"))
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        jira_release.cmd_link_issues(_session(), jira.url, args, session_factory=_session)
+
+                with patch.dict(os.environ, RELEASE_TICKET_FILE=ticket_file):
+                    seconds = measure(link_all, repeat=3)
+                yield result("jira_link_issues", {"issues": count, "workers": workers,
+                                                  "latency_ms": latency_ms}, seconds, ops=count)
+
+
+def main(argv=None):
+    return run.main(argv, benchmarks=BENCHMARKS, suite="jira")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
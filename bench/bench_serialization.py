@@ -0,0 +1,90 @@
+"""Compare the task JSON codecs on saving and loading a day's worth of tasks.
+
+Usage: python -m bench.bench_serialization [--tasks 10000]
+
+For every installed codec (stdlib json, orjson, msgspec) it times encoding
+tasks as pretty-printed files, writing them, and the load_todays_tasks
+read path: read, decode and parse created_at for every file.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timezone, timedelta
+
+from services.serialization import CODECS, BACKEND
+
+WORDS = ("login", "cache", "deploy", "timeout", "retry", "dashboard", "token",
+         "refresh", "latency", "queue", "worker", "index", "export", "report")
+
+
+def make_tasks(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    tasks = []
+    for n in range(1, count + 1):
+        words = rng.choices(WORDS, k=60)
+        tasks.append({
+            "key": f"TASK-{n}",
+            "summary": " ".join(words[:6]).capitalize(),
+            "description": " ".join(words),
+            "type": rng.choice(("Task", "Bug", "Story")),
+            "component": rng.choice(("Core", "UI", "API")),
+            "url": f"/data/TASK-{n}.json",
+            "created_at": (start + timedelta(seconds=n)).isoformat(),
+        })
+    return tasks
+
+
+def bench_codec(codec, tasks: list[dict], directory: str) -> dict:
+    t0 = time.perf_counter()
+    blobs = [codec.dumps(task, pretty=True) for task in tasks]
+    t1 = time.perf_counter()
+    paths = []
+    for task, blob in zip(tasks, blobs):
+        path = os.path.join(directory, f"{task['key']}.json")
+        with open(path, "wb") as f:
+            f.write(blob)
+        paths.append(path)
+    t2 = time.perf_counter()
+    for path in paths:
+        with open(path, "rb") as f:
+            task = codec.loads(f.read())
+        datetime.fromisoformat(task["created_at"])
+    t3 = time.perf_counter()
+    return {
+        "encode_s": t1 - t0,
+        "write_s": t2 - t1,
+        "load_s": t3 - t2,
+        "bytes": sum(map(len, blobs)),
+    }
+
+
+def run(count: int) -> dict:
+    tasks = make_tasks(count)
+    results = {}
+    for name, codec in CODECS.items():
+        with tempfile.TemporaryDirectory() as directory:
+            results[name] = bench_codec(codec, tasks, directory)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000, help="Number of tasks (default: 10000)")
+    args = parser.parse_args(argv)
+
+    results = run(args.tasks)
+    baseline = results["json"]
+    print(f"{args.tasks} tasks, default codec: {BACKEND}")
+    print(f"{'codec':<8} {'encode':>9} {'write':>9} {'load':>9} {'MB':>7} {'speedup':>8}")
+    for name, r in results.items():
+        speedup = (baseline["encode_s"] + baseline["load_s"]) / (r["encode_s"] + r["load_s"])
+        print(f"{name:<8} {r['encode_s'] * 1000:7.1f}ms {r['write_s'] * 1000:7.1f}ms "
+              f"{r['load_s'] * 1000:7.1f}ms {r['bytes'] / 1e6:7.2f} {speedup:7.2f}x")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""In-process stand-in for the Jenkins remote API, for offline tests and benchmarks.
+
+Covers what playbooks/tools/run_jenkins_jobs.py uses: crumbIssuer,
+build/buildWithParameters answering 201 with a queue item Location,
+queue items that get an executable once their queue delay has passed,
+build JSON with building/result/timestamp/estimatedDuration, and
+logText/progressiveText with X-Text-Size and X-More-Data::
+
+    with FakeJenkins(build_seconds=2, queue_seconds=0.5, results={"deploy": "FAILURE"}) as jenkins:
+        ...  # point run_jenkins_jobs at jenkins.url
+
+Time is real: a build is queued for ``queue_seconds``, runs for
+``build_seconds`` (a number, or a function of the job name) and writes a
+log line every ``log_interval`` seconds while it runs; with
+``logs=False`` logText answers 404, as for a purged log. ``latency`` is a
+simulator table (see services.simulator) applied to every request.
+``requests`` counts the calls per route and ``max_in_flight`` the most
+requests handled at once.
+"""
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from services.simulator import SimulatedConnectionError, SimulatedHTTPError, SimulatedTimeout, Simulator
+
+logger = logging.getLogger(__name__)
+
+CRUMB_FIELD = "Jenkins-Crumb"
+CRUMB = "fake-crumb"
+
+_JOB = r"((?:/job/[^/]+)+)"
+
+
+def _job_name(job_path: str) -> str:
+    """Turn "/job/folder/job/name" into "folder/name"."""
+    return job_path[len("/job/"):].replace("/job/", "/")
+
+
+class Build:
+    __slots__ = ("job", "number", "params", "queue_id", "queued_at", "started_at", "duration", "result")
+
+    def __init__(self, job, number, params, queue_id, queued_at, started_at, duration, result):
+        self.job = job
+        self.number = number
+        self.params = params
+        self.queue_id = queue_id
+        self.queued_at = queued_at
+        self.started_at = started_at
+        self.duration = duration
+        self.result = result
+
+    def log(self, now: float, interval: float) -> str:
+        """Console output written by ``now``: one line per ``interval`` of runtime."""
+        if now < self.started_at:
+            return ""
+        elapsed = min(now, self.started_at + self.duration) - self.started_at
+        lines = [f"Started build #{self.number} of {self.job}"]
+        lines += [f"step {n}" for n in range(1, int(elapsed / interval) + 1)] if interval else []
+        if now >= self.started_at + self.duration:
+            lines.append(f"Finished: {self.result}")
+        return "".join(line + "\n" for line in lines)
+
+
+class FakeJenkins:
+    """A fake Jenkins server on a free localhost port; use as a context manager."""
+
+    def __init__(self, build_seconds=1.0, queue_seconds=0.0, results=None, crumb: bool = True,
+                 log_interval: float = 0.1, latency: dict | None = None, logs: bool = True):
+        self.build_seconds = build_seconds
+        self.queue_seconds = queue_seconds
+        self.results = results or {}  # job name -> result; others succeed
+        self.crumb = crumb
+        self.log_interval = log_interval
+        self.logs = logs
+        self.simulator = Simulator(latency)
+        self.builds = []  # in trigger order; queue item N is builds[N - 1]
+        self.requests = Counter()  # "METHOD route" -> calls
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._numbers = Counter()  # job name -> last build number
+        self._by_number = {}  # (job name, build number) -> Build
+        self._lock = threading.Lock()
+        self._server = None
+        self.url = ""
+
+    # -- lifecycle --
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._server = ThreadingHTTPServer((host, port), _handler(self))
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 1024  # hundreds of jobs connect at once
+        threading.Thread(target=self._server.serve_forever, args=(0.05,),
+                         name="fake-jenkins", daemon=True).start()
+        self.url = "http://%s:%d" % self._server.server_address[:2]
+        return self.url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # -- state --
+
+    def triggered(self) -> list[str]:
+        """Names of the triggered jobs, in trigger order."""
+        return [build.job for build in self.builds]
+
+    def _duration(self, job: str) -> float:
+        return self.build_seconds(job) if callable(self.build_seconds) else self.build_seconds
+
+    def _build_url(self, build: Build) -> str:
+        return f"{self.url}/job/{'/job/'.join(build.job.split('/'))}/{build.number}/"
+
+    def _find(self, job_path: str, number: str) -> Build | None:
+        return self._by_number.get((_job_name(job_path), int(number)))
+
+    # -- routes; each returns (status, body, headers) --
+
+    def crumb_issuer(self, query, headers):
+        if not self.crumb:
+            return 404, None, {}
+        return 200, {"crumbRequestField": CRUMB_FIELD, "crumb": CRUMB}, {}
+
+    def trigger(self, query, headers, job_path, kind):
+        if self.crumb and headers.get(CRUMB_FIELD) != CRUMB:
+            return 403, "No valid crumb was included in the request", {}
+        job = _job_name(job_path)
+        now = time.monotonic()
+        with self._lock:
+            self._numbers[job] += 1
+            build = Build(job, self._numbers[job], query, len(self.builds) + 1, now,
+                          now + self.queue_seconds, self._duration(job), self.results.get(job, "SUCCESS"))
+            self.builds.append(build)
+            self._by_number[job, build.number] = build
+            queue_id = build.queue_id
+        return 201, None, {"Location": f"{self.url}/queue/item/{queue_id}/"}
+
+    def queue_item(self, query, headers, queue_id):
+        index = int(queue_id) - 1
+        if not 0 <= index < len(self.builds):
+            return 404, None, {}
+        build = self.builds[index]
+        data = {"id": build.queue_id, "task": {"name": build.job}, "cancelled": False}
+        if time.monotonic() < build.started_at:
+            data.update(why="Waiting for next available executor", executable=None)
+        else:
+            data["executable"] = {"number": build.number, "url": self._build_url(build)}
+        return 200, data, {}
+
+    def build_json(self, query, headers, job_path, number):
+        build = self._find(job_path, number)
+        now = time.monotonic()
+        if build is None or now < build.started_at:
+            return 404, None, {}
+        building = now < build.started_at + build.duration
+        return 200, {
+            "number": build.number,
+            "url": self._build_url(build),
+            "building": building,
+            "result": None if building else build.result,
+            # Wall-clock milliseconds, as Jenkins reports them
+            "timestamp": int((time.time() - (now - build.started_at)) * 1000),
+            "estimatedDuration": int(build.duration * 1000),
+        }, {}
+
+    def progressive_text(self, query, headers, job_path, number):
+        build = self._find(job_path, number)
+        now = time.monotonic()
+        if build is None or now < build.started_at or not self.logs:
+            return 404, None, {}
+        text = build.log(now, self.log_interval).encode()
+        start = int(query.get("start", 0))
+        more = now < build.started_at + build.duration
+        return 200, text[start:].decode(), {"X-Text-Size": str(len(text)),
+                                            "X-More-Data": "true" if more else "false"}
+
+
+# (method, path pattern, FakeJenkins method); the first match wins
+ROUTES = [
+    ("GET", re.compile(r"/crumbIssuer/api/json"), "crumb_issuer"),
+    ("POST", re.compile(rf"{_JOB}/(build|buildWithParameters)"), "trigger"),
+    ("GET", re.compile(r"/queue/item/(\d+)/api/json"), "queue_item"),
+    ("GET", re.compile(rf"{_JOB}/(\d+)/api/json"), "build_json"),
+    ("GET", re.compile(rf"{_JOB}/(\d+)/logText/progressiveText"), "progressive_text"),
+]
+
+
+def _handler(jenkins: FakeJenkins):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like a real server
+        disable_nagle_algorithm = True  # headers and body are separate writes
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def _dispatch(self, method):
+            url = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            for route_method, pattern, name in ROUTES:
+                match = pattern.fullmatch(url.path)
+                if match and route_method == method:
+                    break
+            else:
+                self._send(404, None, {})
+                return
+
+            with jenkins._lock:
+                jenkins.requests[f"{method} {name}"] += 1
+                jenkins.in_flight += 1
+                jenkins.max_in_flight = max(jenkins.max_in_flight, jenkins.in_flight)
+            try:
+                jenkins.simulator.call()
+                status, body, headers = getattr(jenkins, name)(query, self.headers, *match.groups())
+            except SimulatedConnectionError:
+                self.close_connection = True
+                return
+            except SimulatedTimeout:
+                status, body, headers = 504, "Gateway timeout", {}
+            except SimulatedHTTPError as e:
+                status, body, headers = e.status, str(e), {}
+            finally:
+                with jenkins._lock:
+                    jenkins.in_flight -= 1
+            self._send(status, body, headers)
+
+        def _send(self, status, body, headers):
+            if isinstance(body, str):
+                payload, content_type = body.encode(), "text/plain;charset=utf-8"
+            else:
+                payload, content_type = (json.dumps(body).encode() if body is not None else b""), "application/json"
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            if payload:
+                self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            logger.debug("fake-jenkins: " + format, *args)
+
+    return Handler
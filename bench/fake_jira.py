@@ -0,0 +1,364 @@
+"""In-process stand-in for the Jira REST API (v2), for offline tests and benchmarks.
+
+Covers what JiraService and playbooks/tools/jira_release.py use: issue
+create and bulk create, issue GET, search with startAt/maxResults
+pagination, issueLink, transitions and createmeta. Issues live in memory;
+the JQL support is a small subset (``field = value``, ``!=``, ``~`` and
+``in (...)`` clauses joined by AND)::
+
+    with FakeJira(latency={"latency_ms": 20}, rate_limit=50) as jira:
+        jira.add_issues(500, summary="Bug {n}")
+        requests.get(f"{jira.url}/rest/api/2/search", params={"jql": "project = PROJ"})
+
+``latency`` is a simulator table (see services.simulator) applied to
+every request; injected HTTP errors become that status, timeouts a 504
+and connection errors a dropped connection. With ``rate_limit`` set, any
+request beyond that many per second gets a 429 with ``Retry-After``.
+``requests`` counts the calls per route.
+"""
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from services.simulator import SimulatedConnectionError, SimulatedHTTPError, SimulatedTimeout, Simulator
+
+logger = logging.getLogger(__name__)
+
+API = "/rest/api/2"
+ISSUE_TYPES = ("Task", "Bug", "Story", "Release")
+# (id, name); every transition except the one to the current status is available
+TRANSITIONS = (("11", "To Do"), ("21", "In Progress"), ("31", "Done"))
+MAX_RESULTS = 100  # Jira caps maxResults per search page
+
+_CLAUSE = re.compile(r'\s*(\w+)\s*(!=|=|~|\bin\b)\s*("[^"]*"|\([^)]*\)|[^\s()]+)\s*', re.IGNORECASE)
+
+
+class JQLError(ValueError):
+    pass
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    return value[1:-1] if value[:1] == value[-1:] == '"' else value
+
+
+def parse_jql(jql: str) -> list[tuple[str, str, object]]:
+    """Split ``jql`` into (field, operator, value) clauses; ORDER BY is ignored."""
+    jql = re.split(r"\border\s+by\b", jql, flags=re.IGNORECASE)[0].strip()
+    clauses = []
+    for part in re.split(r"\s+and\s+", jql, flags=re.IGNORECASE) if jql else []:
+        match = _CLAUSE.fullmatch(part)
+        if not match:
+            raise JQLError(f"Unsupported JQL clause: {part!r}")
+        field, op, value = match.groups()
+        op = op.lower()
+        if op == "in":
+            value = {_unquote(v) for v in value.strip("()").split(",")}
+        else:
+            value = _unquote(value)
+        clauses.append((field.lower(), op, value))
+    return clauses
+
+
+def _field_value(issue: dict, field: str) -> str:
+    if field == "key":
+        return issue["key"]
+    fields = issue["fields"]
+    value = next((v for name, v in fields.items() if name.lower() == field), None)
+    if isinstance(value, dict):
+        return value.get("key") or value.get("name", "")
+    return "" if value is None else str(value)
+
+
+def _matches(issue: dict, clauses) -> bool:
+    for field, op, value in clauses:
+        actual = _field_value(issue, field)
+        if op == "=" and actual.lower() != value.lower():
+            return False
+        if op == "!=" and actual.lower() == value.lower():
+            return False
+        if op == "~" and value.lower() not in actual.lower():
+            return False
+        if op == "in" and actual not in value:
+            return False
+    return True
+
+
+class FakeJira:
+    """A fake Jira server on a free localhost port; use as a context manager."""
+
+    def __init__(self, project: str = "PROJ", latency: dict | None = None, rate_limit: float = 0,
+                 retry_after: float = 1, issue_types=ISSUE_TYPES):
+        self.project = project
+        self.issue_types = tuple(issue_types)
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.simulator = Simulator(latency)
+        self.issues = {}  # key -> issue JSON as returned by GET /issue/{key}
+        self.links = []   # (link type, inward key, outward key)
+        self.requests = Counter()  # "METHOD route" -> calls, including rejected ones
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._next_id = 10000
+        self._recent = deque()  # request times in the last second, for rate_limit
+        self._lock = threading.Lock()
+        self._server = None
+        self.url = ""
+
+    # -- lifecycle --
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._server = ThreadingHTTPServer((host, port), _handler(self))
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, args=(0.05,),
+                         name="fake-jira", daemon=True).start()
+        self.url = "http://%s:%d" % self._server.server_address[:2]
+        return self.url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # -- state --
+
+    def add_issue(self, summary: str, issue_type: str = "Task", **fields) -> str:
+        """Create an issue directly, bypassing HTTP; return its key."""
+        fields = {"project": {"key": self.project}, "summary": summary,
+                  "issuetype": {"name": issue_type}, **fields}
+        return self._create(fields)["key"]
+
+    def add_issues(self, count: int, summary: str = "Issue {n}", issue_type: str = "Task",
+                   **fields) -> list[str]:
+        return [self.add_issue(summary.format(n=n), issue_type, **fields) for n in range(count)]
+
+    def _create(self, fields: dict) -> dict:
+        with self._lock:
+            self._next_id += 1
+            issue_id = str(self._next_id)
+            key = f"{fields['project']['key']}-{len(self.issues) + 1}"
+            self.issues[key] = {
+                "id": issue_id,
+                "key": key,
+                "self": f"{self.url}{API}/issue/{issue_id}",
+                "fields": {"description": "", "components": [], **fields,
+                           "status": {"name": TRANSITIONS[0][1]}, "issuelinks": []},
+            }
+        return {"id": issue_id, "key": key, "self": f"{self.url}{API}/issue/{issue_id}"}
+
+    def _validate(self, fields: dict) -> dict:
+        errors = {}
+        if fields.get("project", {}).get("key") != self.project:
+            errors["project"] = "valid project is required"
+        if not fields.get("summary"):
+            errors["summary"] = "You must specify a summary of the issue."
+        if fields.get("issuetype", {}).get("name") not in self.issue_types:
+            errors["issuetype"] = "valid issue type is required"
+        return errors
+
+    def _admit(self, route: str) -> bool:
+        """Count a request to ``route``; False if rate_limit rejects it."""
+        now = time.monotonic()
+        with self._lock:
+            self.requests[route] += 1
+            if not self.rate_limit:
+                return True
+            while self._recent and self._recent[0] <= now - 1:
+                self._recent.popleft()
+            if len(self._recent) >= self.rate_limit:
+                self.rate_limited += 1
+                return False
+            self._recent.append(now)
+            return True
+
+    # -- routes; each returns (status, JSON body or None) --
+
+    def create_issue(self, body, query):
+        fields = body.get("fields", {})
+        errors = self._validate(fields)
+        if errors:
+            return 400, {"errorMessages": [], "errors": errors}
+        return 201, self._create(fields)
+
+    def bulk_create(self, body, query):
+        issues, errors = [], []
+        for n, update in enumerate(body.get("issueUpdates", [])):
+            fields = update.get("fields", {})
+            element_errors = self._validate(fields)
+            if element_errors:
+                errors.append({"status": 400, "failedElementNumber": n,
+                               "elementErrors": {"errorMessages": [], "errors": element_errors}})
+            else:
+                issues.append(self._create(fields))
+        return 201, {"issues": issues, "errors": errors}
+
+    def get_issue(self, body, query, key):
+        issue = self.issues.get(key)
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        return 200, self._select(issue, query.get("fields"))
+
+    def search(self, body, query):
+        params = {**query, **body}
+        try:
+            clauses = parse_jql(params.get("jql", ""))
+        except JQLError as e:
+            return 400, {"errorMessages": [str(e)]}
+        start = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), MAX_RESULTS)
+        fields = params.get("fields")
+        if isinstance(fields, list):
+            fields = ",".join(fields)
+        with self._lock:
+            found = [issue for issue in self.issues.values() if _matches(issue, clauses)]
+        page = found[start:start + max_results]
+        return 200, {"startAt": start, "maxResults": max_results, "total": len(found),
+                     "issues": [self._select(issue, fields) for issue in page]}
+
+    def link(self, body, query):
+        link_type = body.get("type", {}).get("name", "")
+        inward = body.get("inwardIssue", {}).get("key")
+        outward = body.get("outwardIssue", {}).get("key")
+        if inward not in self.issues or outward not in self.issues:
+            return 404, {"errorMessages": ["Issue does not exist"]}
+        with self._lock:
+            self.links.append((link_type, inward, outward))
+            self.issues[inward]["fields"]["issuelinks"].append(
+                {"type": {"name": link_type}, "outwardIssue": {"key": outward}})
+            self.issues[outward]["fields"]["issuelinks"].append(
+                {"type": {"name": link_type}, "inwardIssue": {"key": inward}})
+        return 201, None
+
+    def get_transitions(self, body, query, key):
+        issue = self.issues.get(key)
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist"]}
+        status = issue["fields"]["status"]["name"]
+        return 200, {"transitions": [{"id": tid, "name": name, "to": {"name": name}}
+                                     for tid, name in TRANSITIONS if name != status]}
+
+    def do_transition(self, body, query, key):
+        issue = self.issues.get(key)
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist"]}
+        names = dict(TRANSITIONS)
+        tid = str(body.get("transition", {}).get("id", ""))
+        if tid not in names or names[tid] == issue["fields"]["status"]["name"]:
+            return 400, {"errorMessages": [f"Transition id '{tid}' is not valid for this issue."]}
+        issue["fields"]["status"] = {"name": names[tid]}
+        return 204, None
+
+    def createmeta(self, body, query):
+        keys = query.get("projectKeys")
+        if keys and self.project not in keys.split(","):
+            return 200, {"projects": []}
+        issue_types = [{"id": str(n), "name": name} for n, name in enumerate(self.issue_types, 1)]
+        if "fields" in query.get("expand", ""):
+            for issue_type in issue_types:
+                issue_type["fields"] = {
+                    "summary": {"required": True, "name": "Summary"},
+                    "description": {"required": False, "name": "Description"},
+                    "components": {"required": False, "name": "Component/s"},
+                }
+        return 200, {"projects": [{"key": self.project, "name": self.project, "issuetypes": issue_types}]}
+
+    @staticmethod
+    def _select(issue: dict, fields) -> dict:
+        if not fields or fields in ("*all", "*navigable"):
+            return issue
+        wanted = set(fields.split(","))
+        return {**issue, "fields": {k: v for k, v in issue["fields"].items() if k in wanted}}
+
+
+# (method, path pattern, FakeJira method); the first match wins
+ROUTES = [
+    ("POST", re.compile(rf"{API}/issue/bulk"), "bulk_create"),
+    ("GET", re.compile(rf"{API}/issue/createmeta"), "createmeta"),
+    ("POST", re.compile(rf"{API}/issue"), "create_issue"),
+    ("GET", re.compile(rf"{API}/issue/([^/]+)/transitions"), "get_transitions"),
+    ("POST", re.compile(rf"{API}/issue/([^/]+)/transitions"), "do_transition"),
+    ("GET", re.compile(rf"{API}/issue/([^/]+)"), "get_issue"),
+    ("GET", re.compile(rf"{API}/search"), "search"),
+    ("POST", re.compile(rf"{API}/search"), "search"),
+    ("POST", re.compile(rf"{API}/issueLink"), "link"),
+]
+
+
+def _handler(jira: FakeJira):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like a real server
+        disable_nagle_algorithm = True  # headers and body are separate writes
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def _dispatch(self, method):
+            url = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            for route_method, pattern, name in ROUTES:
+                match = pattern.fullmatch(url.path)
+                if match and route_method == method:
+                    break
+            else:
+                self._send(404, {"errorMessages": [f"No route for {method} {url.path}"]})
+                return
+
+            if not jira._admit(f"{method} {name}"):
+                self._send(429, {"errorMessages": ["Rate limit exceeded"]},
+                           {"Retry-After": f"{jira.retry_after:g}"})
+                return
+            with jira._lock:
+                jira.in_flight += 1
+                jira.max_in_flight = max(jira.max_in_flight, jira.in_flight)
+            try:
+                jira.simulator.call()
+                body = json.loads(raw) if raw else {}
+                status, payload = getattr(jira, name)(body, query, *match.groups())
+            except SimulatedConnectionError:
+                self.close_connection = True
+                return
+            except SimulatedTimeout:
+                status, payload = 504, {"errorMessages": ["Gateway timeout"]}
+            except SimulatedHTTPError as e:
+                status, payload = e.status, {"errorMessages": [str(e)]}
+            except ValueError as e:
+                status, payload = 400, {"errorMessages": [f"Invalid request: {e}"]}
+            finally:
+                with jira._lock:
+                    jira.in_flight -= 1
+            self._send(status, payload)
+
+        def _send(self, status, payload, headers=None):
+            body = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            if body:
+                self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("fake-jira: " + format, *args)
+
+    return Handler
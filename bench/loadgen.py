@@ -0,0 +1,181 @@
+"""Drive TaskQueueWorker at a target rate against the simulated mock Jira.
+
+Usage:
+    python -m bench.loadgen --qps 20 --duration 30
+    python -m bench.loadgen --qps 50 --workers 4 --latency lognormal \\
+        --latency-ms 200 --p99-ms 2000 --error http=0.02 --timeout-ms 1500
+
+Tasks are enqueued open-loop at ``--qps`` (a slow backend does not slow
+the sender down), so queueing shows up in the latencies. The latency of
+a task runs from enqueue to its task_completed/task_failed signal.
+The report gives throughput, failures by type and latency percentiles;
+``--output`` also writes it as JSON.
+"""
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+from unittest.mock import patch
+
+from PySide6.QtCore import QCoreApplication, Qt
+
+from bench import run
+from services.jira_service import JiraService
+from services.simulator import DISTRIBUTIONS, ERROR_TYPES
+from services.task_queue import TaskPayload, TaskQueueWorker
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(p / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _error_rate(text: str) -> tuple[str, float]:
+    name, _, rate = text.partition("=")
+    if name not in ERROR_TYPES:
+        raise argparse.ArgumentTypeError(f"error type must be one of {', '.join(ERROR_TYPES)}")
+    try:
+        return name, float(rate)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rate in {text!r}, expected e.g. http=0.01")
+
+
+class _Tracker:
+    """Matches completion signals to enqueue times; each worker is FIFO."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.failures = Counter()
+        self.done = 0
+
+    def attach(self, worker: TaskQueueWorker) -> deque:
+        pending = deque()
+
+        def finished(error=None):
+            now = time.perf_counter()
+            with self.lock:
+                self.latencies.append(now - pending.popleft())
+                self.done += 1
+                if error is not None:
+                    self.failures[error] += 1
+
+        # Direct connections: record on the worker thread, no event loop needed
+        worker.task_completed.connect(lambda _record: finished(), Qt.DirectConnection)
+        # Group failures by the start of the message, e.g. "Simulated timeout"
+        worker.task_failed.connect(lambda error, _payload: finished(" ".join(error.split()[:2])),
+                                   Qt.DirectConnection)
+        return pending
+
+
+def run_load(service, qps: float, duration: float, workers: int = 1) -> dict:
+    """Enqueue tasks at ``qps`` for ``duration`` seconds and wait for all of them."""
+    QCoreApplication.instance() or QCoreApplication([])
+    tracker = _Tracker()
+    pool = [TaskQueueWorker(service) for _ in range(workers)]
+    queues = [tracker.attach(worker) for worker in pool]
+    for worker in pool:
+        worker.start()
+
+    total = int(qps * duration)
+    start = time.perf_counter()
+    for n in range(total):
+        delay = start + n / qps - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        index = n % workers
+        with tracker.lock:
+            queues[index].append(time.perf_counter())
+        pool[index].enqueue(TaskPayload(f"Load task {n}", "Generated by bench.loadgen", "Task", "Core"))
+    sent_in = time.perf_counter() - start
+
+    for worker in pool:
+        worker.stop()
+    for worker in pool:
+        worker.wait()
+    elapsed = time.perf_counter() - start
+    service.flush()
+
+    latencies = sorted(tracker.latencies)
+    failed = sum(tracker.failures.values())
+    return {
+        "target_qps": qps,
+        "workers": workers,
+        "sent": total,
+        "completed": tracker.done - failed,
+        "failed": dict(tracker.failures),
+        "send_qps": total / sent_in if sent_in else 0.0,
+        "throughput_qps": tracker.done / elapsed if elapsed else 0.0,
+        "latency_s": {
+            **{f"p{p}": percentile(latencies, p) for p in PERCENTILES},
+            "max": latencies[-1] if latencies else 0.0,
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+        },
+    }
+
+
+def format_report(report: dict) -> str:
+    lat = report["latency_s"]
+    failed = ", ".join(f"{name}: {count}" for name, count in sorted(report["failed"].items()))
+    return "\n".join([
+        f"sent       {report['sent']} tasks at {report['send_qps']:.1f}/s "
+        f"(target {report['target_qps']:g}/s, {report['workers']} worker(s))",
+        f"completed  {report['completed']}  failed {sum(report['failed'].values())}"
+        + (f" ({failed})" if failed else ""),
+        f"throughput {report['throughput_qps']:.1f}/s",
+        "latency    " + "  ".join(f"p{p} {lat[f'p{p}'] * 1000:.0f}ms" for p in PERCENTILES)
+        + f"  max {lat['max'] * 1000:.0f}ms  mean {lat['mean'] * 1000:.0f}ms",
+    ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test TaskQueueWorker against mock Jira")
+    parser.add_argument("--qps", type=float, default=10, help="Target enqueue rate (default: 10)")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to send for (default: 10)")
+    parser.add_argument("--workers", type=int, default=1, help="TaskQueueWorker threads (default: 1)")
+    parser.add_argument("--latency", choices=DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-ms", type=float, default=500,
+                        help="Fixed latency, mean (normal) or median (lognormal); default 500")
+    parser.add_argument("--stddev-ms", type=float, default=0)
+    parser.add_argument("--p99-ms", type=float, default=0)
+    parser.add_argument("--timeout-ms", type=float, default=0)
+    parser.add_argument("--max-qps", type=float, default=0, help="Backend throughput cap")
+    parser.add_argument("--error", type=_error_rate, action="append", default=[],
+                        help="Injected error rate, e.g. http=0.01 (repeatable)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", help="Also write the report as JSON to this path")
+    args = parser.parse_args(argv)
+    # Injected failures are expected; the report counts them
+    logging.getLogger("services.task_queue").setLevel(logging.CRITICAL)
+
+    mock_cfg = {
+        "latency": args.latency, "latency_ms": args.latency_ms, "stddev_ms": args.stddev_ms,
+        "p99_ms": args.p99_ms, "timeout_ms": args.timeout_ms, "max_qps": args.max_qps,
+        "errors": dict(args.error), "seed": args.seed,
+    }
+    with tempfile.TemporaryDirectory() as data_dir:
+        config = run._config(data_dir)
+        config["jira"]["mock"] = mock_cfg
+        with patch("services.jira_service.load_config", return_value=config):
+            service = JiraService()
+        report = run_load(service, args.qps, args.duration, args.workers)
+
+    report["simulator"] = mock_cfg
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
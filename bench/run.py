@@ -0,0 +1,278 @@
+"""Benchmark suite for the task pipeline.
+
+Usage:
+    python -m bench.run                          # full run
+    python -m bench.run --quick                  # small sizes only
+    python -m bench.run --only load_todays_tasks --only next_task_id
+    python -m bench.run --compare bench/results/<old>.json
+
+Results are written as JSON (default: bench/results/<git commit>.json) so
+runs on two commits can be compared with ``--compare``; it exits with
+status 1 if any benchmark got slower than ``--threshold``.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from bench import bench_serialization as codec_bench
+from services.parser import parse_task_text
+from services.playbook_loader import load_playbooks
+from services.serialization import BACKEND
+from services.task_layout import partition_dir
+from services.task_loader import load_todays_tasks
+from services.task_record import TaskRecord
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+FULL_SIZES = (1_000, 10_000, 100_000)
+QUICK_SIZES = (1_000, 10_000)
+
+BENCHMARKS = {}
+
+
+def registrar(benchmarks: dict):
+    """Return a decorator that adds ``bench_<name>`` functions to ``benchmarks`` as ``<name>``."""
+    def benchmark(fn):
+        benchmarks[fn.__name__.removeprefix("bench_")] = fn
+        return fn
+    return benchmark
+
+
+benchmark = registrar(BENCHMARKS)
+
+
+def measure(fn, repeat=5) -> dict:
+    """Run fn ``repeat`` times and return timing stats in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": statistics.median(times), "max": max(times)}
+
+
+def result(name, params, seconds, ops=None) -> dict:
+    entry = {"name": name, "params": params, "seconds": seconds}
+    if ops:
+        entry["ops_per_s"] = ops / seconds["median"]
+    return entry
+
+
+def _config(data_dir, **task):
+    return {
+        "jira": {"base_url": "https://jira.example.com", "project_key": "BENCH", "mode": "mock"},
+        "llm": {"base_url": "http://localhost", "endpoint": "/generate"},
+        "ui": {"issue_types": ["Task"], "components": ["Core"]},
+        "task": {"backend": "json", "data_dir": data_dir, **task},
+    }
+
+
+def populate(data_dir: str, count: int) -> str:
+    """Write ``count`` task files into today's partition of data_dir."""
+    directory = partition_dir(data_dir, datetime.now(timezone.utc).date())
+    os.makedirs(directory, exist_ok=True)
+    for task in codec_bench.make_tasks(count):
+        with open(os.path.join(directory, f"{task['key']}.json"), "wb") as f:
+            f.write(json.dumps(task).encode())
+    return directory
+
+
+@benchmark
+def bench_parse_task_text(sizes):
+    line = "- " + "lorem ipsum dolor sit amet " * 3 + "\n"
+    for size in (10_000, 1_000_000, 10_000_000)[:len(sizes)]:
+        text = "# Summary line\n\n" + line * (size // len(line))
+        yield result("parse_task_text", {"bytes": len(text)},
+                     measure(lambda: parse_task_text(text)))
+
+
+@benchmark
+def bench_next_task_id(sizes):
+    from services.json_service import _next_task_id
+    from services.task_layout import COUNTER_FILENAME
+
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as data_dir:
+            populate(data_dir, count)
+            counter = os.path.join(data_dir, COUNTER_FILENAME)
+
+            def cold():
+                if os.path.exists(counter):
+                    os.remove(counter)
+                _next_task_id(data_dir)
+
+            yield result("next_task_id.first", {"files": count}, measure(cold, repeat=3))
+            yield result("next_task_id", {"files": count},
+                         measure(lambda: _next_task_id(data_dir), repeat=100), ops=1)
+
+
+@benchmark
+def bench_load_todays_tasks(sizes):
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as data_dir:
+            populate(data_dir, count)
+            yield result("load_todays_tasks", {"files": count},
+                         measure(lambda: load_todays_tasks(data_dir), repeat=3), ops=count)
+
+
+@benchmark
+def bench_save_task_json(sizes):
+    from services.json_service import JsonService
+
+    count = sizes[0]
+    for durability in ("none", "fsync"):
+        with tempfile.TemporaryDirectory() as data_dir:
+            with patch("services.json_service.load_config",
+                       return_value=_config(data_dir, durability=durability)):
+                service = JsonService()
+
+            def save_all():
+                for n in range(count):
+                    service.save_task_json(TaskRecord(f"TASK-{n}", "Summary", "Description"))
+                service.flush()
+
+            yield result("save_task_json", {"tasks": count, "durability": durability},
+                         measure(save_all, repeat=3), ops=count)
+
+
+@benchmark
+def bench_load_playbooks(sizes):
+    for count in (10, 100, 1_000):
+        with tempfile.TemporaryDirectory() as playbook_dir:
+            for n in range(count):
+                with open(os.path.join(playbook_dir, f"playbook_{n}.yml"), "w") as f:
+                    f.write(f"name: Playbook {n}\nsteps:\n"
+                            + "".join(f"  - name: Step {s}\n    run: echo {s}\n" for s in range(10)))
+            yield result("load_playbooks", {"files": count},
+                         measure(lambda: load_playbooks(playbook_dir), repeat=3), ops=count)
+
+
+@benchmark
+def bench_task_queue(sizes):
+    from PySide6.QtCore import QCoreApplication
+    from services.jira_service import JiraService
+    from services.task_queue import TaskPayload, TaskQueueWorker
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    count = sizes[0]
+    with tempfile.TemporaryDirectory() as data_dir:
+        # Mock Jira simulates 0.5s of network delay by default; measure our own overhead
+        config = _config(data_dir)
+        config["jira"]["mock"] = {"latency_ms": 0}
+        with patch("services.jira_service.load_config", return_value=config):
+            service = JiraService()
+
+            def run_queue():
+                done = []
+                worker = TaskQueueWorker(service)
+                worker.task_completed.connect(done.append)
+                for n in range(count):
+                    worker.enqueue(TaskPayload(f"Task {n}", "Description", "Task", "Core"))
+                worker.stop()
+                worker.start()
+                worker.wait()
+                app.processEvents()
+                service.flush()
+                assert len(done) == count, f"{len(done)} of {count} tasks completed"
+
+            yield result("task_queue_worker", {"tasks": count, "backend": "jira-mock"},
+                         measure(run_queue, repeat=3), ops=count)
+
+
+@benchmark
+def bench_serialization(sizes):
+    count = sizes[-1] if sizes[-1] <= 10_000 else 10_000
+    for codec, r in codec_bench.run(count).items():
+        seconds = r["encode_s"] + r["load_s"]
+        yield result("serialization", {"codec": codec, "tasks": count},
+                     {"min": seconds, "median": seconds, "max": seconds}, ops=count)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _key(entry) -> tuple:
+    return entry["name"], json.dumps(entry["params"], sort_keys=True)
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> int:
+    """Print the change against baseline and return the number of regressions."""
+    old = {_key(e): e for e in baseline["results"]}
+    regressions = 0
+    print(f"\nCompared with {baseline.get('commit', '?')}:")
+    for entry in current["results"]:
+        before = old.get(_key(entry))
+        if before is None:
+            continue
+        ratio = entry["seconds"]["median"] / before["seconds"]["median"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"  {entry['name']:<28} {json.dumps(entry['params']):<40} {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def main(argv=None, benchmarks=BENCHMARKS, suite=""):
+    """Run ``benchmarks`` and write the results; ``suite`` names the result file."""
+    name_suffix = f"-{suite}" if suite else ""
+    parser = argparse.ArgumentParser(description=f"Benchmark the {suite or 'task pipeline'}")
+    parser.add_argument("--quick", action="store_true", help="Skip the 100k sizes")
+    parser.add_argument("--only", action="append", choices=sorted(benchmarks),
+                        help="Run only this benchmark (repeatable)")
+    parser.add_argument("--output",
+                        help=f"Result JSON path (default: bench/results/<commit>{name_suffix}.json)")
+    parser.add_argument("--compare", help="Baseline result JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="Slowdown ratio reported as a regression (default: 1.2)")
+    args = parser.parse_args(argv)
+
+    sizes = QUICK_SIZES if args.quick else FULL_SIZES
+    commit = git_commit()
+    run = {
+        "commit": commit,
+        "suite": suite or "pipeline",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "codec": BACKEND,
+        "quick": args.quick,
+        "results": [],
+    }
+
+    for name in args.only or benchmarks:
+        for entry in benchmarks[name](sizes):
+            run["results"].append(entry)
+            ops = f"{entry['ops_per_s']:12,.0f}/s" if "ops_per_s" in entry else ""
+            print(f"{entry['name']:<28} {json.dumps(entry['params']):<40} "
+                  f"{entry['seconds']['median'] * 1000:10.2f}ms {ops}", flush=True)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}{name_suffix}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(run, f, indent=2)
+    print(f"\nWrote {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(run, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
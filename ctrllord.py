@@ -6,7 +6,6 @@ import fcntl
 import atexit
 import signal
 import logging
-import time
 import threading
 from pynput import keyboard
 
@@ -14,7 +13,9 @@ from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMessageBox, QMenu
 from PySide6.QtGui import QGuiApplication, QIcon
 from PySide6.QtCore import QMetaObject, Qt
 
-from services.config import setup_logging, load_config, get_resource_path
+from services.config import setup_logging, load_config, get_resource_path, LOCK_FILE
+from services.hotkey import DoubleTapDetector, ComboDetector, ListenerMetrics
+from services.profiler import read_request
 from ui.launcher import CtrlLord
 
 import subprocess
@@ -22,7 +23,6 @@ from ApplicationServices import AXIsProcessTrustedWithOptions
 
 logger = logging.getLogger(__name__)
 
-LOCK_FILE = '/tmp/ctrllord.lock'
 lock_fp = None
 
 
@@ -57,6 +57,9 @@ def acquire_lock():
     try:
         lock_fp = open(LOCK_FILE, 'w')
         fcntl.flock(lock_fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # python -m services.profiler signals this PID
+        lock_fp.write(str(os.getpid()))
+        lock_fp.flush()
         atexit.register(release_lock)
         return True
     except IOError:
@@ -111,6 +114,9 @@ def main():
     app.setWindowIcon(QIcon(get_resource_path("resources/icon.png")))
     QGuiApplication.setQuitOnLastWindowClosed(False)
     launcher = CtrlLord()
+    # Python runs the handler the next time it gets control, at the latest
+    # on the launcher's stall watchdog heartbeat
+    signal.signal(signal.SIGUSR1, lambda *_: launcher.start_profile(read_request()))
 
     def trigger_launcher():
         # Run GUI method from non-GUI thread safely
@@ -118,39 +124,36 @@ def main():
 
     # Start hotkey listener in thread (requires Accessibility permissions)
     if trusted:
+        metrics = ListenerMetrics()
+        app.aboutToQuit.connect(lambda: logger.info("Hotkey listener: %s", metrics.summary()))
+
         if hotkey == "double_cmd":
-            DOUBLE_TAP_INTERVAL = 0.3  # seconds
-
-            def listener():
-                last_cmd_release = 0.0
-                other_key_pressed = False
-
-                def on_press(key):
-                    nonlocal other_key_pressed
-                    if key not in (keyboard.Key.cmd, keyboard.Key.cmd_r):
-                        other_key_pressed = True
-
-                def on_release(key):
-                    nonlocal last_cmd_release, other_key_pressed
-                    if key in (keyboard.Key.cmd, keyboard.Key.cmd_r):
-                        now = time.monotonic()
-                        if not other_key_pressed and (now - last_cmd_release) < DOUBLE_TAP_INTERVAL:
-                            last_cmd_release = 0.0
-                            trigger_launcher()
-                        else:
-                            last_cmd_release = now
-                        other_key_pressed = False
-
-                with keyboard.Listener(on_press=on_press, on_release=on_release) as h:
-                    h.join()
+            detector = DoubleTapDetector((keyboard.Key.cmd, keyboard.Key.cmd_r), trigger_launcher)
         else:
-            def listener():
-                with keyboard.GlobalHotKeys({
-                    hotkey: trigger_launcher
-                }) as h:
-                    h.join()
-
-        threading.Thread(target=listener, daemon=True).start()
+            keys = keyboard.HotKey.parse(hotkey)
+            # Raw keys that may start the combination; everything else is
+            # dropped before pynput canonicalises it
+            modifiers = {
+                k for k in keyboard.Key
+                if k.name.split("_")[0] in ("cmd", "ctrl", "shift", "alt")
+            }
+            chars = {
+                keyboard.KeyCode.from_char(k.char.upper())
+                for k in keys if isinstance(k, keyboard.KeyCode) and k.char
+            }
+            detector = ComboDetector(keys, modifiers | chars, trigger_launcher)
+
+        def listener():
+            h = keyboard.Listener(
+                on_press=metrics.wrap(detector.on_press),
+                on_release=metrics.wrap(detector.on_release),
+            )
+            if isinstance(detector, ComboDetector):
+                detector.canonical = h.canonical
+            with h:
+                h.join()
+
+        threading.Thread(target=listener, name="hotkey-listener", daemon=True).start()
         logger.info("Hotkey is ready: %s", hotkey)
     else:
         logger.info("Tray-only mode: use the menu bar icon to open the launcher.")
@@ -5,10 +5,16 @@ import argparse
 import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 import yaml
 
+SEARCH_PAGE_SIZE = 100
+MAX_RETRIES = 3
+
 
 def load_config(path):
     with open(path) as f:
@@ -27,6 +33,40 @@ def make_session(config):
     return session
 
 
+class RateLimiter:
+    """Space out calls across threads so at most ``rate`` start per second (0 = unlimited)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def request_with_retry(session, method, url, **kwargs):
+    """Send a request, sleeping for Retry-After and retrying on HTTP 429."""
+    for attempt in range(MAX_RETRIES + 1):
+        resp = session.request(method, url, **kwargs)
+        if resp.status_code != 429 or attempt == MAX_RETRIES:
+            break
+        try:
+            delay = float(resp.headers.get("Retry-After", 1))
+        except ValueError:
+            delay = 1.0
+        time.sleep(delay)
+    resp.raise_for_status()
+    return resp
+
+
 def search_issues(session, base_url, jql, max_results=50):
     resp = session.get(
         f"{base_url}/rest/api/2/search",
@@ -37,6 +77,40 @@ def search_issues(session, base_url, jql, max_results=50):
     return resp.json().get("issues", [])
 
 
+def iter_issues(session, base_url, jql, page_size=SEARCH_PAGE_SIZE, fields="key"):
+    """Yield every issue matching jql, fetching one page at a time via startAt."""
+    start = 0
+    while True:
+        resp = request_with_retry(
+            session, "GET", f"{base_url}/rest/api/2/search",
+            params={"jql": jql, "startAt": start, "maxResults": page_size, "fields": fields},
+            timeout=15,
+        )
+        data = resp.json()
+        issues = data.get("issues", [])
+        yield from issues
+        start += len(issues)
+        if not issues or start >= data.get("total", 0):
+            return
+
+
+def get_linked_keys(session, base_url, issue_key, link_type):
+    """Return keys of issues already linked to issue_key with the given link type."""
+    resp = request_with_retry(
+        session, "GET", f"{base_url}/rest/api/2/issue/{issue_key}",
+        params={"fields": "issuelinks"},
+        timeout=15,
+    )
+    linked = set()
+    for link in resp.json().get("fields", {}).get("issuelinks", []):
+        if link.get("type", {}).get("name", "").lower() != link_type.lower():
+            continue
+        for side in ("inwardIssue", "outwardIssue"):
+            if side in link:
+                linked.add(link[side]["key"])
+    return linked
+
+
 def create_issue(session, base_url, project, summary, issue_type, description=""):
     payload = {
         "fields": {
@@ -61,12 +135,11 @@ def link_issue(session, base_url, inward_key, outward_key, link_type="Relates"):
         "inwardIssue": {"key": inward_key},
         "outwardIssue": {"key": outward_key},
     }
-    resp = session.post(
-        f"{base_url}/rest/api/2/issueLink",
+    request_with_retry(
+        session, "POST", f"{base_url}/rest/api/2/issueLink",
         data=json.dumps(payload),
         timeout=15,
     )
-    resp.raise_for_status()
 
 
 def get_transitions(session, base_url, issue_key):
@@ -116,7 +189,7 @@ def cmd_find_or_create(session, base_url, args):
     print(f"Ticket key written to {output}")
 
 
-def cmd_link_issues(session, base_url, args):
+def cmd_link_issues(session, base_url, args, session_factory=None):
     ticket_file = os.environ.get("RELEASE_TICKET_FILE", "/tmp/release_ticket_key.txt")
     with open(ticket_file) as f:
         release_key = f.read().strip()
@@ -126,22 +199,49 @@ def cmd_link_issues(session, base_url, args):
     print(f"Linking issues matching: {jql}")
     print(f"Release ticket: {release_key}")
 
-    issues = search_issues(session, base_url, jql)
-    if not issues:
+    existing = get_linked_keys(session, base_url, release_key, link_type)
+    existing.add(release_key)
+
+    # requests.Session is not thread-safe: give each worker its own
+    session_factory = session_factory or (lambda: session)
+    local = threading.local()
+    limiter = RateLimiter(args.rate)
+
+    def link(key):
+        if not hasattr(local, "session"):
+            local.session = session_factory()
+        limiter.wait()
+        link_issue(local.session, base_url, release_key, key, link_type)
+
+    found = skipped = linked = failed = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {}
+        # Links are submitted while later search pages are still being fetched
+        for issue in iter_issues(session, base_url, jql, page_size=args.page_size):
+            found += 1
+            key = issue["key"]
+            if key in existing:
+                skipped += 1
+                continue
+            existing.add(key)
+            futures[pool.submit(link, key)] = key
+
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                future.result()
+                linked += 1
+                print(f"  Linked {key}")
+            except requests.HTTPError as e:
+                failed += 1
+                print(f"  Failed to link {key}: {e}")
+
+    if not found:
         print("No issues found matching JQL.")
         return
 
-    for issue in issues:
-        key = issue["key"]
-        if key == release_key:
-            continue
-        try:
-            link_issue(session, base_url, release_key, key, link_type)
-            print(f"  Linked {key}")
-        except requests.HTTPError as e:
-            print(f"  Failed to link {key}: {e}")
-
-    print(f"Linked {len(issues)} issue(s) to {release_key}")
+    print(f"Linked {linked} issue(s) to {release_key} "
+          f"({skipped} already linked, {failed} failed, {found} found)")
 
 
 def cmd_transition(session, base_url, args):
@@ -185,6 +285,11 @@ def main():
     li = sub.add_parser("link-issues", help="Link issues by JQL to release ticket")
     li.add_argument("--jql", required=True, help="JQL to find issues")
     li.add_argument("--link-type", default="Relates", help="Issue link type name")
+    li.add_argument("--workers", type=int, default=8, help="Parallel link requests")
+    li.add_argument("--rate", type=float, default=10,
+                    help="Max link requests per second (0 = unlimited)")
+    li.add_argument("--page-size", type=int, default=SEARCH_PAGE_SIZE,
+                    help="Issues fetched per search request")
 
     # transition
     tr = sub.add_parser("transition", help="Transition the release ticket")
@@ -199,7 +304,7 @@ def main():
     if args.command == "find-or-create":
         cmd_find_or_create(session, base_url, args)
     elif args.command == "link-issues":
-        cmd_link_issues(session, base_url, args)
+        cmd_link_issues(session, base_url, args, session_factory=lambda: make_session(config))
     elif args.command == "transition":
         cmd_transition(session, base_url, args)
 
@@ -2,14 +2,25 @@
 """Trigger and monitor Jenkins jobs defined in a YAML config file."""
 
 import argparse
+import asyncio
 import os
+import random
 import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import httpx
 import requests
 import yaml
 
+DEFAULT_MAX_CONNECTIONS = 10
+
+# Poll intervals (seconds): start fast, back off exponentially up to the cap
+POLL_MIN = 1.0
+POLL_MAX = 30.0
+QUEUE_POLL_MAX = 10.0
+LOG_POLL_MAX = 10.0
+
 
 def load_yaml(path):
     if path == "-":
@@ -18,18 +29,122 @@ def load_yaml(path):
         return yaml.safe_load(f)
 
 
-def make_session(config):
+def get_credentials(config):
     jenkins = config["jenkins"]
     token = jenkins.get("token") or os.environ.get("JENKINS_API_TOKEN", "")
     if not token:
         sys.exit("Error: Jenkins API token not set in config or JENKINS_API_TOKEN env var")
+    return jenkins["user"], token
+
 
+def make_session(config):
     session = requests.Session()
-    session.auth = (jenkins["user"], token)
+    session.auth = get_credentials(config)
     session.headers["Content-Type"] = "application/json"
     return session
 
 
+def make_async_client(config, max_connections=DEFAULT_MAX_CONNECTIONS):
+    """Create an httpx client whose connection pool is capped at max_connections."""
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+    return httpx.AsyncClient(
+        auth=get_credentials(config),
+        headers={"Content-Type": "application/json"},
+        limits=limits,
+        # Waiting for a free pooled connection is expected under fan-out
+        timeout=httpx.Timeout(30, pool=None),
+    )
+
+
+def job_url(base_url, job_name):
+    return f"{base_url}/job/{'/job/'.join(job_name.split('/'))}"
+
+
+def queue_api_url(job_name, status_code, headers, text):
+    """Return the queue item API URL from a trigger response, or None."""
+    if status_code not in (200, 201):
+        raise RuntimeError(f"Failed to trigger '{job_name}': HTTP {status_code} - {text}")
+
+    queue_url = headers.get("Location")
+    if queue_url:
+        return queue_url.rstrip("/") + "/api/json"
+    return None
+
+
+class PollSchedule:
+    """Exponential backoff with jitter for status polls.
+
+    When the build's expected remaining time is known, polls are spread out
+    to about half of it (capped at ``maximum``), so long builds are not
+    polled every few seconds. ``reset()`` restarts the backoff, e.g. after
+    new log output showed the build is active.
+    """
+
+    def __init__(self, minimum=POLL_MIN, maximum=POLL_MAX, factor=2.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self.attempt = 0
+
+    def reset(self):
+        self.attempt = 0
+
+    def next_delay(self, remaining=None, deadline=None):
+        delay = min(self.maximum, self.minimum * self.factor ** self.attempt)
+        self.attempt += 1
+        if remaining is not None and remaining > 0:
+            delay = min(self.maximum, max(delay, remaining / 2))
+        # Jitter keeps many jobs from polling in lockstep
+        delay *= random.uniform(0.5, 1.0)
+        if deadline:
+            delay = min(delay, max(0.0, deadline - time.time()))
+        return max(delay, 0.0)
+
+
+def estimated_remaining(build):
+    """Seconds until the build is expected to finish, or None if unknown."""
+    estimated = build.get("estimatedDuration")
+    started = build.get("timestamp")
+    if not estimated or estimated < 0 or not started:
+        return None
+    return (started + estimated) / 1000 - time.time()
+
+
+class LogPrinter:
+    """Print progressiveText chunks line by line, prefixed with the job name.
+
+    Chunks may end mid-line; the partial line is held back until the rest
+    arrives. ``offset`` is the ``start`` parameter for the next request.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.offset = 0
+        self._partial = ""
+
+    def feed(self, text, headers):
+        """Print complete lines from a chunk. Returns True if new text arrived."""
+        size = headers.get("X-Text-Size")
+        if size is not None:
+            self.offset = int(size)
+        if not text:
+            return False
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            line = line.rstrip("\r")
+            print(f"  [{self.name}] {line}", flush=True)
+        return True
+
+    def close(self):
+        if self._partial:
+            print(f"  [{self.name}] {self._partial}", flush=True)
+            self._partial = ""
+
+
 def get_crumb(session, base_url):
     """Fetch CSRF crumb if Jenkins requires it."""
     try:
@@ -44,27 +159,20 @@ def get_crumb(session, base_url):
 
 def trigger_job(session, base_url, job_name, parameters, crumb):
     """Trigger a Jenkins job and return the queue item URL."""
-    job_url = f"{base_url}/job/{'/job/'.join(job_name.split('/'))}"
+    url = job_url(base_url, job_name)
 
     if parameters:
-        url = f"{job_url}/buildWithParameters"
-        resp = session.post(url, params=parameters, headers=crumb, timeout=30)
+        resp = session.post(f"{url}/buildWithParameters", params=parameters, headers=crumb, timeout=30)
     else:
-        url = f"{job_url}/build"
-        resp = session.post(url, headers=crumb, timeout=30)
-
-    if resp.status_code not in (200, 201):
-        raise RuntimeError(f"Failed to trigger '{job_name}': HTTP {resp.status_code} - {resp.text}")
+        resp = session.post(f"{url}/build", headers=crumb, timeout=30)
 
-    queue_url = resp.headers.get("Location")
-    if queue_url:
-        return queue_url.rstrip("/") + "/api/json"
-    return None
+    return queue_api_url(job_name, resp.status_code, resp.headers, resp.text)
 
 
 def wait_for_build_start(session, queue_url, timeout):
     """Poll the queue item until Jenkins assigns a build number."""
     deadline = time.time() + timeout if timeout else None
+    schedule = PollSchedule(maximum=QUEUE_POLL_MAX)
     while True:
         if deadline and time.time() > deadline:
             raise TimeoutError("Timed out waiting for build to start")
@@ -79,28 +187,68 @@ def wait_for_build_start(session, queue_url, timeout):
                     raise RuntimeError("Build was cancelled in queue")
         except (requests.RequestException, KeyError):
             pass
-        time.sleep(3)
+        time.sleep(schedule.next_delay(deadline=deadline))
 
 
 def wait_for_build_finish(session, build_url, timeout):
     """Poll the build until it completes. Returns the build result."""
     api_url = build_url.rstrip("/") + "/api/json"
     deadline = time.time() + timeout if timeout else None
+    schedule = PollSchedule()
     while True:
         if deadline and time.time() > deadline:
             raise TimeoutError("Timed out waiting for build to finish")
+        remaining = None
         try:
             resp = session.get(api_url, timeout=10)
             if resp.ok:
                 data = resp.json()
                 if not data.get("building", True):
                     return data.get("result", "UNKNOWN"), data.get("url", build_url)
+                remaining = estimated_remaining(data)
+        except requests.RequestException:
+            pass
+        time.sleep(schedule.next_delay(remaining, deadline))
+
+
+def log_unavailable(name, status):
+    """True if progressiveText answered with a client error (no log, purged, forbidden).
+
+    Polling again would not help, so the stream ends and the caller falls
+    back to waiting for the build result.
+    """
+    if 400 <= status < 500:
+        print(f"  [{name}] Console log unavailable (HTTP {status}), waiting for the result", flush=True)
+        return True
+    return False
+
+
+def stream_build_log(session, build_url, name, timeout):
+    """Print console output as it is produced, until Jenkins reports no more data."""
+    log_url = build_url.rstrip("/") + "/logText/progressiveText"
+    deadline = time.time() + timeout if timeout else None
+    schedule = PollSchedule(maximum=LOG_POLL_MAX)
+    log = LogPrinter(name)
+    while True:
+        if deadline and time.time() > deadline:
+            raise TimeoutError("Timed out waiting for build to finish")
+        try:
+            resp = session.get(log_url, params={"start": log.offset}, timeout=10)
+            if resp.ok:
+                if log.feed(resp.text, resp.headers):
+                    schedule.reset()
+                if resp.headers.get("X-More-Data") != "true":
+                    log.close()
+                    return
+            elif log_unavailable(name, resp.status_code):
+                log.close()
+                return
         except requests.RequestException:
             pass
-        time.sleep(5)
+        time.sleep(schedule.next_delay(deadline=deadline))
 
 
-def run_job(session, base_url, job, crumb, timeout):
+def run_job(session, base_url, job, crumb, timeout, stream_logs=False):
     """Trigger a job, wait for completion, return (name, result, url)."""
     name = job["name"]
     params = job.get("parameters")
@@ -113,16 +261,18 @@ def run_job(session, base_url, job, crumb, timeout):
     build_url = wait_for_build_start(session, queue_url, timeout)
     print(f"  Started:    {name} -> {build_url}")
 
+    if stream_logs:
+        stream_build_log(session, build_url, name, timeout)
     result, url = wait_for_build_finish(session, build_url, timeout)
     status = "OK" if result == "SUCCESS" else "FAIL"
     print(f"  Finished:   {name} -> {result} ({status})")
     return name, result, url
 
 
-def run_sequential(session, base_url, jobs, crumb, timeout, fail_fast):
+def run_sequential(session, base_url, jobs, crumb, timeout, fail_fast, stream_logs=False):
     results = []
     for job in jobs:
-        name, result, url = run_job(session, base_url, job, crumb, timeout)
+        name, result, url = run_job(session, base_url, job, crumb, timeout, stream_logs)
         results.append((name, result, url))
         if fail_fast and result != "SUCCESS":
             print(f"\n  Stopping early: '{name}' did not succeed ({result})")
@@ -130,11 +280,11 @@ def run_sequential(session, base_url, jobs, crumb, timeout, fail_fast):
     return results
 
 
-def run_parallel(session, base_url, jobs, crumb, timeout):
+def run_parallel(session, base_url, jobs, crumb, timeout, max_concurrency=0, stream_logs=False):
     results = []
-    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+    with ThreadPoolExecutor(max_workers=max_concurrency or len(jobs)) as pool:
         futures = {
-            pool.submit(run_job, session, base_url, job, crumb, timeout): job["name"]
+            pool.submit(run_job, session, base_url, job, crumb, timeout, stream_logs): job["name"]
             for job in jobs
         }
         for future in as_completed(futures):
@@ -145,6 +295,298 @@ def run_parallel(session, base_url, jobs, crumb, timeout):
     return results
 
 
+# -- Async engine: every job is a coroutine on one event loop --
+
+async def async_get_crumb(client, base_url):
+    """Fetch CSRF crumb if Jenkins requires it."""
+    try:
+        resp = await client.get(f"{base_url}/crumbIssuer/api/json", timeout=10)
+        if resp.is_success:
+            data = resp.json()
+            return {data["crumbRequestField"]: data["crumb"]}
+    except Exception:
+        pass
+    return {}
+
+
+async def async_trigger_job(client, base_url, job_name, parameters, crumb):
+    """Trigger a Jenkins job and return the queue item URL."""
+    url = job_url(base_url, job_name)
+
+    if parameters:
+        resp = await client.post(f"{url}/buildWithParameters", params=parameters, headers=crumb)
+    else:
+        resp = await client.post(f"{url}/build", headers=crumb)
+
+    return queue_api_url(job_name, resp.status_code, resp.headers, resp.text)
+
+
+async def async_wait_for_build_start(client, queue_url, timeout):
+    """Poll the queue item until Jenkins assigns a build number."""
+    deadline = time.time() + timeout if timeout else None
+    schedule = PollSchedule(maximum=QUEUE_POLL_MAX)
+    while True:
+        if deadline and time.time() > deadline:
+            raise TimeoutError("Timed out waiting for build to start")
+        try:
+            resp = await client.get(queue_url, timeout=10)
+            if resp.is_success:
+                data = resp.json()
+                executable = data.get("executable")
+                if executable:
+                    return executable["url"]
+                if data.get("cancelled"):
+                    raise RuntimeError("Build was cancelled in queue")
+        except (httpx.HTTPError, KeyError):
+            pass
+        await asyncio.sleep(schedule.next_delay(deadline=deadline))
+
+
+async def async_wait_for_build_finish(client, build_url, timeout):
+    """Poll the build until it completes. Returns the build result."""
+    api_url = build_url.rstrip("/") + "/api/json"
+    deadline = time.time() + timeout if timeout else None
+    schedule = PollSchedule()
+    while True:
+        if deadline and time.time() > deadline:
+            raise TimeoutError("Timed out waiting for build to finish")
+        remaining = None
+        try:
+            resp = await client.get(api_url, timeout=10)
+            if resp.is_success:
+                data = resp.json()
+                if not data.get("building", True):
+                    return data.get("result", "UNKNOWN"), data.get("url", build_url)
+                remaining = estimated_remaining(data)
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(schedule.next_delay(remaining, deadline))
+
+
+async def async_stream_build_log(client, build_url, name, timeout):
+    """Print console output as it is produced, until Jenkins reports no more data."""
+    log_url = build_url.rstrip("/") + "/logText/progressiveText"
+    deadline = time.time() + timeout if timeout else None
+    schedule = PollSchedule(maximum=LOG_POLL_MAX)
+    log = LogPrinter(name)
+    while True:
+        if deadline and time.time() > deadline:
+            raise TimeoutError("Timed out waiting for build to finish")
+        try:
+            resp = await client.get(log_url, params={"start": log.offset}, timeout=10)
+            if resp.is_success:
+                if log.feed(resp.text, resp.headers):
+                    schedule.reset()
+                if resp.headers.get("X-More-Data") != "true":
+                    log.close()
+                    return
+            elif log_unavailable(name, resp.status_code):
+                log.close()
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(schedule.next_delay(deadline=deadline))
+
+
+async def async_run_job(client, base_url, job, crumb, timeout, stream_logs=False):
+    """Trigger a job, wait for completion, return (name, result, url)."""
+    name = job["name"]
+    params = job.get("parameters")
+    print(f"  Triggering: {name}")
+
+    queue_url = await async_trigger_job(client, base_url, name, params, crumb)
+    if not queue_url:
+        return name, "TRIGGERED (no queue URL)", ""
+
+    build_url = await async_wait_for_build_start(client, queue_url, timeout)
+    print(f"  Started:    {name} -> {build_url}")
+
+    if stream_logs:
+        await async_stream_build_log(client, build_url, name, timeout)
+    result, url = await async_wait_for_build_finish(client, build_url, timeout)
+    status = "OK" if result == "SUCCESS" else "FAIL"
+    print(f"  Finished:   {name} -> {result} ({status})")
+    return name, result, url
+
+
+async def run_async(client, base_url, jobs, timeout, mode, fail_fast, max_concurrency=0,
+                    stream_logs=False):
+    """Run jobs on one event loop.
+
+    In parallel mode at most ``max_concurrency`` jobs are in flight at once
+    (0 = no limit); HTTP requests are additionally bounded by the client's
+    connection pool.
+    """
+    crumb = await async_get_crumb(client, base_url)
+
+    if mode != "parallel":
+        results = []
+        for job in jobs:
+            name, result, url = await async_run_job(client, base_url, job, crumb, timeout, stream_logs)
+            results.append((name, result, url))
+            if fail_fast and result != "SUCCESS":
+                print(f"\n  Stopping early: '{name}' did not succeed ({result})")
+                break
+        return results
+
+    semaphore = asyncio.Semaphore(max_concurrency or len(jobs))
+
+    async def guarded(job):
+        async with semaphore:
+            try:
+                return await async_run_job(client, base_url, job, crumb, timeout, stream_logs)
+            except Exception as e:
+                return job["name"], f"ERROR: {e}", ""
+
+    results = []
+    for task in asyncio.as_completed([guarded(job) for job in jobs]):
+        results.append(await task)
+    return results
+
+
+# -- Dependency graph (jobs with "needs:") --
+
+def job_needs(job):
+    needs = job.get("needs") or []
+    return [needs] if isinstance(needs, str) else list(needs)
+
+
+def validate_graph(jobs):
+    """Check "needs:" references and cycles. Returns job names in topological order."""
+    names = [job["name"] for job in jobs]
+    if len(set(names)) != len(names):
+        dupes = sorted({n for n in names if names.count(n) > 1})
+        raise ValueError(f"Duplicate job names: {', '.join(dupes)}")
+
+    needs = {job["name"]: job_needs(job) for job in jobs}
+    for name, deps in needs.items():
+        for dep in deps:
+            if dep not in needs:
+                raise ValueError(f"Job '{name}' needs unknown job '{dep}'")
+
+    order = []
+    state = {}  # name -> "visiting" | "done"
+
+    def visit(name, chain):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            cycle = chain[chain.index(name):] + [name]
+            raise ValueError(f"Dependency cycle: {' -> '.join(cycle)}")
+        state[name] = "visiting"
+        for dep in needs[name]:
+            visit(dep, chain + [name])
+        state[name] = "done"
+        order.append(name)
+
+    for name in names:
+        visit(name, [])
+    return order
+
+
+def critical_path(jobs, timings):
+    """Return (names, seconds) of the longest chain of dependent jobs that ran.
+
+    ``timings`` maps job name to (start, end) monotonic timestamps.
+    """
+    needs = {job["name"]: job_needs(job) for job in jobs}
+    best = {}  # name -> (total seconds, chain)
+    for name in validate_graph(jobs):
+        if name not in timings:
+            continue
+        start, end = timings[name]
+        prev = max(
+            (best[dep] for dep in needs[name] if dep in best),
+            key=lambda b: b[0],
+            default=(0.0, []),
+        )
+        best[name] = (prev[0] + (end - start), prev[1] + [name])
+    if not best:
+        return [], 0.0
+    total, chain = max(best.values(), key=lambda b: b[0])
+    return chain, total
+
+
+def format_duration(seconds):
+    minutes, secs = divmod(int(round(seconds)), 60)
+    return f"{minutes}m {secs:02d}s" if minutes else f"{secs}s"
+
+
+async def run_graph(client, base_url, jobs, crumb, timeout, fail_fast,
+                    max_concurrency=0, stream_logs=False, timings=None):
+    """Start each job as soon as all of its "needs" succeeded.
+
+    Only jobs downstream of a failure are skipped; independent branches
+    keep running. With ``fail_fast`` no new jobs at all are started after
+    the first failure; running ones are awaited.
+    """
+    validate_graph(jobs)
+    timings = {} if timings is None else timings
+    by_name = {job["name"]: job for job in jobs}
+    pending = {job["name"]: set(job_needs(job)) for job in jobs}
+    succeeded, failed = set(), set()
+    running = {}  # asyncio.Task -> name
+    results = []
+    limit = max_concurrency or len(jobs)
+
+    async def timed(job):
+        start = time.monotonic()
+        try:
+            return await async_run_job(client, base_url, job, crumb, timeout, stream_logs)
+        except Exception as e:
+            return job["name"], f"ERROR: {e}", ""
+        finally:
+            timings[job["name"]] = (start, time.monotonic())
+
+    def skip(name, reason):
+        del pending[name]
+        failed.add(name)
+        results.append((name, f"SKIPPED ({reason})", ""))
+        print(f"  Skipped:    {name} ({reason})")
+
+    while pending or running:
+        # Propagate failures downstream until nothing else becomes blocked
+        blocked = True
+        while blocked:
+            blocked = False
+            for name in list(pending):
+                bad = sorted(pending[name] & failed)
+                if bad:
+                    skip(name, f"needs {', '.join(bad)}")
+                    blocked = True
+        if fail_fast and failed:
+            for name in list(pending):
+                skip(name, "fail fast")
+
+        for name in [n for n, deps in pending.items() if deps <= succeeded]:
+            if len(running) >= limit:
+                break
+            del pending[name]
+            running[asyncio.ensure_future(timed(by_name[name]))] = name
+
+        if not running:
+            break
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            del running[task]
+            name, result, url = task.result()
+            results.append((name, result, url))
+            (succeeded if result == "SUCCESS" else failed).add(name)
+
+    return results
+
+
+async def run_with_client(config, base_url, jobs, timeout, mode, fail_fast,
+                          max_concurrency, max_connections, stream_logs, timings=None):
+    async with make_async_client(config, max_connections) as client:
+        if mode == "graph":
+            crumb = await async_get_crumb(client, base_url)
+            return await run_graph(client, base_url, jobs, crumb, timeout, fail_fast,
+                                   max_concurrency, stream_logs, timings)
+        return await run_async(client, base_url, jobs, timeout, mode, fail_fast,
+                               max_concurrency, stream_logs)
+
+
 def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     default_jenkins = os.path.join(script_dir, "config.yaml")
@@ -155,6 +597,8 @@ def main():
     parser.add_argument("--jenkins", default=default_jenkins,
                         help="Jenkins credentials config (default: tools/config.yaml)")
     parser.add_argument("--dry-run", action="store_true", help="Print jobs without triggering")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Stop starting jobs after the first failure, also in graph mode")
     args = parser.parse_args()
 
     config = load_yaml(args.config)
@@ -168,39 +612,76 @@ def main():
 
     execution = config.get("execution", {})
     mode = execution.get("mode", "sequential")
-    fail_fast = execution.get("fail_fast", True)
     timeout = execution.get("timeout", 1800)
+    engine = execution.get("engine", "async")
+    max_concurrency = execution.get("max_concurrency", 0)
+    max_connections = execution.get("max_connections", DEFAULT_MAX_CONNECTIONS)
+    stream_logs = execution.get("stream_logs", True)
+
+    if any(job_needs(job) for job in jobs):
+        mode = "graph"
+    if mode == "graph":
+        if engine != "async":
+            sys.exit("Jobs with 'needs' require the async engine")
+        try:
+            validate_graph(jobs)
+        except ValueError as e:
+            sys.exit(f"Invalid job graph: {e}")
+
+    # A failed job already skips its dependents in graph mode; stopping
+    # unrelated branches as well is opt-in there
+    fail_fast = args.fail_fast or execution.get("fail_fast", mode != "graph")
 
     if args.dry_run:
         print("Dry run — jobs that would be triggered:")
         for job in jobs:
             params = job.get("parameters", {})
             params_str = f" (params: {params})" if params else ""
-            print(f"  - {job['name']}{params_str}")
-        print(f"\nMode: {mode} | Fail fast: {fail_fast} | Timeout: {timeout}s")
+            needs = job_needs(job)
+            needs_str = f" (needs: {', '.join(needs)})" if needs else ""
+            print(f"  - {job['name']}{params_str}{needs_str}")
+        print(f"\nMode: {mode} | Engine: {engine} | Fail fast: {fail_fast} | Timeout: {timeout}s")
         return
 
     base_url = config["jenkins"]["url"].rstrip("/")
-    session = make_session(config)
-    crumb = get_crumb(session, base_url)
 
-    print(f"Running {len(jobs)} job(s) in {mode} mode\n")
+    print(f"Running {len(jobs)} job(s) in {mode} mode ({engine} engine)\n")
 
-    if mode == "parallel":
-        results = run_parallel(session, base_url, jobs, crumb, timeout)
+    timings = {}
+    wall_start = time.monotonic()
+    if engine == "async":
+        results = asyncio.run(run_with_client(
+            config, base_url, jobs, timeout, mode, fail_fast,
+            max_concurrency, max_connections, stream_logs, timings,
+        ))
     else:
-        results = run_sequential(session, base_url, jobs, crumb, timeout, fail_fast)
+        session = make_session(config)
+        crumb = get_crumb(session, base_url)
+        if mode == "parallel":
+            results = run_parallel(session, base_url, jobs, crumb, timeout,
+                                   max_concurrency, stream_logs)
+        else:
+            results = run_sequential(session, base_url, jobs, crumb, timeout,
+                                     fail_fast, stream_logs)
 
     print("\n--- Summary ---")
     all_ok = True
     for name, result, url in results:
         marker = "+" if result == "SUCCESS" else "-"
-        print(f"  [{marker}] {name}: {result}")
+        took = f" ({format_duration(timings[name][1] - timings[name][0])})" if name in timings else ""
+        print(f"  [{marker}] {name}: {result}{took}")
         if url:
             print(f"       {url}")
         if result != "SUCCESS":
             all_ok = False
 
+    if mode == "graph":
+        chain, total = critical_path(jobs, timings)
+        wall = time.monotonic() - wall_start
+        if chain:
+            print(f"\nCritical path: {' -> '.join(chain)} ({format_duration(total)})")
+        print(f"Wall time: {format_duration(wall)}")
+
     sys.exit(0 if all_ok else 1)
 
 
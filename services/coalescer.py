@@ -0,0 +1,87 @@
+"""Coalesce concurrent calls into batch calls.
+
+``Coalescer(handler)`` is called like a function of one item from any
+number of threads. Items arriving within ``window`` seconds of the first
+one (up to ``max_batch``) are passed to ``handler`` as one list; each
+caller gets back its own entry of the returned list. An entry that is an
+Exception instance is raised to its caller only, so a batch endpoint can
+fail items individually.
+"""
+import threading
+from concurrent.futures import Future
+
+from services.metrics import REGISTRY
+
+BATCH_SIZE = REGISTRY.histogram(
+    "ctrllord_coalesced_batch_size", "Items per coalesced batch call",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+
+
+class _Batch:
+    __slots__ = ("items", "futures", "full")
+
+    def __init__(self):
+        self.items = []
+        self.futures = []
+        self.full = threading.Event()
+
+
+class Coalescer:
+    """Groups calls arriving within ``window`` seconds into one ``handler`` call.
+
+    The first caller of a batch waits for the window (or until the batch
+    holds ``max_batch`` items) and then runs ``handler(items)`` on its own
+    thread; the others wait for their result. At most ``max_in_flight``
+    handler calls run at once (0: no limit).
+    """
+
+    def __init__(self, handler, window: float = 0.02, max_batch: int = 16, max_in_flight: int = 0):
+        self._handler = handler
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self._slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        self._lock = threading.Lock()
+        self._open = None  # batch still accepting items
+
+    def __call__(self, item):
+        future = Future()
+        with self._lock:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = self._open = _Batch()
+            batch.items.append(item)
+            batch.futures.append(future)
+            if len(batch.items) >= self.max_batch:
+                self._open = None  # the next caller starts a new batch
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._open is batch:
+                    self._open = None
+            self._run(batch)
+        return future.result()
+
+    def _run(self, batch: _Batch):
+        BATCH_SIZE.observe(len(batch.items))
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            results = self._handler(batch.items)
+            if len(results) != len(batch.items):
+                raise ValueError(f"Batch handler returned {len(results)} results for {len(batch.items)} items")
+        except Exception as e:
+            for future in batch.futures:
+                future.set_exception(e)
+            return
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+        for future, result in zip(batch.futures, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
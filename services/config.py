@@ -5,10 +5,16 @@ import shutil
 import logging
 from platformdirs import user_config_path
 
+from services.metrics import REGISTRY
+
 logger = logging.getLogger(__name__)
 
+CONFIG_LOAD = REGISTRY.histogram("ctrllord_config_load_seconds", "Time to read and validate config.toml")
+
 CONFIG_DIR = user_config_path(appname="CtrlLord", appauthor="CtrlLord")
 CONFIG_PATH = os.path.join(CONFIG_DIR, "config/config.toml")
+LOG_PATH = "/tmp/ctrllord.log"
+LOCK_FILE = "/tmp/ctrllord.lock"  # holds the PID of the running app
 
 REQUIRED_SECTIONS = {
     "jira": ["base_url", "project_key"],
@@ -29,11 +35,10 @@ def get_resource_path(rel_path):
 
 def setup_logging():
     """Configure logging with file and console handlers."""
-    log_path = "/tmp/ctrllord.log"
     root = logging.getLogger()
     root.setLevel(logging.DEBUG)
 
-    file_handler = logging.FileHandler(log_path, mode="a")
+    file_handler = logging.FileHandler(LOG_PATH, mode="a")
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(
         "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
@@ -63,12 +68,13 @@ def validate_config(config):
 
 
 def load_config():
-    if not os.path.exists(CONFIG_PATH):
-        os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-        default_config_path = get_resource_path("config/config.toml")
-        logger.info("Copying default config from %s", default_config_path)
-        shutil.copy(default_config_path, CONFIG_PATH)
-    with open(CONFIG_PATH, "r") as f:
-        config = toml.load(f)
+    with CONFIG_LOAD.time():
+        if not os.path.exists(CONFIG_PATH):
+            os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
+            default_config_path = get_resource_path("config/config.toml")
+            logger.info("Copying default config from %s", default_config_path)
+            shutil.copy(default_config_path, CONFIG_PATH)
+        with open(CONFIG_PATH, "r") as f:
+            config = toml.load(f)
     validate_config(config)
     return config
@@ -0,0 +1,134 @@
+import logging
+import time
+
+from services.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+DOUBLE_TAP_INTERVAL = 0.3  # seconds
+
+# Upper bounds (seconds) of the callback latency histogram buckets
+LATENCY_BUCKETS = (
+    0.000_005, 0.000_01, 0.000_025, 0.000_05, 0.000_1,
+    0.000_25, 0.000_5, 0.001, 0.005, 0.01, 0.05,
+)
+
+HOTKEY_LATENCY = REGISTRY.histogram(
+    "ctrllord_hotkey_callback_seconds", "Time spent in global key listener callbacks",
+    buckets=LATENCY_BUCKETS,
+)
+HOTKEY_DROPPED = REGISTRY.counter(
+    "ctrllord_hotkey_dropped_events_total", "Key events whose listener callback raised",
+)
+
+
+class DoubleTapDetector:
+    """Calls ``on_trigger`` when a modifier is tapped twice on its own.
+
+    Keys are opaque hashables, so the detector can be driven by pynput keys
+    or by synthetic event streams in tests. ``on_press`` runs for every key
+    press system-wide and does at most one set lookup.
+    """
+
+    __slots__ = ("_modifiers", "_on_trigger", "_interval", "_clock",
+                 "_last_release", "_other_pressed")
+
+    def __init__(self, modifiers, on_trigger, interval=DOUBLE_TAP_INTERVAL, clock=time.monotonic):
+        self._modifiers = frozenset(modifiers)
+        self._on_trigger = on_trigger
+        self._interval = interval
+        self._clock = clock
+        self._last_release = 0.0
+        self._other_pressed = False
+
+    def on_press(self, key):
+        # Already disqualified until the modifier is released: nothing to check
+        if self._other_pressed:
+            return
+        if key not in self._modifiers:
+            self._other_pressed = True
+
+    def on_release(self, key):
+        if key not in self._modifiers:
+            return
+        now = self._clock()
+        if not self._other_pressed and (now - self._last_release) < self._interval:
+            self._last_release = 0.0
+            self._on_trigger()
+        else:
+            self._last_release = now
+        self._other_pressed = False
+
+
+class ComboDetector:
+    """Calls ``on_trigger`` when every key of a combination is held.
+
+    Mirrors pynput's ``HotKey`` but rejects plain typing early: while no
+    combination key is held, events whose raw key is not in ``gate`` return
+    before ``canonical`` is called. ``gate`` should contain the raw variants
+    of the combination keys (e.g. left/right modifiers).
+    """
+
+    __slots__ = ("_keys", "_gate", "_on_trigger", "_state", "canonical")
+
+    def __init__(self, keys, gate, on_trigger, canonical=None):
+        self._keys = frozenset(keys)
+        self._gate = frozenset(gate) | self._keys
+        self._on_trigger = on_trigger
+        self._state = set()
+        self.canonical = canonical or (lambda key: key)
+
+    def on_press(self, key):
+        if not self._state and key not in self._gate:
+            return
+        key = self.canonical(key)
+        if key in self._keys and key not in self._state:
+            self._state.add(key)
+            if len(self._state) == len(self._keys):
+                self._on_trigger()
+
+    def on_release(self, key):
+        if not self._state:
+            return
+        self._state.discard(self.canonical(key))
+
+
+class ListenerMetrics:
+    """Times listener callbacks into the ``HOTKEY_LATENCY`` histogram.
+
+    A failing callback is counted in ``HOTKEY_DROPPED``. Both are in the
+    shared registry, so they show up at /metrics and in Diagnostics.
+    """
+
+    def __init__(self, latency=HOTKEY_LATENCY, dropped=HOTKEY_DROPPED):
+        self.latency = latency
+        self.dropped = dropped
+
+    def wrap(self, callback):
+        """Return ``callback`` timed into the latency histogram.
+
+        An exception would stop the pynput listener, so it is logged and
+        counted as a dropped event instead.
+        """
+        perf_counter = time.perf_counter
+        observe = self.latency.observe
+
+        def timed(key):
+            start = perf_counter()
+            try:
+                callback(key)
+            except Exception:
+                self.dropped.inc()
+                logger.exception("Hotkey callback failed")
+            observe(perf_counter() - start)
+
+        return timed
+
+    def summary(self) -> str:
+        h = self.latency
+        mean = h.sum / h.count if h.count else 0.0
+        return (
+            f"{h.count} events, {self.dropped.value} dropped, "
+            f"mean {mean * 1e6:.1f}us, p50 <= {h.percentile(0.5) * 1e6:.0f}us, "
+            f"p99 <= {h.percentile(0.99) * 1e6:.0f}us, max {h.max * 1e6:.0f}us"
+        )
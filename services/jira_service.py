@@ -1,10 +1,12 @@
 # jira_service.py
 import random
-import time
 import logging
 from atlassian import Jira
 
+from services import tracing
 from services.config import load_config
+from services.simulator import Simulator
+from services.task_record import TaskRecord
 from services.task_service import TaskService
 
 logger = logging.getLogger(__name__)
@@ -14,23 +16,23 @@ class JiraService(TaskService):
     def __init__(self):
         self.reload_config()
 
-    def generate_mock_task(self, summary: str, description: str, issue_type: str, component: str) -> dict:
+    def generate_mock_task(self, summary: str, description: str, issue_type: str, component: str) -> TaskRecord:
         key = f"MOCK-{random.randint(100, 999)}"
-        return {
-            "key": key,
-            "summary": summary,
-            "description": description,
-            "type": issue_type,
-            "component": component,
-            "url": f"{self.base_url}/browse/{key}"
-        }
+        return TaskRecord(
+            key=key,
+            summary=summary,
+            description=description,
+            type=issue_type,
+            component=component,
+            url=f"{self.base_url}/browse/{key}",
+        )
 
-    def submit_task(self, summary: str, description: str, issue_type: str, component: str) -> dict:
+    def submit_task(self, summary: str, description: str, issue_type: str, component: str) -> TaskRecord:
         if self.mode == "mock":
-            time.sleep(0.5)  # simulate network delay
-            result = self.generate_mock_task(summary, description, issue_type, component)
-            self.save_task_json(result)
-            return result
+            self.simulator.call()  # network delay and injected failures
+            record = self.generate_mock_task(summary, description, issue_type, component)
+            self.save_task_json(record)
+            return record
 
         if not self.client:
             self.client = Jira(
@@ -40,28 +42,29 @@ class JiraService(TaskService):
             )
         logger.info("Creating issue in project %s", self.project_key)
         try:
-            issue = self.client.create_issue(fields={
-                "project": {"key": self.project_key},
-                "summary": summary,
-                "description": description,
-                "issuetype": {"name": issue_type},
-                "components": [{"name": component}] if component else []
-            })
+            with tracing.span("jira.create_issue", project=self.project_key):
+                issue = self.client.create_issue(fields={
+                    "project": {"key": self.project_key},
+                    "summary": summary,
+                    "description": description,
+                    "issuetype": {"name": issue_type},
+                    "components": [{"name": component}] if component else []
+                })
         except Exception as e:
             logger.error("Failed to create Jira issue: %s (type=%s, args=%s)", e, type(e).__name__, e.args)
             raise
         issue_key = issue.get("key", "UNKNOWN")
         logger.info("Created issue %s", issue_key)
-        result = {
-            "key": issue_key,
-            "summary": summary,
-            "description": description,
-            "type": issue_type,
-            "component": component,
-            "url": f"{self.base_url.rstrip('/')}/browse/{issue_key}"
-        }
-        self.save_task_json(result)
-        return result
+        record = TaskRecord(
+            key=issue_key,
+            summary=summary,
+            description=description,
+            type=issue_type,
+            component=component,
+            url=f"{self.base_url.rstrip('/')}/browse/{issue_key}",
+        )
+        self.save_task_json(record)
+        return record
 
     def reload_config(self, config=None):
         logger.info("JiraService config is reloading.")
@@ -73,5 +76,6 @@ class JiraService(TaskService):
         self.username = cfg.get("username", "")
         self.token = cfg.get("token", "")
         self.client = None
+        self.simulator = Simulator(cfg.get("mock"), default_latency_ms=500)
         task_cfg = self.config.get("task", {})
         self.data_dir = task_cfg.get("data_dir", "")
@@ -0,0 +1,30 @@
+import os
+import logging
+from concurrent.futures import Future
+
+from services.json_service import JsonService
+from services.task_journal import open_journal
+from services.task_record import TaskRecord
+from services.task_writer import get_writer
+
+logger = logging.getLogger(__name__)
+
+
+class JournalService(JsonService):
+    """Local backend that appends tasks to ``data_dir/tasks.jsonl``.
+
+    Same keys and records as ``JsonService``, but every task is one compact
+    line in a single append-only journal instead of a file of its own.
+    """
+
+    def task_path(self, key: str, created_at: str) -> str:
+        return open_journal(self.data_dir).locator(key)
+
+    def save_task_json(self, record: TaskRecord) -> Future:
+        """Queue the task to be appended to the journal of data_dir."""
+        data_dir = os.path.expanduser(self.data_dir)
+        journal = open_journal(data_dir)
+        locator = journal.locator(record.key)
+        future = get_writer().append_journal(journal, record, self._durability())
+        future.add_done_callback(self._saved_callback(data_dir, record, locator))
+        return future
@@ -1,52 +1,85 @@
 import os
 import logging
+from datetime import datetime, timezone
 
 from services.config import load_config
-from services.task_service import TaskService
+from services.task_journal import journal_path, open_journal
+from services.task_ids import TaskIdAllocator
+from services.task_layout import iter_task_paths
+from services.task_record import TaskRecord
+from services.task_service import BatchSubmitError, TaskService
 
 logger = logging.getLogger(__name__)
 
 
+def _task_number(key: str) -> int:
+    if key.startswith("TASK-"):
+        try:
+            return int(key[len("TASK-"):])
+        except ValueError:
+            pass
+    return 0
+
+
+def _scan_max_task_id(data_dir: str) -> int:
+    """Return the highest TASK-N found anywhere under data_dir (0 if none)."""
+    keys = [os.path.basename(path)[:-len(".json")] for path in iter_task_paths(data_dir)]
+    if os.path.exists(journal_path(data_dir)):
+        keys.extend(open_journal(data_dir).keys())
+    return max(map(_task_number, keys), default=0)
+
+
 def _next_task_id(data_dir: str) -> int:
-    """Return the next sequential task ID based on existing files in data_dir."""
-    if not os.path.isdir(data_dir):
-        return 1
-    max_id = 0
-    for name in os.listdir(data_dir):
-        if name.startswith("TASK-") and name.endswith(".json"):
-            try:
-                num = int(name[len("TASK-"):-len(".json")])
-                max_id = max(max_id, num)
-            except ValueError:
-                continue
-    return max_id + 1
+    """Allocate the next sequential task ID for data_dir."""
+    return TaskIdAllocator(data_dir, seed=_scan_max_task_id).allocate()
 
 
 class JsonService(TaskService):
     def __init__(self):
         self.reload_config()
 
-    def submit_task(self, summary: str, description: str, issue_type: str, component: str) -> dict:
-        data_dir = os.path.expanduser(self.data_dir)
-        os.makedirs(data_dir, exist_ok=True)
+    def submit_task(self, summary: str, description: str, issue_type: str, component: str) -> TaskRecord:
+        return self._create_task(self._ids.allocate(), summary, description, issue_type, component)
+
+    def submit_tasks(self, tasks) -> list[TaskRecord]:
+        """Submit several tasks, reserving their IDs as one consecutive block.
+
+        Stops at the first failure with a BatchSubmitError carrying the
+        records created so far.
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return []
+        ids = self._ids.reserve(len(tasks))
+        records = []
+        for task_id, task in zip(ids, tasks):
+            try:
+                records.append(self._create_task(task_id, *task))
+            except Exception as e:
+                raise BatchSubmitError(records, e) from e
+        return records
 
-        task_id = _next_task_id(data_dir)
+    def _create_task(self, task_id: int, summary: str, description: str,
+                     issue_type: str, component: str) -> TaskRecord:
         key = f"TASK-{task_id}"
-        file_path = os.path.join(data_dir, f"{key}.json")
-
-        result = {
-            "key": key,
-            "summary": summary,
-            "description": description,
-            "type": issue_type,
-            "component": component,
-            "url": file_path,
-        }
-        self.save_task_json(result)
-        return result
+        created_at = datetime.now(timezone.utc).isoformat()
+        record = TaskRecord(
+            key=key,
+            summary=summary,
+            description=description,
+            type=issue_type,
+            component=component,
+            url=self.task_path(key, created_at),
+            created_at=created_at,
+        )
+        self.save_task_json(record)
+        return record
 
     def reload_config(self, config=None):
         logger.info("JsonService config is reloading.")
         self.config = config or load_config()
         task_cfg = self.config.get("task", {})
         self.data_dir = task_cfg.get("data_dir", "~/.config/CtrlLord/data")
+        self._ids = TaskIdAllocator(
+            self.data_dir, seed=_scan_max_task_id, durable=self._durability() != "none",
+        )
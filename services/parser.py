@@ -1,4 +1,9 @@
 # services/parser.py
+import re
+
+# "- ", "* ", "+ ", "• ", "1. ", "2) " and "[ ] " / "- [x] " checkboxes
+BULLET = re.compile(r"^(?:[-*+•]\s+|\d+[.)]\s+)?(?:\[[ xX]?\]\s+)?")
+
 
 def parse_task_text(text: str) -> tuple[str, str]:
     """
@@ -24,3 +29,20 @@ def parse_task_text(text: str) -> tuple[str, str]:
 
     description = "\n".join(description_lines).strip()
     return summary, description
+
+
+def split_batch(text: str) -> list[str]:
+    """
+    Splits pasted action items into one task summary per item.
+
+    - Every non-empty line is an item; "•" also separates items within a line.
+    - Bullet, numbering and checkbox markers are stripped.
+    - Headings such as "Action items:" are skipped.
+    """
+    items = []
+    for line in text.splitlines():
+        for part in line.split("•"):
+            item = BULLET.sub("", part.strip()).strip()
+            if item and not item.endswith(":"):
+                items.append(item)
+    return items
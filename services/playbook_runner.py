@@ -1,11 +1,23 @@
 import os
 import subprocess
 import logging
+import time
 
 from PySide6.QtCore import QThread, Signal
 
+from services.metrics import REGISTRY
+
 logger = logging.getLogger(__name__)
 
+STEP_DURATION = REGISTRY.histogram(
+    "ctrllord_playbook_step_seconds", "Duration of playbook steps",
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600),
+)
+LOG_LINES = REGISTRY.counter("ctrllord_playbook_log_lines_total", "Output lines read from playbook steps")
+LINES_PER_SECOND = REGISTRY.gauge(
+    "ctrllord_playbook_lines_per_second", "Output rate of the last finished playbook step",
+)
+
 
 class PlaybookRunner(QThread):
     step_started = Signal(int, str)     # step index, step name
@@ -34,6 +46,8 @@ class PlaybookRunner(QThread):
                 return
 
             self.step_started.emit(i, step["name"])
+            start = time.perf_counter()
+            lines = 0
 
             try:
                 self._process = subprocess.Popen(
@@ -52,6 +66,7 @@ class PlaybookRunner(QThread):
                         self.playbook_finished.emit(False)
                         return
                     self.log_line.emit(line.rstrip("\n"))
+                    lines += 1
 
                 self._process.wait()
                 success = self._process.returncode == 0
@@ -62,6 +77,11 @@ class PlaybookRunner(QThread):
                 success = False
 
             self._process = None
+            elapsed = time.perf_counter() - start
+            STEP_DURATION.observe(elapsed)
+            LOG_LINES.inc(lines)
+            if elapsed > 0:
+                LINES_PER_SECOND.set(lines / elapsed)
             self.step_finished.emit(i, success)
 
             if not success:
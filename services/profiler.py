@@ -0,0 +1,186 @@
+"""Sampling profiler for the running app.
+
+``profile(duration)`` samples the Python stack of every thread (GUI,
+hotkey listener, task queue worker, playbook runners) every few
+milliseconds and tracks allocations with tracemalloc, then writes next to
+the log file:
+
+- ``ctrllord-profile-<time>.collapsed``: one ``thread;frame;...;frame count``
+  line per distinct stack, for flamegraph.pl, speedscope or inferno
+- ``ctrllord-profile-<time>.tracemalloc.txt``: the top allocation sites
+  made while profiling
+
+Start it from the tray menu, or from a shell while the app is running::
+
+    python -m services.profiler --duration 30
+
+which asks the app (PID in its lock file) to profile itself via SIGUSR1.
+"""
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+from services.config import LOCK_FILE, LOG_PATH
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DURATION = 30
+SAMPLE_INTERVAL = 0.01  # seconds; ~100 Hz keeps the overhead around 1%
+TOP_ALLOCATIONS = 50
+TRACEMALLOC_FRAMES = 10
+
+# Options for the next SIGUSR1-triggered profile, written by the CLI
+REQUEST_FILE = "/tmp/ctrllord.profile-request"
+
+_running = threading.Lock()
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)})"
+
+
+def _thread_name(ident: int, frame, names: dict) -> str:
+    name = names.get(ident)
+    if name:
+        return name
+    # QThreads are not known to the threading module; name them by their run()
+    while frame.f_back is not None:
+        frame = frame.f_back
+    return frame.f_code.co_qualname
+
+
+def sample_stacks(duration: float, interval: float = SAMPLE_INTERVAL) -> Counter:
+    """Sample every other thread's stack for ``duration`` seconds.
+
+    Returns a Counter of collapsed stacks (``thread;outer;...;inner``).
+    """
+    own = threading.get_ident()
+    stacks = Counter()
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            leaf = frame
+            frames = []
+            while frame is not None:
+                frames.append(_frame_name(frame))
+                frame = frame.f_back
+            frames.append(_thread_name(ident, leaf, names))
+            stacks[";".join(reversed(frames))] += 1
+        time.sleep(interval)
+    return stacks
+
+
+def _format_allocations(snapshot: tracemalloc.Snapshot, limit: int = TOP_ALLOCATIONS) -> str:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    stats = snapshot.statistics("traceback")
+    total = sum(stat.size for stat in stats)
+    lines = [f"Allocated while profiling: {total / 1024:.1f} KiB in {len(stats)} sites", ""]
+    for index, stat in enumerate(stats[:limit], 1):
+        lines.append(f"#{index}: {stat.size / 1024:.1f} KiB in {stat.count} blocks")
+        lines.extend(f"    {line}" for line in stat.traceback.format())
+    return "\n".join(lines) + "\n"
+
+
+def profile(duration: float = DEFAULT_DURATION, out_dir: str | None = None,
+            interval: float = SAMPLE_INTERVAL) -> tuple[str, str]:
+    """Profile all threads for ``duration`` seconds; return the two output paths.
+
+    Blocks the calling thread, so run it from a background thread. Raises
+    RuntimeError if another profile is already running.
+    """
+    if not _running.acquire(blocking=False):
+        raise RuntimeError("A profile is already running")
+    try:
+        out_dir = out_dir or os.path.dirname(LOG_PATH)
+        base = os.path.join(out_dir, f"ctrllord-profile-{datetime.now():%Y%m%d-%H%M%S}")
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        try:
+            stacks = sample_stacks(duration, interval)
+            allocations = _format_allocations(tracemalloc.take_snapshot())
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        collapsed_path = base + ".collapsed"
+        with open(collapsed_path, "w") as f:
+            f.writelines(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        allocations_path = base + ".tracemalloc.txt"
+        with open(allocations_path, "w") as f:
+            f.write(allocations)
+    finally:
+        _running.release()
+    logger.info("Profile of %ss written to %s and %s", duration, collapsed_path, allocations_path)
+    return collapsed_path, allocations_path
+
+
+def start_profile(duration: float = DEFAULT_DURATION, on_done=None,
+                  out_dir: str | None = None) -> threading.Thread:
+    """Run ``profile`` on a background thread; ``on_done(paths or exception)`` follows."""
+    def run():
+        try:
+            result = profile(duration, out_dir)
+        except Exception as e:
+            logger.error("Profiling failed: %s", e)
+            result = e
+        if on_done is not None:
+            on_done(result)
+
+    thread = threading.Thread(target=run, name="profiler", daemon=True)
+    thread.start()
+    return thread
+
+
+def read_request() -> float:
+    """Return the duration requested by the CLI for the next profile, and clear it."""
+    try:
+        with open(REQUEST_FILE) as f:
+            duration = float(json.load(f)["duration"])
+        os.remove(REQUEST_FILE)
+        return duration
+    except (OSError, ValueError, KeyError, TypeError):
+        return DEFAULT_DURATION
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ask the running app to profile itself")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help=f"Seconds to sample (default: {DEFAULT_DURATION})")
+    args = parser.parse_args(argv)
+
+    try:
+        with open(LOCK_FILE) as f:
+            pid = int(f.read().strip())
+    except (OSError, ValueError):
+        print(f"CtrlLord does not seem to be running (no PID in {LOCK_FILE})", file=sys.stderr)
+        return 1
+    with open(REQUEST_FILE, "w") as f:
+        json.dump({"duration": args.duration}, f)
+    try:
+        os.kill(pid, signal.SIGUSR1)
+    except ProcessLookupError:
+        print(f"CtrlLord (PID {pid}) is not running", file=sys.stderr)
+        return 1
+    print(f"Profiling PID {pid} for {args.duration:g}s; "
+          f"results go to {os.path.dirname(LOG_PATH)}/ctrllord-profile-*")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Prompt templates, read and compiled once per file version.
+
+A template is a text file with ``{{input}}`` placeholders. ``TemplateCache``
+keeps one compiled ``PromptTemplate`` per path and reloads it only when
+the file's mtime or size changes, so rendering a prompt costs one
+``os.stat`` instead of a read and a scan of the whole file.
+
+Everything before the first placeholder is the template's static
+``prefix``; it is the same for every input, and ``prefix_hash``
+identifies it, so LLM servers with prefix caching can reuse the KV state
+computed for it across requests.
+"""
+import hashlib
+import os
+import threading
+
+from services.metrics import REGISTRY
+
+PLACEHOLDER = "{{input}}"
+
+TEMPLATE_LOADS = REGISTRY.counter(
+    "ctrllord_prompt_template_loads_total", "Prompt template files read from disk",
+)
+
+
+class PromptTemplate:
+    __slots__ = ("path", "version", "parts", "prefix", "prefix_hash")
+
+    def __init__(self, path: str, text: str, version: tuple = ()):
+        self.path = path
+        self.version = version  # (mtime_ns, size) the text was read at
+        self.parts = text.split(PLACEHOLDER)
+        self.prefix = self.parts[0]
+        self.prefix_hash = hashlib.sha256(self.prefix.encode("utf-8")).hexdigest()
+
+    def render(self, text: str) -> str:
+        """Return the template with every placeholder replaced by ``text``."""
+        return text.join(self.parts)
+
+
+class TemplateCache:
+    """Compiled templates by path, reloaded when the file changes."""
+
+    def __init__(self):
+        self._templates = {}  # path -> PromptTemplate
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> PromptTemplate:
+        """Return the template at ``path``; raises OSError if it cannot be read."""
+        st = os.stat(path)
+        version = (st.st_mtime_ns, st.st_size)
+        template = self._templates.get(path)
+        if template is not None and template.version == version:
+            return template
+        with self._lock:
+            template = self._templates.get(path)
+            if template is None or template.version != version:
+                with open(path, "r", encoding="utf-8") as f:
+                    template = PromptTemplate(path, f.read(), version)
+                TEMPLATE_LOADS.inc()
+                self._templates[path] = template
+        return template
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
@@ -0,0 +1,120 @@
+"""Simulated latency and failures for the mock Jira and LLM modes.
+
+Configured per service in a ``mock`` table (``[jira.mock]``, ``[llm.mock]``)::
+
+    latency = "lognormal"      # "fixed", "normal" or "lognormal"
+    latency_ms = 300           # fixed value, mean (normal) or median (lognormal)
+    stddev_ms = 50             # normal only
+    p99_ms = 2000              # lognormal only: 99th percentile of the tail
+    timeout_ms = 1500          # calls slower than this fail with a timeout (0: none)
+    max_qps = 5                # throughput cap; callers wait for a slot (0: none)
+    errors = { http = 0.02, connection = 0.01, timeout = 0.005 }  # rate per call
+    seed = 42                  # optional, for reproducible runs
+"""
+import logging
+import math
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DISTRIBUTIONS = ("fixed", "normal", "lognormal")
+ERROR_TYPES = ("http", "connection", "timeout")
+Z_99 = 2.326  # standard normal 99th percentile
+
+
+class SimulatedError(Exception):
+    """Base class of the failures injected by Simulator."""
+
+
+class SimulatedHTTPError(SimulatedError):
+    def __init__(self, status: int = 503):
+        super().__init__(f"Simulated HTTP {status}")
+        self.status = status
+
+
+class SimulatedConnectionError(SimulatedError, ConnectionError):
+    pass
+
+
+class SimulatedTimeout(SimulatedError, TimeoutError):
+    pass
+
+
+class Simulator:
+    """Delays and fails calls following a ``mock`` config table.
+
+    ``call()`` waits for a throughput slot, sleeps for a sampled latency
+    and then either returns or raises a ``SimulatedError``. Thread-safe,
+    so several workers can share one simulator and its ``max_qps`` cap.
+    """
+
+    def __init__(self, cfg: dict | None = None, default_latency_ms: float = 0,
+                 sleep=time.sleep, clock=time.monotonic):
+        cfg = cfg or {}
+        self.distribution = cfg.get("latency", "fixed")
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.distribution!r}. "
+                             f"Choose from: {', '.join(DISTRIBUTIONS)}")
+        self.latency = cfg.get("latency_ms", default_latency_ms) / 1000
+        self.stddev = cfg.get("stddev_ms", 0) / 1000
+        p99 = cfg.get("p99_ms", 0) / 1000
+        # lognormal: median = e^mu, p99 = e^(mu + Z_99 * sigma)
+        self._sigma = math.log(p99 / self.latency) / Z_99 if p99 > self.latency > 0 else 0.0
+        self.timeout = cfg.get("timeout_ms", 0) / 1000
+        self.max_qps = cfg.get("max_qps", 0)
+        self.errors = {name: float(rate) for name, rate in cfg.get("errors", {}).items()}
+        unknown = set(self.errors) - set(ERROR_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown simulated error type(s): {', '.join(sorted(unknown))}. "
+                             f"Choose from: {', '.join(ERROR_TYPES)}")
+
+        self._rng = random.Random(cfg.get("seed"))
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def sample_latency(self) -> float:
+        """Return one latency in seconds from the configured distribution."""
+        with self._lock:
+            if self.distribution == "normal":
+                return max(0.0, self._rng.gauss(self.latency, self.stddev))
+            if self.distribution == "lognormal" and self.latency > 0:
+                return self._rng.lognormvariate(math.log(self.latency), self._sigma)
+            return self.latency
+
+    def _sample_error(self) -> str | None:
+        with self._lock:
+            roll = self._rng.random()
+        for name in ERROR_TYPES:
+            rate = self.errors.get(name, 0.0)
+            if roll < rate:
+                return name
+            roll -= rate
+        return None
+
+    def _wait_for_slot(self):
+        if not self.max_qps:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1 / self.max_qps
+        if slot > now:
+            self._sleep(slot - now)
+
+    def call(self):
+        """Simulate one request: wait, sleep and possibly raise SimulatedError."""
+        self._wait_for_slot()
+        latency = self.sample_latency()
+        error = self._sample_error()
+        if error == "timeout" or (self.timeout and latency > self.timeout):
+            self._sleep(self.timeout or latency)
+            raise SimulatedTimeout(f"Simulated timeout after {(self.timeout or latency) * 1000:.0f} ms")
+        self._sleep(latency)
+        if error == "http":
+            raise SimulatedHTTPError(503)
+        if error == "connection":
+            raise SimulatedConnectionError("Simulated connection reset")
@@ -1,30 +1,49 @@
 # jira_generator_service.py
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from services.config import load_config, get_resource_path
+from services import tracing
+from services.coalescer import Coalescer
+from services.metrics import REGISTRY
+from services.prompt_templates import TemplateCache
+from services.simulator import SimulatedError, Simulator
 import httpx
 
 logger = logging.getLogger(__name__)
 
+LLM_LATENCY = REGISTRY.histogram("ctrllord_llm_request_seconds", "Duration of LLM endpoint calls")
+LLM_FALLBACKS = REGISTRY.counter(
+    "ctrllord_llm_fallbacks_total", "Task payloads replaced by a fallback after an LLM error",
+)
+
 REQUIRED_LLM_FIELDS = ("summary", "description", "type")
+DEFAULT_CONCURRENCY = 4
+DEFAULT_BATCH_WINDOW_MS = 20
+DEFAULT_MAX_BATCH_SIZE = 16
 
 
 class TaskGeneratorService:
     def __init__(self):
         self.reload_config()
 
-    def build_task_payload(self, summary: str) -> dict:
+    def build_task_payload(self, summary: str, issue_type: str | None = None, template: str | None = None) -> dict:
         if self.mode in ("mock"):
+            try:
+                self.simulator.call()
+            except SimulatedError as e:
+                logger.error("LLM call failed: %s", e)
+                return self._fallback(summary, str(e))
             return {
                 "summary": f"generated {summary}",
                 "description": "# [Concise, action-oriented summary]\n\n## Description\nBrief explanation of the task. What needs to be done and why?\n\n## Context\nWhat triggered this task? Is it related to a bug, a feature request, a customer need, or a refactor?\n\n## Acceptance Criteria / Definition of Done\n- [ ] Clear and testable success condition 1\n- [ ] Outcome or deliverable 2\n- [ ] Optional edge cases or error handling\n\n## Links & References\n- [Jira ticket / Design doc / PRD](https://)\n- Related tickets: ABC-123, XYZ-456",
                 "type": "Bug"
             }
 
-        # Load prompt template and inject summary
+        # Load prompt template (cached until the file changes) and inject summary
         try:
-            with open(self.prompt_path, "r", encoding="utf-8") as f:
-                template = f.read()
-            prompt = template.replace("{{input}}", summary)
+            prompt_template = self.prompt_template(issue_type, template or self.template)
+            prompt = prompt_template.render(summary)
         except Exception as e:
             logger.error("Failed to load prompt template: %s", e)
             return {
@@ -33,16 +52,15 @@ class TaskGeneratorService:
                 "type": "Task"
             }
 
-        # Live mode: call LLM
-        url = self.base_url.rstrip("/") + self.endpoint
+        # Live mode: call LLM, batched with concurrent calls if configured
+        body = {"prompt": prompt}
+        if self.send_prefix_hash:
+            body["prefix_hash"] = prompt_template.prefix_hash
         try:
-            response = httpx.post(
-                url,
-                json={"prompt": prompt},
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            data = response.json()
+            if self._coalescer is not None:
+                data = self._coalescer(body)
+            else:
+                data = self._post(self.endpoint, body)
         except httpx.HTTPStatusError as e:
             logger.error("LLM HTTP error: %s", e)
             return self._fallback(summary, f"LLM returned HTTP {e.response.status_code}")
@@ -62,6 +80,88 @@ class TaskGeneratorService:
 
         return data
 
+    def prompt_template(self, issue_type: str | None = None, name: str = "default"):
+        """Return the compiled template for ``issue_type`` and template ``name``.
+
+        ``[llm.templates]`` maps names to files, and an issue type's own
+        table (or a single file for it) overrides them for that type.
+        Unknown names fall back to ``prompt_path``.
+        """
+        by_type = self.prompt_templates.get(issue_type) if issue_type else None
+        if isinstance(by_type, str):
+            by_type = {"default": by_type}
+        path = (by_type or {}).get(name)
+        if path is None:
+            path = self.prompt_templates.get(name)
+        if not isinstance(path, str):
+            path = self.prompt_path
+        return self.templates.get(path)
+
+    def has_issue_type_template(self, issue_type: str) -> bool:
+        """True if ``[llm.templates]`` has a template of its own for ``issue_type``."""
+        return issue_type in self.prompt_templates and issue_type not in ("", "default")
+
+    def _post(self, endpoint: str, body: dict, **span_attributes):
+        url = self.base_url.rstrip("/") + endpoint
+        with LLM_LATENCY.time(), tracing.span("llm.request", url=url, **span_attributes):
+            response = httpx.post(url, json=body, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+
+    def _post_batch(self, bodies: list[dict]) -> list:
+        """Send the bodies' prompts in one request; a failed item is returned as an exception.
+
+        The batch endpoint takes ``{"prompts": [...]}`` (plus
+        ``"prefix_hashes"`` with ``send_prefix_hash``) and answers with
+        ``{"tasks": [...]}`` (or the bare list), one task object per prompt
+        in the same order. An item that is not an object or carries an
+        ``"error"`` fails on its own.
+        """
+        prompts = [body["prompt"] for body in bodies]
+        batch = {"prompts": prompts}
+        if self.send_prefix_hash:
+            batch["prefix_hashes"] = [body["prefix_hash"] for body in bodies]
+        data = self._post(self.batch_endpoint, batch, batch_size=len(prompts))
+        tasks = data.get("tasks", []) if isinstance(data, dict) else data
+        if not isinstance(tasks, list):
+            raise ValueError("Batch response has no task list")
+        results = []
+        for index in range(len(prompts)):
+            task = tasks[index] if index < len(tasks) else None
+            if not isinstance(task, dict):
+                results.append(ValueError(f"No task for prompt {index} in batch response"))
+            elif task.get("error"):
+                results.append(RuntimeError(f"LLM error: {task['error']}"))
+            else:
+                results.append(task)
+        return results
+
+    def build_task_payloads(self, summaries, on_payload=None) -> list[dict]:
+        """Generate payloads for several summaries, at most ``concurrency`` at a time.
+
+        Returns them in input order. ``on_payload(index, payload)`` is called
+        from a worker thread as each one finishes. Errors become fallback
+        payloads, as in ``build_task_payload``.
+        """
+        summaries = list(summaries)
+        if not summaries:
+            return []
+
+        # Each call runs in a copy of this context, so LLM spans join the caller's trace
+        contexts = [contextvars.copy_context() for _ in summaries]
+
+        def generate(index):
+            payload = contexts[index].run(self.build_task_payload, summaries[index])
+            if on_payload is not None:
+                on_payload(index, payload)
+            return payload
+
+        # With batching, `concurrency` caps the batch requests, not the prompts
+        limit = self.concurrency * self.max_batch_size if self._coalescer is not None else self.concurrency
+        workers = max(1, min(limit, len(summaries)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm") as pool:
+            return list(pool.map(generate, range(len(summaries))))
+
     def reload_config(self, config=None):
         self.config = config or load_config()
 
@@ -70,11 +170,32 @@ class TaskGeneratorService:
         self.base_url = llm_cfg.get("base_url", "http://localhost:8008")
         self.endpoint = llm_cfg.get("endpoint", "/generate-jira")
         self.timeout = llm_cfg.get("timeout", 10)
+        self.concurrency = llm_cfg.get("concurrency", DEFAULT_CONCURRENCY)
+        self.simulator = Simulator(llm_cfg.get("mock"))
+        self.batch_endpoint = llm_cfg.get("batch_endpoint", "")
+        self.max_batch_size = llm_cfg.get("max_batch_size", DEFAULT_MAX_BATCH_SIZE)
+        self._coalescer = None
+        if self.batch_endpoint:
+            self._coalescer = Coalescer(
+                self._post_batch,
+                window=llm_cfg.get("batch_window_ms", DEFAULT_BATCH_WINDOW_MS) / 1000,
+                max_batch=self.max_batch_size,
+                max_in_flight=self.concurrency,
+            )
         raw_prompt_path = llm_cfg.get("prompt_path", "resources/generate_jira_task.md")
         self.prompt_path = get_resource_path(raw_prompt_path)
+        self.prompt_templates = {
+            name: ({n: get_resource_path(p) for n, p in value.items()} if isinstance(value, dict)
+                   else get_resource_path(value))
+            for name, value in llm_cfg.get("templates", {}).items()
+        }
+        self.template = llm_cfg.get("template", "default")
+        self.send_prefix_hash = llm_cfg.get("send_prefix_hash", False)
+        self.templates = TemplateCache()
 
     @staticmethod
     def _fallback(summary, error_msg):
+        LLM_FALLBACKS.inc()
         return {
             "summary": f"[Fallback] {summary}",
             "description": f"# [LLM Error]\n\nThe LLM failed to respond.\n\nError: {error_msg}",
@@ -0,0 +1,60 @@
+import fcntl
+import os
+import logging
+
+from services.task_layout import COUNTER_FILENAME
+
+logger = logging.getLogger(__name__)
+
+
+class TaskIdAllocator:
+    """Allocates sequential task IDs from a counter file shared by all writers.
+
+    The counter holds the last allocated ID and is only read and advanced
+    under an exclusive ``flock``, so concurrent threads and processes
+    writing to the same data_dir never get the same ID. Each allocation is
+    one locked read and write of a few bytes, however many tasks exist.
+
+    When the counter is missing or unreadable it is seeded from
+    ``seed(data_dir)``, which returns the highest ID already in use.
+    """
+
+    def __init__(self, data_dir: str, seed=None, durable: bool = True):
+        self.data_dir = os.path.expanduser(data_dir)
+        self.path = os.path.join(self.data_dir, COUNTER_FILENAME)
+        self._seed = seed or (lambda _data_dir: 0)
+        self._durable = durable
+
+    def allocate(self) -> int:
+        """Return the next ID."""
+        return self.reserve(1).start
+
+    def reserve(self, count: int) -> range:
+        """Reserve ``count`` consecutive IDs in one step and return them."""
+        if count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+        os.makedirs(self.data_dir, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            last = self._read(fd)
+            new_last = last + count
+            data = f"{new_last}\n".encode()
+            os.pwrite(fd, data, 0)
+            os.ftruncate(fd, len(data))
+            if self._durable:
+                # A counter that rolls back after a power failure would hand
+                # out IDs of tasks that are already on disk
+                os.fsync(fd)
+        finally:
+            os.close(fd)  # also releases the lock
+        return range(last + 1, new_last + 1)
+
+    def _read(self, fd: int) -> int:
+        raw = os.pread(fd, 64, 0)
+        try:
+            return int(raw.decode().strip())
+        except ValueError:
+            if raw:
+                logger.warning("Invalid task counter %s, rescanning %s", self.path, self.data_dir)
+            return self._seed(self.data_dir)
@@ -0,0 +1,254 @@
+import os
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+from services.task_journal import journal_path, open_journal
+from services.task_layout import iter_task_paths
+from services.task_loader import TaskRow, load_task
+from services.task_record import TaskRecord
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.sqlite3"
+
+# PRAGMA user_version once a full rebuild has committed; an index without it
+# (e.g. left by a crash during the first build) is rebuilt when opened
+_BUILT_VERSION = 1
+
+# Background builds are retried this many times, BUILD_RETRY_DELAY seconds
+# apart (doubling), before the index is given up on
+BUILD_ATTEMPTS = 3
+BUILD_RETRY_DELAY = 1.0
+
+# bm25 weights per indexed column: summary, description, type, component
+_RANK = "bm25(tasks_fts, 10.0, 1.0, 2.0, 2.0)"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    key TEXT PRIMARY KEY,
+    summary TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    type TEXT NOT NULL DEFAULT '',
+    component TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL DEFAULT '',
+    path TEXT NOT NULL DEFAULT ''
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    summary, description, type, component,
+    content='tasks', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_ai AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts(rowid, summary, description, type, component)
+    VALUES (new.rowid, new.summary, new.description, new.type, new.component);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_ad AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, summary, description, type, component)
+    VALUES ('delete', old.rowid, old.summary, old.description, old.type, old.component);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_au AFTER UPDATE ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, summary, description, type, component)
+    VALUES ('delete', old.rowid, old.summary, old.description, old.type, old.component);
+    INSERT INTO tasks_fts(rowid, summary, description, type, component)
+    VALUES (new.rowid, new.summary, new.description, new.type, new.component);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO tasks (key, summary, description, type, component, created_at, path)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET
+    summary = excluded.summary,
+    description = excluded.description,
+    type = excluded.type,
+    component = excluded.component,
+    created_at = excluded.created_at,
+    path = excluded.path
+"""
+
+_indexes: dict[str, "TaskIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+def _fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must match as a prefix."""
+    terms = [t.replace('"', "") for t in text.split()]
+    return " ".join(f'"{t}"*' for t in terms if t)
+
+
+def _words(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def _scan_search(data_dir: str, text: str, limit: int) -> list[TaskRow]:
+    """Search the task files and journal directly, for while the index is being built.
+
+    Like the FTS query, every word must match the start of a word in the
+    summary, description, type or component; summary matches rank first,
+    then newer tasks.
+    """
+    terms = _words(text)
+    if not terms:
+        return []
+    matches = []
+    for task, path in _iter_tasks(data_dir):
+        summary = _words(task.summary)
+        words = summary + _words(f"{task.description} {task.type} {task.component}")
+        if not all(any(w.startswith(t) for w in words) for t in terms):
+            continue
+        in_summary = all(any(w.startswith(t) for w in summary) for t in terms)
+        matches.append((in_summary, task.created_at, TaskRow(task.key, task.summary, task.created_at, path)))
+    matches.sort(key=lambda m: (m[0], m[1]), reverse=True)
+    return [row for _in_summary, _created_at, row in matches[:limit]]
+
+
+def _iter_tasks(data_dir: str):
+    """Yield (record, path) for every task file and journal record under data_dir."""
+    for path in iter_task_paths(data_dir):
+        task = load_task(path)
+        if task is not None and task.key:
+            yield task, path
+    if os.path.exists(journal_path(data_dir)):
+        journal = open_journal(data_dir)
+        for task in journal.iter_records():
+            yield task, journal.locator(task.key)
+
+
+def _row_values(task: TaskRecord, path: str) -> tuple:
+    return (
+        task.key, task.summary, task.description, task.type, task.component, task.created_at, path,
+    )
+
+
+class TaskIndex:
+    """SQLite FTS5 full-text index over the tasks saved in a data_dir.
+
+    One connection is shared by the task worker (writes) and the GUI
+    (searches), serialised by a lock. The index file lives in the data_dir
+    it covers. While ``ready`` is unset (see ``build_in_background``)
+    searches scan the task files instead; if the build keeps failing
+    ``unusable`` is set and they always do.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.data_dir = os.path.dirname(path)
+        self.ready = threading.Event()
+        self.ready.set()
+        self.unusable = False
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+        self._pending = None  # rows added while a rebuild is scanning
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def add(self, task: TaskRecord, path: str):
+        """Insert or update a single task."""
+        values = _row_values(task, path)
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, values)
+            if self._pending is not None:
+                self._pending.append(values)
+
+    def search(self, text: str, limit: int = 100) -> list[TaskRow]:
+        """Return the best matching tasks for free text, best first."""
+        if not self.ready.is_set():
+            return _scan_search(self.data_dir, text, limit)
+        query = _fts_query(text)
+        if not query:
+            return []
+        sql = (
+            "SELECT t.key, t.summary, t.created_at, t.path FROM tasks_fts"
+            " JOIN tasks t ON t.rowid = tasks_fts.rowid"
+            f" WHERE tasks_fts MATCH ? ORDER BY {_RANK}, t.created_at DESC LIMIT ?"
+        )
+        with self._lock:
+            try:
+                rows = self._conn.execute(sql, (query, limit)).fetchall()
+            except sqlite3.OperationalError as e:
+                logger.warning("Invalid search query %r: %s", text, e)
+                return []
+        return [TaskRow(*row) for row in rows]
+
+    def is_built(self) -> bool:
+        """True once a full rebuild has completed for this index file."""
+        with self._lock:
+            return self._conn.execute("PRAGMA user_version").fetchone()[0] == _BUILT_VERSION
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM tasks").fetchone()[0]
+
+    def rebuild(self, data_dir: str) -> int:
+        """Re-index every task file and journal record under data_dir. Returns the number indexed."""
+        with self._rebuild_lock:
+            # Tasks added during the scan are replayed after the swap
+            with self._lock:
+                if self._pending is None:
+                    self._pending = []
+            try:
+                values = [_row_values(task, path) for task, path in _iter_tasks(data_dir)]
+                with self._lock, self._conn:
+                    self._conn.execute("DELETE FROM tasks")
+                    self._conn.executemany(_UPSERT, values + self._pending)
+                    self._conn.execute(f"PRAGMA user_version = {_BUILT_VERSION}")
+            finally:
+                with self._lock:
+                    self._pending = None
+        logger.info("Indexed %d task(s) in %s", len(values), self.path)
+        return len(values)
+
+    def build_in_background(self, data_dir: str):
+        """Rebuild on a new thread; ``ready`` is set once it is done."""
+        with self._lock:
+            self._pending = []
+        self.ready.clear()
+        threading.Thread(target=self._build, args=(data_dir,), name="task-index", daemon=True).start()
+
+    def _build(self, data_dir: str):
+        delay = BUILD_RETRY_DELAY
+        for attempt in range(1, BUILD_ATTEMPTS + 1):
+            try:
+                self.rebuild(data_dir)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(
+                    "Failed to build the search index in %s (attempt %d/%d): %s",
+                    data_dir, attempt, BUILD_ATTEMPTS, e,
+                )
+            else:
+                self.ready.set()
+                return
+            if attempt < BUILD_ATTEMPTS:
+                time.sleep(delay)
+                delay *= 2
+        self.unusable = True
+        logger.error("Search index in %s is unusable; searches will scan the task files", data_dir)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def open_index(data_dir: str) -> TaskIndex:
+    """Return the shared index for data_dir.
+
+    A missing or incomplete index is built from disk on a background
+    thread, so the first search or save does not wait for a full scan;
+    searches scan the task files until it is ready.
+    """
+    data_dir = os.path.expanduser(data_dir)
+    with _indexes_lock:
+        index = _indexes.get(data_dir)
+        if index is None:
+            os.makedirs(data_dir, exist_ok=True)
+            path = os.path.join(data_dir, INDEX_FILENAME)
+            index = TaskIndex(path)
+            if not index.is_built():
+                index.build_in_background(data_dir)
+            _indexes[data_dir] = index
+        return index
@@ -0,0 +1,227 @@
+"""Append-only task journal: one compact JSON object per line in ``data_dir/tasks.jsonl``.
+
+The journal is an alternative to one JSON file per task. Appends are a
+single ``write`` to an open file (fsynced per ``[task] durability``); a
+crash can only leave a partial last line, which is truncated away the
+next time the journal is opened. Saving a task again appends a newer
+record for the same key, and superseded records are dropped by
+``compact``.
+
+Tasks in the journal are addressed by locators of the form
+``<data_dir>/tasks.jsonl#<KEY>``, which stay valid across compactions.
+"""
+import mmap
+import os
+import logging
+import threading
+
+from services.serialization import DecodeError, dumps, loads
+from services.task_record import TaskRecord, UnsupportedSchemaError
+from services.task_writer import fsync_dir
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "tasks.jsonl"
+
+# Compact once at least this many records are superseded and they
+# outnumber the live ones
+COMPACT_MIN_DEAD = 1000
+
+_journals: dict[str, "TaskJournal"] = {}
+_journals_lock = threading.Lock()
+
+
+def _encode(record: dict) -> bytes:
+    return dumps(record) + b"\n"
+
+
+def _decode(line: bytes) -> dict | None:
+    try:
+        record = loads(line)
+    except DecodeError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _record(data: dict | None) -> TaskRecord | None:
+    if data is None:
+        return None
+    try:
+        return TaskRecord.from_dict(data)
+    except UnsupportedSchemaError as e:
+        logger.warning("Skipping journal record: %s", e)
+        return None
+
+
+def _scan(path: str, size: int, reverse: bool = False):
+    """Yield (offset, raw line) for the complete lines in the first ``size`` bytes."""
+    if size <= 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        size = min(size, len(m))
+        if reverse:
+            end = m.rfind(b"\n", 0, size)
+            while end >= 0:
+                start = m.rfind(b"\n", 0, end) + 1
+                yield start, m[start:end]
+                end = start - 1
+        else:
+            start = 0
+            while start < size:
+                end = m.find(b"\n", start, size)
+                if end < 0:
+                    return
+                yield start, m[start:end]
+                start = end + 1
+
+
+def parse_locator(path: str) -> tuple[str, str] | None:
+    """Split ``.../tasks.jsonl#KEY`` into (journal path, key); None for plain paths."""
+    journal_path, sep, key = path.rpartition("#")
+    if not sep or os.path.basename(journal_path) != JOURNAL_FILENAME:
+        return None
+    return journal_path, key
+
+
+class TaskJournal:
+    """Append-only JSON-lines store of task records keyed by ``key``.
+
+    Appends (task worker) and reads (GUI) are serialised by a lock; scans
+    memory-map the file and only look at the bytes written before they
+    started.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._offsets: dict[str, int] = {}
+        self._dead = 0
+        self._size = self._recover()
+        self._file = open(path, "ab")
+
+    def _recover(self) -> int:
+        """Index record offsets and truncate a torn tail. Returns the valid size."""
+        if not os.path.exists(self.path):
+            open(self.path, "wb").close()
+            return 0
+        size = os.path.getsize(self.path)
+        good_end = 0
+        offsets = {}
+        dead = 0
+        for offset, line in _scan(self.path, size):
+            record = _decode(line)
+            if record is None:
+                logger.warning("Skipping corrupt journal record at %s:%d", self.path, offset)
+                dead += 1
+            elif "key" in record:
+                if record["key"] in offsets:
+                    dead += 1
+                offsets[record["key"]] = offset
+            good_end = offset + len(line) + 1
+        if good_end < size:
+            logger.warning("Truncating %d byte(s) of incomplete journal tail in %s",
+                           size - good_end, self.path)
+            with open(self.path, "r+b") as f:
+                f.truncate(good_end)
+        self._offsets = offsets
+        self._dead = dead
+        return good_end
+
+    def append(self, record: TaskRecord, durability: str = "none"):
+        """Append a record; a record with an existing key supersedes the old one."""
+        self.append_many([record], durability)
+
+    def append_many(self, records: list[TaskRecord], durability: str = "none"):
+        """Append records with a single write (and fsync, unless durability is "none")."""
+        lines = [_encode(record.to_dict()) for record in records]
+        with self._lock:
+            self._file.write(b"".join(lines))
+            self._file.flush()
+            if durability != "none":
+                os.fsync(self._file.fileno())
+            for record, line in zip(records, lines):
+                key = record.key
+                if key in self._offsets:
+                    self._dead += 1
+                self._offsets[key] = self._size
+                self._size += len(line)
+            if self._dead >= COMPACT_MIN_DEAD and self._dead > len(self._offsets):
+                self._compact_locked()
+
+    def get(self, key: str) -> TaskRecord | None:
+        """Return the latest record for key, or None."""
+        with self._lock:
+            offset = self._offsets.get(key)
+            if offset is None:
+                return None
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                data = _decode(f.readline())
+        return _record(data)
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return list(self._offsets)
+
+    def iter_records(self, reverse: bool = False):
+        """Yield the live records in append order (newest first if ``reverse``)."""
+        with self._lock:
+            size = self._size
+            offsets = dict(self._offsets)
+        for offset, line in _scan(self.path, size, reverse=reverse):
+            data = _decode(line)
+            if data is not None and offsets.get(data.get("key")) == offset:
+                record = _record(data)
+                if record is not None:
+                    yield record
+
+    def locator(self, key: str) -> str:
+        return f"{self.path}#{key}"
+
+    def compact(self):
+        """Rewrite the journal keeping only the latest record of each key."""
+        with self._lock:
+            self._compact_locked()
+
+    def _compact_locked(self):
+        tmp = self.path + ".compact"
+        live = sorted(self._offsets.items(), key=lambda item: item[1])
+        offsets = {}
+        size = 0
+        with open(self.path, "rb") as src, open(tmp, "wb") as dst:
+            for key, offset in live:
+                src.seek(offset)
+                line = src.readline()
+                offsets[key] = size
+                dst.write(line)
+                size += len(line)
+            dst.flush()
+            os.fsync(dst.fileno())
+        self._file.close()
+        os.replace(tmp, self.path)
+        fsync_dir(os.path.dirname(self.path))
+        self._file = open(self.path, "ab")
+        logger.info("Compacted %s: dropped %d superseded record(s)", self.path, self._dead)
+        self._offsets = offsets
+        self._size = size
+        self._dead = 0
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def journal_path(data_dir: str) -> str:
+    return os.path.join(os.path.expanduser(data_dir), JOURNAL_FILENAME)
+
+
+def open_journal(data_dir: str) -> TaskJournal:
+    """Return the shared journal for data_dir, creating it if needed."""
+    data_dir = os.path.expanduser(data_dir)
+    with _journals_lock:
+        journal = _journals.get(data_dir)
+        if journal is None:
+            os.makedirs(data_dir, exist_ok=True)
+            journal = TaskJournal(journal_path(data_dir))
+            _journals[data_dir] = journal
+        return journal
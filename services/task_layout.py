@@ -0,0 +1,123 @@
+"""On-disk layout of saved tasks: ``data_dir/YYYY/MM/DD/<KEY>.json``.
+
+Partitioning by the UTC creation date keeps directory listings small and
+lets "today" or "the last N days" be read without touching older tasks.
+Run ``python -m services.task_layout`` to move tasks saved by older
+versions (flat ``data_dir/<KEY>.json`` files) into the partitions.
+"""
+import argparse
+import os
+import logging
+import sys
+from datetime import date, datetime, timezone, timedelta
+
+from services.serialization import DecodeError, loads
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FILENAME = ".task_counter"
+
+
+def _parse_day(created_at: str) -> date:
+    return datetime.fromisoformat(created_at).date()
+
+
+def utc_today() -> date:
+    """Return today's date in UTC, the day tasks are partitioned by."""
+    return datetime.now(timezone.utc).date()
+
+
+def partition_dir(data_dir: str, day: date) -> str:
+    """Return the directory holding the tasks created on ``day``."""
+    return os.path.join(
+        os.path.expanduser(data_dir), f"{day.year:04d}", f"{day.month:02d}", f"{day.day:02d}",
+    )
+
+
+def task_file_path(data_dir: str, key: str, created_at: str) -> str:
+    """Return the JSON file path for a task key created at ``created_at`` (ISO 8601)."""
+    return os.path.join(partition_dir(data_dir, _parse_day(created_at)), f"{key}.json")
+
+
+def recent_partitions(data_dir: str, days: int = 1) -> list[str]:
+    """Return the existing partitions of the last ``days`` days (UTC), newest first."""
+    today = utc_today()
+    dirs = (partition_dir(data_dir, today - timedelta(days=n)) for n in range(max(days, 1)))
+    return [d for d in dirs if os.path.isdir(d)]
+
+
+def iter_task_paths(data_dir: str):
+    """Yield the path of every task JSON file under data_dir, in any layout."""
+    for root, dirs, files in os.walk(os.path.expanduser(data_dir)):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".json"):
+                yield os.path.join(root, name)
+
+
+def migrate_flat_layout(data_dir: str) -> int:
+    """Move flat ``data_dir/<KEY>.json`` task files into date partitions.
+
+    Files without a ``key`` (e.g. the playbook parameter cache) are left
+    alone; tasks without a usable ``created_at`` go to the partition of
+    their modification time. Returns the number of files moved.
+    """
+    data_dir = os.path.expanduser(data_dir)
+    if not os.path.isdir(data_dir):
+        return 0
+
+    moved = 0
+    for name in sorted(os.listdir(data_dir)):
+        path = os.path.join(data_dir, name)
+        if not name.endswith(".json") or not os.path.isfile(path):
+            continue
+        try:
+            with open(path, "rb") as f:
+                task = loads(f.read())
+        except (*DecodeError, OSError) as e:
+            logger.warning("Skipping malformed file %s: %s", name, e)
+            continue
+        if not isinstance(task, dict) or not task.get("key"):
+            continue
+        try:
+            day = _parse_day(task["created_at"])
+        except (KeyError, TypeError, ValueError):
+            day = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc).date()
+        target_dir = partition_dir(data_dir, day)
+        os.makedirs(target_dir, exist_ok=True)
+        target = os.path.join(target_dir, name)
+        if os.path.exists(target):
+            logger.warning("Not moving %s: %s already exists", name, target)
+            continue
+        os.replace(path, target)
+        moved += 1
+
+    logger.info("Moved %d task file(s) into date partitions in %s", moved, data_dir)
+    return moved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Move flat task JSON files into the date-partitioned layout",
+    )
+    parser.add_argument("data_dir", nargs="?",
+                        help="Task data directory (default: task.data_dir from config.toml)")
+    args = parser.parse_args(argv)
+
+    data_dir = args.data_dir
+    if not data_dir:
+        from services.config import load_config
+        data_dir = load_config().get("task", {}).get("data_dir", "~/.config/CtrlLord/data")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    moved = migrate_flat_layout(data_dir)
+
+    # Paths stored in the search index point at the old files
+    from services.task_index import open_index
+    open_index(data_dir).rebuild(data_dir)
+    print(f"Migrated {moved} task(s) in {os.path.expanduser(data_dir)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
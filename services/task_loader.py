@@ -1,44 +1,129 @@
-import json
 import os
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from services.metrics import REGISTRY
+from services.serialization import DecodeError, loads
+from services.task_journal import journal_path, open_journal, parse_locator
+from services.task_layout import recent_partitions, utc_today
+from services.task_record import TaskRecord
+from services.task_writer import get_writer
 
 logger = logging.getLogger(__name__)
 
+LOAD_TASKS = REGISTRY.histogram(
+    "ctrllord_task_load_seconds", "Time to read recent tasks for the dashboard and load_todays_tasks",
+)
 
-def load_todays_tasks(data_dir: str) -> list[dict]:
-    """Load all tasks created today (UTC) from JSON files in data_dir."""
-    data_dir = os.path.expanduser(data_dir)
-    if not os.path.isdir(data_dir):
-        return []
 
-    today = datetime.now(timezone.utc).date()
-    tasks = []
+class TaskRow(NamedTuple):
+    """Lightweight list entry: the full task is read from ``path`` on demand."""
+    key: str
+    summary: str
+    created_at: str
+    path: str
+
+
+def _decode_task(name: str, data) -> TaskRecord | None:
+    if not isinstance(data, dict):
+        logger.warning("Skipping %s: not a task object", name)
+        return None
+    return TaskRecord.from_dict(data)
+
 
-    for name in os.listdir(data_dir):
+def iter_task_files(directory: str):
+    """Yield (name, path, record) for every readable task JSON file in directory."""
+    for name in os.listdir(directory):
         if not name.endswith(".json"):
             continue
-        path = os.path.join(data_dir, name)
+        path = os.path.join(directory, name)
         try:
-            with open(path) as f:
-                task = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            with open(path, "rb") as f:
+                task = _decode_task(name, loads(f.read()))
+        except (*DecodeError, OSError) as e:
             logger.warning("Skipping malformed file %s: %s", name, e)
             continue
+        if task is not None:
+            yield name, path, task
 
-        created_at = task.get("created_at")
-        if not created_at:
-            logger.warning("Skipping %s: missing created_at", name)
-            continue
 
-        try:
-            dt = datetime.fromisoformat(created_at)
-        except ValueError:
-            logger.warning("Skipping %s: invalid created_at format", name)
+def _created_date(name: str, created_at: str):
+    if not created_at:
+        logger.warning("Skipping %s: missing created_at", name)
+        return None
+    try:
+        return datetime.fromisoformat(created_at).date()
+    except ValueError:
+        logger.warning("Skipping %s: invalid created_at format", name)
+        return None
+
+
+def _load_journal(data_dir: str, days: int) -> list[tuple[str, TaskRecord]]:
+    """Return (locator, record) for the journal records of the last ``days`` days."""
+    if not os.path.exists(journal_path(data_dir)):
+        return []
+    journal = open_journal(data_dir)
+    since = utc_today() - timedelta(days=max(days, 1) - 1)
+    tasks = []
+    # Not sorted by created_at: a re-saved old task is appended at the end
+    for task in journal.iter_records(reverse=True):
+        created = _created_date(task.key, task.created_at)
+        if created is None or created < since:
             continue
+        tasks.append((journal.locator(task.key), task))
+    return tasks
+
+
+def _load_recent(data_dir: str, days: int) -> list[tuple[str, TaskRecord]]:
+    """Return (path, record) for the valid tasks in the last ``days`` partitions and journal."""
+    tasks = []
+    with LOAD_TASKS.time():
+        for directory in recent_partitions(data_dir, days):
+            for name, path, task in iter_task_files(directory):
+                if _created_date(name, task.created_at) is not None:
+                    tasks.append((path, task))
+        tasks.extend(_load_journal(data_dir, days))
+    return tasks
 
-        if dt.date() == today:
-            tasks.append(task)
 
-    tasks.sort(key=lambda t: t["created_at"], reverse=True)
+def load_todays_tasks(data_dir: str) -> list[TaskRecord]:
+    """Load all tasks created today (UTC) from today's partition and the journal of data_dir."""
+    tasks = [task for _path, task in _load_recent(data_dir, 1)]
+    tasks.sort(key=lambda t: t.created_at, reverse=True)
     return tasks
+
+
+def load_task_rows(data_dir: str, days: int = 1) -> list[TaskRow]:
+    """Load list rows for tasks created in the last ``days`` days (UTC), newest first.
+
+    Only the partitions of those days are read, and only key and summary
+    are kept; descriptions are loaded with ``load_task`` when a row is
+    selected.
+    """
+    rows = [
+        TaskRow(task.key, task.summary, task.created_at, path)
+        for path, task in _load_recent(data_dir, days)
+    ]
+    rows.sort(key=lambda r: r.created_at, reverse=True)
+    return rows
+
+
+def load_task(path: str) -> TaskRecord | None:
+    """Load a single task JSON file or journal locator, or None if it is missing or malformed."""
+    pending = get_writer().pending(path)
+    if pending is not None:
+        return pending
+    locator = parse_locator(path)
+    if locator is not None:
+        journal_file, key = locator
+        task = open_journal(os.path.dirname(journal_file)).get(key)
+        if task is None:
+            logger.warning("Could not load task %s: not in journal", path)
+        return task
+    try:
+        with open(path, "rb") as f:
+            return _decode_task(path, loads(f.read()))
+    except (*DecodeError, OSError) as e:
+        logger.warning("Could not load task %s: %s", path, e)
+        return None
@@ -1,11 +1,21 @@
 import logging
 import queue
+import time
 from dataclasses import dataclass
 
 from PySide6.QtCore import QThread, Signal
 
+from services import tracing
+from services.metrics import REGISTRY
+from services.task_record import TaskRecord
+from services.task_service import BatchSubmitError
+
 logger = logging.getLogger(__name__)
 
+QUEUE_DEPTH = REGISTRY.gauge("ctrllord_task_queue_depth", "Tasks waiting to be submitted")
+SUBMIT_LATENCY = REGISTRY.histogram("ctrllord_task_submit_seconds", "Duration of task submissions")
+SUBMIT_FAILURES = REGISTRY.counter("ctrllord_task_submit_failures_total", "Failed task submissions")
+
 
 @dataclass
 class TaskPayload:
@@ -13,37 +23,100 @@ class TaskPayload:
     description: str
     issue_type: str
     component: str
+    trace_id: str = ""        # trace the submission is part of, see services.tracing
+    parent_span_id: str = ""
 
 
 class TaskQueueWorker(QThread):
-    task_completed = Signal(dict)
-    task_failed = Signal(str, object)  # (error_message, payload)
+    task_completed = Signal(object)  # TaskRecord
+    task_failed = Signal(str, object)  # (error_message, payload), also for saves that fail later
+    batch_completed = Signal(object)  # list[TaskRecord] created by one enqueue_batch
 
     def __init__(self, jira_service):
         super().__init__()
         self._queue = queue.Queue()
         self._jira = jira_service
+        # Saves finish on the writer thread after task_completed; report failures too
+        jira_service.on_save_failed = self._on_save_failed
 
     def enqueue(self, payload: TaskPayload):
-        self._queue.put(payload)
+        with tracing.span("queue.enqueue", payload.trace_id, payload.parent_span_id):
+            self._queue.put((payload, time.time()))
+        QUEUE_DEPTH.inc()
+
+    def enqueue_batch(self, payloads: list[TaskPayload]):
+        """Queue several tasks to be submitted together with ``submit_tasks``.
+
+        Emits ``batch_completed`` with the created records, and
+        ``task_failed`` for each payload that was not submitted.
+        """
+        payloads = list(payloads)
+        if not payloads:
+            return
+        first = payloads[0]
+        with tracing.span("queue.enqueue", first.trace_id, first.parent_span_id, tasks=len(payloads)):
+            self._queue.put((payloads, time.time()))
+        QUEUE_DEPTH.inc(len(payloads))
+
+    def _on_save_failed(self, record: TaskRecord, error: Exception):
+        SUBMIT_FAILURES.inc()
+        payload = TaskPayload(record.summary, record.description, record.type, record.component)
+        self.task_failed.emit(f"{record.key} could not be saved: {error}", payload)
 
     def stop(self):
         self._queue.put(None)
 
     def run(self):
         while True:
-            payload = self._queue.get()
-            if payload is None:
+            item = self._queue.get()
+            if item is None:
                 logger.info("TaskQueueWorker received stop sentinel, exiting.")
                 break
-            try:
-                result = self._jira.submit_task(
-                    payload.summary,
-                    payload.description,
-                    payload.issue_type,
-                    payload.component,
-                )
-                self.task_completed.emit(result)
-            except Exception as e:
-                logger.error("Background task submission failed: %s", e, exc_info=True)
-                self.task_failed.emit(str(e), payload)
+            payload, enqueued_at = item
+            if isinstance(payload, list):
+                self._submit_batch(payload, enqueued_at)
+            else:
+                self._submit(payload, enqueued_at)
+
+    def _submit(self, payload: TaskPayload, enqueued_at: float):
+        QUEUE_DEPTH.dec()
+        try:
+            tracing.record("queue.wait", enqueued_at, time.time(),
+                           payload.trace_id, payload.parent_span_id)
+            with tracing.span("queue.submit", payload.trace_id, payload.parent_span_id) as span:
+                with SUBMIT_LATENCY.time():
+                    result = self._jira.submit_task(
+                        payload.summary,
+                        payload.description,
+                        payload.issue_type,
+                        payload.component,
+                    )
+                span.set(key=result.key)
+            self.task_completed.emit(result)
+        except Exception as e:
+            SUBMIT_FAILURES.inc()
+            logger.error("Background task submission failed: %s", e, exc_info=True)
+            self.task_failed.emit(str(e), payload)
+
+    def _submit_batch(self, payloads: list[TaskPayload], enqueued_at: float):
+        QUEUE_DEPTH.dec(len(payloads))
+        first = payloads[0]
+        tasks = [(p.summary, p.description, p.issue_type, p.component) for p in payloads]
+        try:
+            tracing.record("queue.wait", enqueued_at, time.time(), first.trace_id, first.parent_span_id)
+            with tracing.span("queue.submit_batch", first.trace_id, first.parent_span_id,
+                              tasks=len(payloads)) as span:
+                with SUBMIT_LATENCY.time():
+                    records = self._jira.submit_tasks(tasks)
+                span.set(keys=[record.key for record in records])
+        except Exception as e:
+            # Tasks created before a BatchSubmitError still count as done
+            records = e.records if isinstance(e, BatchSubmitError) else []
+            error = e.error if isinstance(e, BatchSubmitError) else e
+            logger.error("Background batch submission failed after %d of %d tasks: %s",
+                         len(records), len(payloads), error, exc_info=True)
+            for payload in payloads[len(records):]:
+                SUBMIT_FAILURES.inc()
+                self.task_failed.emit(str(error), payload)
+        if records:
+            self.batch_completed.emit(records)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+# Version of the stored task schema; bump it when fields change meaning and
+# add an upgrade from the previous version to _UPGRADES
+SCHEMA_VERSION = 1
+
+# version -> function turning a stored dict of that version into the next one
+_UPGRADES = {}
+
+
+class UnsupportedSchemaError(ValueError):
+    """A stored task has a schema version this code cannot read."""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRecord:
+    """A submitted task, as returned by the services and saved to disk.
+
+    Attribute names match the keys of the stored JSON so records convert to
+    and from task files and journal lines without renaming.
+    """
+    key: str
+    summary: str = ""
+    description: str = ""
+    type: str = ""
+    component: str = ""
+    url: str = ""
+    created_at: str = field(default_factory=_now)
+    schema_version: int = SCHEMA_VERSION
+
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "summary": self.summary,
+            "description": self.description,
+            "type": self.type,
+            "component": self.component,
+            "url": self.url,
+            "created_at": self.created_at,
+            "schema_version": self.schema_version,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TaskRecord":
+        """Build a record from stored JSON, ignoring unknown keys.
+
+        Files written before records were versioned have no
+        ``schema_version``; their fields are the same as version 1. Older
+        versions are upgraded; a newer or invalid version raises
+        UnsupportedSchemaError rather than being relabeled and losing data.
+        """
+        version = data.get("schema_version", 1)
+        if type(version) is not int or version < 1:
+            raise UnsupportedSchemaError(f"Task {data.get('key')!r} has invalid schema version {version!r}")
+        if version > SCHEMA_VERSION:
+            raise UnsupportedSchemaError(
+                f"Task {data.get('key')!r} has schema version {version}, newer than {SCHEMA_VERSION}"
+            )
+        while version < SCHEMA_VERSION:
+            data = _UPGRADES[version](data)
+            version += 1
+        get = data.get
+        return cls(
+            key=get("key") or "",
+            summary=get("summary") or "",
+            description=get("description") or "",
+            type=get("type") or "",
+            component=get("component") or "",
+            url=get("url") or "",
+            created_at=get("created_at") or "",
+            schema_version=SCHEMA_VERSION,
+        )
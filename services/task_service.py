@@ -1,30 +1,109 @@
-import json
 import os
 import logging
+import sqlite3
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+from concurrent.futures import Future
+
+from services import tracing
+from services.task_index import open_index
+from services.task_layout import task_file_path
+from services.task_record import TaskRecord
+from services.task_writer import durability_mode, get_writer
 
 logger = logging.getLogger(__name__)
 
 
+class BatchSubmitError(Exception):
+    """A batch submission failed part-way; ``records`` are the tasks created before."""
+
+    def __init__(self, records: list[TaskRecord], error: Exception):
+        super().__init__(str(error))
+        self.records = records
+        self.error = error
+
+
 class TaskService(ABC):
+    # Called as on_save_failed(record, error) on the writer thread when a
+    # queued save_task_json fails; see TaskQueueWorker
+    on_save_failed = None
+
     @abstractmethod
-    def submit_task(self, summary: str, description: str, issue_type: str, component: str) -> dict:
-        """Submit a task and return dict with keys: key, summary, description, type, component, url."""
+    def submit_task(self, summary: str, description: str, issue_type: str, component: str) -> TaskRecord:
+        """Submit a task and return its record."""
 
     @abstractmethod
     def reload_config(self, config=None):
         """Reload service configuration."""
 
-    def save_task_json(self, result: dict):
-        """Save task result as JSON file in data_dir (if configured)."""
+    def submit_tasks(self, tasks) -> list[TaskRecord]:
+        """Submit (summary, description, issue_type, component) tuples in order.
+
+        Stops at the first failure with a BatchSubmitError carrying the
+        records created so far.
+        """
+        records = []
+        for task in tasks:
+            try:
+                records.append(self.submit_task(*task))
+            except Exception as e:
+                raise BatchSubmitError(records, e) from e
+        return records
+
+    def save_task_json(self, record: TaskRecord) -> Future | None:
+        """Queue a task to be saved as JSON file in its date partition of data_dir.
+
+        The file is written atomically by the background task writer; the
+        returned future resolves once it is on disk. Returns None if no
+        data_dir is configured.
+        """
         data_dir = getattr(self, "data_dir", None)
         if not data_dir:
-            return
+            return None
         data_dir = os.path.expanduser(data_dir)
-        os.makedirs(data_dir, exist_ok=True)
-        payload = {**result, "created_at": datetime.now(timezone.utc).isoformat()}
-        path = os.path.join(data_dir, f"{result['key']}.json")
-        with open(path, "w") as f:
-            json.dump(payload, f, indent=2)
-        logger.info("Saved task JSON to %s", path)
+        path = task_file_path(data_dir, record.key, record.created_at)
+        future = get_writer().write_file(path, record, self._durability())
+        future.add_done_callback(self._saved_callback(data_dir, record, path))
+        return future
+
+    def flush(self):
+        """Block until every queued task save is on disk."""
+        get_writer().flush()
+
+    def task_path(self, key: str, created_at: str) -> str:
+        """Return where ``save_task_json`` stored a task, for ``load_task``."""
+        return task_file_path(os.path.expanduser(self.data_dir), key, created_at)
+
+    def _durability(self) -> str:
+        return durability_mode(getattr(self, "config", None) or {})
+
+    def _saved_callback(self, data_dir: str, record: TaskRecord, path: str):
+        """Return the done-callback of a queued save, traced until it is on disk."""
+        parent = tracing.current()
+        queued_at = time.time()
+
+        def done(future: Future):
+            if parent is not None:
+                tracing.record("save_task_json", queued_at, time.time(),
+                               parent.trace_id, parent.span_id, key=record.key)
+            self._on_saved(future, data_dir, record, path)
+
+        return done
+
+    def _on_saved(self, future: Future, data_dir: str, record: TaskRecord, path: str):
+        # Runs on the writer thread once the task is on disk
+        error = future.exception()
+        if error is not None:
+            if self.on_save_failed is not None:
+                self.on_save_failed(record, error)
+            return
+        logger.info("Saved task %s to %s", record.key, path)
+        self._index_task(data_dir, record, path)
+
+    def _index_task(self, data_dir: str, record: TaskRecord, path: str):
+        # The JSON file is the source of truth; a failed index update is
+        # logged and picked up by the next rebuild
+        try:
+            open_index(data_dir).add(record, path)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Failed to index task %s: %s", record.key, e)
@@ -0,0 +1,226 @@
+"""Background, crash-safe persistence of saved tasks.
+
+Task files are written to a temporary file in the target directory and
+renamed over the target with ``os.replace``, so a crash leaves either the
+old file or the new one, never a truncated one. How hard the data is
+pushed to disk is set by ``[task] durability``:
+
+- ``none``: leave flushing to the OS (fast; recent tasks may be lost on
+  power failure)
+- ``fsync``: fsync every file before it is renamed into place
+- ``fsync_dir``: also fsync the directory, so the rename itself survives
+  a power failure
+
+Writes are queued to a single writer thread so the submit path never waits
+for the disk. The thread drains everything queued since its last commit
+and commits it as one group: each directory and journal is fsynced once
+per group instead of once per task.
+"""
+import atexit
+import os
+import logging
+import queue
+import tempfile
+import threading
+from concurrent.futures import Future
+
+from services.serialization import dumps
+from services.task_record import TaskRecord
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_MODES = ("none", "fsync", "fsync_dir")
+DEFAULT_DURABILITY = "fsync"
+
+# Upper bound on the writes committed together
+MAX_GROUP = 256
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def durability_mode(config: dict) -> str:
+    """Return the configured durability mode, falling back to the default."""
+    mode = config.get("task", {}).get("durability", DEFAULT_DURABILITY)
+    if mode not in DURABILITY_MODES:
+        logger.warning("Unknown task.durability %r, using %r. Choose from: %s",
+                       mode, DEFAULT_DURABILITY, ", ".join(DURABILITY_MODES))
+        return DEFAULT_DURABILITY
+    return mode
+
+
+def fsync_dir(path: str):
+    """fsync a directory so that renames inside it are durable."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _stronger(a: str, b: str) -> str:
+    return max(a, b, key=DURABILITY_MODES.index)
+
+
+def _write_temp(path: str, data: bytes, durability: str) -> str:
+    """Write data to a temporary file next to path and return its name."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if durability != "none":
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return tmp
+
+
+class _Write:
+    __slots__ = ("kind", "target", "payload", "durability", "future", "pending_key")
+
+    def __init__(self, kind, target, payload, durability, pending_key):
+        self.kind = kind
+        self.target = target
+        self.payload = payload
+        self.durability = durability
+        self.future = Future()
+        self.pending_key = pending_key
+
+
+class TaskWriter:
+    """Single background thread applying queued task writes in groups.
+
+    Until a write is committed, its record is served by ``pending`` so
+    readers of the same process see their own writes.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue[_Write] = queue.Queue()
+        self._pending: dict[str, TaskRecord] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self.groups = 0
+        self.writes = 0
+
+    def write_file(self, path: str, record: TaskRecord, durability: str = DEFAULT_DURABILITY) -> Future:
+        """Queue record to be written as pretty-printed JSON to path."""
+        return self._submit(_Write("file", path, record, durability, path))
+
+    def append_journal(self, journal, record: TaskRecord, durability: str = DEFAULT_DURABILITY) -> Future:
+        """Queue record to be appended to a ``TaskJournal``."""
+        return self._submit(_Write("journal", journal, record, durability,
+                                   journal.locator(record.key)))
+
+    def pending(self, path: str) -> TaskRecord | None:
+        """Return the queued record for a file path or journal locator, if any."""
+        with self._lock:
+            return self._pending.get(path)
+
+    def flush(self):
+        """Block until every write queued so far is committed."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _submit(self, write: _Write) -> Future:
+        with self._lock:
+            self._pending[write.pending_key] = write.payload
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="task-writer", daemon=True)
+                self._thread.start()
+        self._queue.put(write)
+        return write.future
+
+    def _run(self):
+        while True:
+            group = [self._queue.get()]
+            while len(group) < MAX_GROUP:
+                try:
+                    group.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._commit(group)
+            finally:
+                with self._lock:
+                    for write in group:
+                        if self._pending.get(write.pending_key) is write.payload:
+                            del self._pending[write.pending_key]
+                for _ in group:
+                    self._queue.task_done()
+
+    def _commit(self, group: list[_Write]):
+        self.groups += 1
+        self.writes += len(group)
+        self._commit_files([w for w in group if w.kind == "file"])
+
+        journals = {}
+        for write in group:
+            if write.kind == "journal":
+                journals.setdefault(write.target, []).append(write)
+        for journal, writes in journals.items():
+            durability = "none"
+            for write in writes:
+                durability = _stronger(durability, write.durability)
+            self._settle(writes, lambda: journal.append_many(
+                [w.payload for w in writes], durability=durability))
+
+    def _commit_files(self, writes: list[_Write]):
+        # Several writes to one path in a group: only the last is written
+        by_path: dict[str, list[_Write]] = {}
+        for write in writes:
+            by_path.setdefault(write.target, []).append(write)
+
+        dirs = set()
+        written = []
+        for path, same_path in by_path.items():
+            write = same_path[-1]
+            try:
+                data = dumps(write.payload.to_dict(), pretty=True)
+                os.replace(_write_temp(path, data, write.durability), path)
+            except Exception as e:
+                logger.error("Failed to write task file %s: %s", path, e)
+                for w in same_path:
+                    w.future.set_exception(e)
+                continue
+            if write.durability == "fsync_dir":
+                dirs.add(os.path.dirname(path))
+            written.append((path, same_path))
+        for directory in dirs:
+            try:
+                fsync_dir(directory)
+            except OSError as e:
+                logger.warning("Failed to fsync directory %s: %s", directory, e)
+        for path, same_path in written:
+            for w in same_path:
+                w.future.set_result(path)
+
+    @staticmethod
+    def _settle(writes: list[_Write], commit):
+        try:
+            commit()
+        except Exception as e:
+            logger.error("Failed to append %d journal record(s): %s", len(writes), e)
+            for w in writes:
+                w.future.set_exception(e)
+            return
+        for w in writes:
+            w.future.set_result(w.pending_key)
+
+
+def get_writer() -> TaskWriter:
+    """Return the process-wide task writer."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = TaskWriter()
+        return _writer
+
+
+@atexit.register
+def _flush_at_exit():
+    if _writer is not None:
+        _writer.flush()
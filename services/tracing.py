@@ -0,0 +1,223 @@
+"""Spans that follow one task from the hotkey to the saved issue.
+
+A trace starts when the launcher opens; its ID travels on ``TaskPayload``
+to the queue worker, so the spans of the preview, the LLM call, the
+backend submission and the background save share it. Inside one thread,
+``span()`` nests under the current span automatically.
+
+Finished spans are appended as JSON lines to ``[tracing] path`` when
+``[tracing] enabled = true``; otherwise they are dropped. Print per-task
+waterfalls with::
+
+    python -m services.tracing                  # last 10 traces
+    python -m services.tracing --trace <ID>     # one trace
+"""
+import argparse
+import contextvars
+import logging
+import os
+import secrets
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from services.serialization import DecodeError, dumps, loads
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "~/.config/CtrlLord/traces.jsonl"
+WATERFALL_WIDTH = 40
+
+_current = contextvars.ContextVar("current_span", default=None)
+_sink = None
+
+
+def new_trace_id() -> str:
+    return secrets.token_hex(16)
+
+
+def _new_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "start", "end", "attributes")
+
+    def __init__(self, name, trace_id, parent_id="", start=None, attributes=None):
+        self.trace_id = trace_id
+        self.span_id = _new_span_id()
+        self.parent_id = parent_id
+        self.name = name
+        self.start = time.time() if start is None else start
+        self.end = None
+        self.attributes = attributes or {}
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration": (self.end or self.start) - self.start,
+            "attributes": self.attributes,
+        }
+
+
+class JsonLinesSink:
+    """Appends each finished span to a file as one JSON line."""
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = dumps(span.to_dict()) + b"\n"
+        with self._lock, open(self.path, "ab") as f:
+            f.write(line)
+
+
+def configure(tracing_cfg: dict):
+    """Export spans to ``tracing_cfg["path"]`` if ``enabled``, else drop them."""
+    global _sink
+    if tracing_cfg.get("enabled"):
+        path = os.path.expanduser(tracing_cfg.get("path", DEFAULT_PATH))
+        if _sink is None or _sink.path != path:
+            _sink = JsonLinesSink(path)
+            logger.info("Writing trace spans to %s", path)
+    else:
+        _sink = None
+
+
+def _export(span: Span):
+    sink = _sink
+    if sink is None:
+        return
+    try:
+        sink.export(span)
+    except OSError as e:
+        logger.warning("Could not export span %s: %s", span.name, e)
+
+
+def current() -> Span | None:
+    """Return the innermost open span of this thread, if any."""
+    return _current.get()
+
+
+@contextmanager
+def span(name: str, trace_id: str = "", parent_id: str = "", **attributes):
+    """Time the ``with`` block as a span.
+
+    Without ``trace_id`` the span joins the current span's trace (or starts
+    a new one); pass ``trace_id``/``parent_id`` to continue a trace that
+    was handed over from another thread.
+    """
+    parent = _current.get()
+    if not trace_id:
+        trace_id = parent.trace_id if parent is not None else new_trace_id()
+    if not parent_id and parent is not None and parent.trace_id == trace_id:
+        parent_id = parent.span_id
+    s = Span(name, trace_id, parent_id, attributes=attributes)
+    token = _current.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.attributes["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        s.end = time.time()
+        _current.reset(token)
+        _export(s)
+
+
+def record(name: str, start: float, end: float, trace_id: str, parent_id: str = "", **attributes):
+    """Export a span measured elsewhere, e.g. time spent waiting in a queue.
+
+    Dropped when there is no ``trace_id`` to attach it to.
+    """
+    if not trace_id:
+        return
+    s = Span(name, trace_id, parent_id, start=start, attributes=attributes)
+    s.end = end
+    _export(s)
+
+
+def load_traces(path: str) -> dict[str, list[dict]]:
+    """Group the spans in a JSON-lines file by trace ID, in file order."""
+    traces = {}
+    with open(os.path.expanduser(path), "rb") as f:
+        for line in f:
+            try:
+                span_data = loads(line)
+            except DecodeError:
+                continue  # a torn last line
+            traces.setdefault(span_data["trace_id"], []).append(span_data)
+    return traces
+
+
+def waterfall(spans: list[dict], width: int = WATERFALL_WIDTH) -> str:
+    """Render one trace as an indented timeline, one line per span."""
+    start = min(s["start"] for s in spans)
+    total = max(s["start"] + s["duration"] for s in spans) - start or 1e-9
+    children = {}
+    for s in sorted(spans, key=lambda s: s["start"]):
+        children.setdefault(s["parent_id"], []).append(s)
+    ids = {s["span_id"] for s in spans}
+    roots = [s for parent_id, group in children.items() if parent_id not in ids for s in group]
+    roots.sort(key=lambda s: s["start"])
+
+    key = next((s["attributes"]["key"] for s in spans if s["attributes"].get("key")), "")
+    lines = [f"trace {spans[0]['trace_id']}  {total * 1000:.1f}ms  {key}".rstrip()]
+
+    def walk(s, depth):
+        offset = int((s["start"] - start) / total * width)
+        length = max(1, round(s["duration"] / total * width))
+        bar = " " * offset + "█" * min(length, width - offset)
+        label = "  " * depth + s["name"]
+        error = "  ERROR" if "error" in s["attributes"] else ""
+        lines.append(f"  {label:<32} {(s['start'] - start) * 1000:8.1f}ms "
+                     f"|{bar:<{width}}| {s['duration'] * 1000:8.1f}ms{error}")
+        for child in children.get(s["span_id"], []):
+            walk(child, depth + 1)
+
+    for root in roots:
+        walk(root, 0)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print waterfall breakdowns of task traces")
+    parser.add_argument("path", nargs="?",
+                        help="Span file (default: tracing.path from config.toml)")
+    parser.add_argument("--trace", help="Only print this trace ID")
+    parser.add_argument("--last", type=int, default=10, help="Number of recent traces (default: 10)")
+    args = parser.parse_args(argv)
+
+    path = args.path
+    if not path:
+        from services.config import load_config
+        path = load_config().get("tracing", {}).get("path", DEFAULT_PATH)
+    try:
+        traces = load_traces(path)
+    except FileNotFoundError:
+        print(f"No traces in {os.path.expanduser(path)}; set [tracing] enabled = true", file=sys.stderr)
+        return 1
+
+    if args.trace:
+        selected = [traces[args.trace]] if args.trace in traces else []
+    else:
+        selected = list(traces.values())[-args.last:]
+    if not selected:
+        print("No matching traces", file=sys.stderr)
+        return 1
+    print("\n\n".join(waterfall(spans) for spans in selected))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import NamedTuple
+
+from PySide6.QtCore import QObject, QTimer
+
+from services.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD_MS = 250
+HEARTBEAT_MS = 50
+MAX_EVENTS = 50
+
+STALLS = REGISTRY.counter("ctrllord_ui_stalls_total", "Times the Qt event loop stopped responding")
+STALL_DURATION = REGISTRY.histogram(
+    "ctrllord_ui_stall_seconds", "Duration of Qt event loop stalls",
+    buckets=(0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+
+class StallEvent(NamedTuple):
+    started_at: float  # time.time()
+    duration: float    # seconds
+    stack: str         # main thread stack when the stall was detected
+
+
+class StallWatchdog(QObject):
+    """Detects when the Qt event loop stops processing events.
+
+    A QTimer on the GUI thread stamps a heartbeat every ``HEARTBEAT_MS``;
+    a daemon thread checks it and, once the last beat is more than
+    ``threshold_ms`` old, captures the GUI thread's Python stack with
+    ``sys._current_frames()``. When the loop runs again the stall is
+    logged with its duration and stack, counted in the metrics and kept
+    in ``events``.
+
+    Create and start it on the GUI thread. A threshold of 0 disables it.
+    """
+
+    def __init__(self, threshold_ms: int = DEFAULT_THRESHOLD_MS, heartbeat_ms: int = HEARTBEAT_MS,
+                 parent=None):
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.events = deque(maxlen=MAX_EVENTS)
+        self._gui_thread = threading.get_ident()
+        self._heartbeat_ms = heartbeat_ms
+        self._last_beat = time.monotonic()
+        self._stack = None  # set by the watchdog thread while a stall is in progress
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._gui_thread = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._timer.start()
+        self._thread = threading.Thread(target=self._watch, name="ui-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _beat(self):
+        now = time.monotonic()
+        with self._lock:
+            stall_start, stack = self._last_beat, self._stack
+            self._last_beat = now
+            self._stack = None
+        if stack is not None:
+            self._record(StallEvent(time.time() - (now - stall_start), now - stall_start, stack))
+
+    def _watch(self):
+        interval = self._heartbeat_ms / 1000
+        while not self._stopped.wait(interval):
+            threshold = self.threshold_ms / 1000
+            if not threshold:
+                continue
+            with self._lock:
+                if self._stack is not None or time.monotonic() - self._last_beat <= threshold:
+                    continue
+                frame = sys._current_frames().get(self._gui_thread)
+                self._stack = "".join(traceback.format_stack(frame)) if frame else "<no frame>"
+            logger.debug("Qt event loop has not responded for %d ms", self.threshold_ms)
+
+    def _record(self, event: StallEvent):
+        self.events.append(event)
+        STALLS.inc()
+        STALL_DURATION.observe(event.duration)
+        logger.warning("UI thread stalled for %.0f ms in:\n%s", event.duration * 1000, event.stack)
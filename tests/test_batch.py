@@ -0,0 +1,61 @@
+import pytest
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt
+
+from ui.batch import BatchList
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _draft(summary, issue_type="Task"):
+    return {"summary": summary, "description": f"About {summary}", "type": issue_type}
+
+
+class TestBatchList:
+    def test_rows_are_pending_until_generated(self, qapp):
+        batch = BatchList()
+        batch.set_summaries(["fix login", "update docs"])
+        assert batch.count() == 2
+        assert batch.pending() == 2
+        assert not batch.item(0).flags() & Qt.ItemIsUserCheckable
+        assert batch.checked_drafts() == []
+
+        batch.set_draft(1, _draft("Update the docs"))
+        assert batch.pending() == 1
+        assert batch.item(1).text() == "Update the docs"
+        assert batch.item(1).checkState() == Qt.Checked
+        assert batch.checked_drafts() == [_draft("Update the docs")]
+
+    def test_unchecked_rows_are_skipped(self, qapp):
+        batch = BatchList()
+        batch.set_summaries(["a", "b", "c"])
+        for row, summary in enumerate("ABC"):
+            batch.set_draft(row, _draft(summary))
+        batch.item(1).setCheckState(Qt.Unchecked)
+        assert [d["summary"] for d in batch.checked_drafts()] == ["A", "C"]
+
+    def test_edited_summary_wins(self, qapp):
+        batch = BatchList()
+        batch.set_summaries(["a"])
+        batch.set_draft(0, _draft("Generated", "Bug"))
+        batch.item(0).setText("  Edited  ")
+        assert batch.checked_drafts() == [{"summary": "Edited", "description": "About Generated", "type": "Bug"}]
+
+    def test_tooltip_shows_type_and_description(self, qapp):
+        batch = BatchList()
+        batch.set_summaries(["a"])
+        batch.set_draft(0, _draft("A", "Story"))
+        assert batch.item(0).toolTip() == "Story\n\nAbout A"
+
+    def test_set_draft_ignores_unknown_row(self, qapp):
+        batch = BatchList()
+        batch.set_summaries(["a"])
+        batch.set_draft(5, _draft("X"))
+        assert batch.pending() == 1
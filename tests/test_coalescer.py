@@ -0,0 +1,92 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.coalescer import BATCH_SIZE, Coalescer
+
+
+def _call_concurrently(coalescer, items):
+    with ThreadPoolExecutor(max_workers=len(items)) as pool:
+        futures = [pool.submit(coalescer, item) for item in items]
+        return [future.exception() or future.result() for future in futures]
+
+
+class RecordingHandler:
+    def __init__(self, fn=lambda items: [item * 10 for item in items], delay=0.0):
+        self.fn = fn
+        self.delay = delay
+        self.batches = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, items):
+        with self._lock:
+            self.batches.append(list(items))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return self.fn(items)
+
+
+class TestCoalescer:
+    def test_single_call(self):
+        handler = RecordingHandler()
+        assert Coalescer(handler, window=0.01)(4) == 40
+        assert handler.batches == [[4]]
+
+    def test_concurrent_calls_share_one_batch(self):
+        handler = RecordingHandler()
+        results = _call_concurrently(Coalescer(handler, window=0.2), list(range(5)))
+        assert results == [0, 10, 20, 30, 40]
+        assert len(handler.batches) == 1
+        assert sorted(handler.batches[0]) == [0, 1, 2, 3, 4]
+
+    def test_full_batch_is_sent_without_waiting(self):
+        handler = RecordingHandler()
+        coalescer = Coalescer(handler, window=10, max_batch=3)
+        start = time.monotonic()
+        results = _call_concurrently(coalescer, list(range(6)))
+        assert time.monotonic() - start < 5
+        assert results == [0, 10, 20, 30, 40, 50]
+        assert sorted(len(batch) for batch in handler.batches) == [3, 3]
+
+    def test_calls_after_the_window_start_a_new_batch(self):
+        handler = RecordingHandler()
+        coalescer = Coalescer(handler, window=0.01)
+        assert [coalescer(1), coalescer(2)] == [10, 20]
+        assert handler.batches == [[1], [2]]
+
+    def test_exception_entries_fail_only_their_caller(self):
+        def fn(items):
+            return [ValueError(f"bad {item}") if item % 2 else item for item in items]
+        results = _call_concurrently(Coalescer(RecordingHandler(fn), window=0.2), [0, 1, 2])
+        assert results[0] == 0 and results[2] == 2
+        assert isinstance(results[1], ValueError)
+
+    def test_handler_error_fails_the_whole_batch(self):
+        def fn(items):
+            raise ConnectionError("down")
+        results = _call_concurrently(Coalescer(RecordingHandler(fn), window=0.2), [0, 1])
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    def test_wrong_result_count(self):
+        coalescer = Coalescer(RecordingHandler(lambda items: []), window=0.01)
+        with pytest.raises(ValueError, match="0 results for 1 items"):
+            coalescer(1)
+
+    def test_max_in_flight(self):
+        handler = RecordingHandler(delay=0.05)
+        coalescer = Coalescer(handler, window=0.01, max_batch=1, max_in_flight=2)
+        assert _call_concurrently(coalescer, list(range(6))) == [0, 10, 20, 30, 40, 50]
+        assert len(handler.batches) == 6
+        assert handler.max_running == 2
+
+    def test_batch_sizes_are_observed(self):
+        count = BATCH_SIZE.count
+        Coalescer(RecordingHandler(), window=0.01)(1)
+        assert BATCH_SIZE.count == count + 1
@@ -1,9 +1,15 @@
+import json
+import os
+from datetime import datetime, timezone
+
 import pytest
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QKeyEvent
 
+from services.task_layout import task_file_path
+from services.task_loader import TaskRow, load_task_rows
 from ui.dashboard import TaskDashboard
 
 
@@ -35,17 +41,37 @@ SAMPLE_TASKS = [
 ]
 
 
+@pytest.fixture
+def sample_rows(tmp_path):
+    """Write SAMPLE_TASKS (dated today) to tmp_path and return their rows."""
+    today = datetime.now(timezone.utc).date().isoformat()
+    for task in SAMPLE_TASKS:
+        task = {**task, "created_at": today + task["created_at"][10:]}
+        path = task_file_path(str(tmp_path), task["key"], task["created_at"])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(task, f)
+    return load_task_rows(str(tmp_path))
+
+
 class TestTaskDashboard:
-    def test_load_tasks_populates_list(self, qapp):
+    def test_load_tasks_populates_list(self, qapp, sample_rows):
+        w = TaskDashboard()
+        w.load_tasks(sample_rows)
+        assert w._model.rowCount() == 2
+
+    def test_rows_hold_only_key_and_summary(self, qapp, sample_rows):
         w = TaskDashboard()
-        w.load_tasks(SAMPLE_TASKS)
-        assert w._list.count() == 2
+        w.load_tasks(sample_rows)
+        row = w._model.row_at(0)
+        assert row.key == "TASK-2"
+        assert not hasattr(row, "description")
 
-    def test_selecting_task_updates_detail(self, qapp):
+    def test_selecting_task_updates_detail(self, qapp, sample_rows):
         w = TaskDashboard()
-        w.load_tasks(SAMPLE_TASKS)
+        w.load_tasks(sample_rows)
 
-        w._list.setCurrentRow(1)
+        w._select_row(1)
         qapp.processEvents()
 
         assert w._title_label.text() == "Add dashboard"
@@ -53,11 +79,11 @@ class TestTaskDashboard:
         assert "Story" in w._meta_label.text()
         assert "dashboard view" in w._description.toPlainText()
 
-    def test_copy_key_to_clipboard(self, qapp):
+    def test_copy_key_to_clipboard(self, qapp, sample_rows):
         w = TaskDashboard()
-        w.load_tasks(SAMPLE_TASKS)
+        w.load_tasks(sample_rows)
 
-        w._list.setCurrentRow(0)
+        w._select_row(0)
         qapp.processEvents()
 
         w._copy_key()
@@ -68,6 +94,71 @@ class TestTaskDashboard:
         w.load_tasks([])
         assert w._stack.currentIndex() == 0
 
+    def test_add_task_prepends_row(self, qapp, sample_rows, tmp_path):
+        w = TaskDashboard()
+        w.load_tasks(sample_rows)
+
+        path = tmp_path / "TASK-3.json"
+        path.write_text(json.dumps({"key": "TASK-3", "summary": "New", "description": "Fresh"}))
+        w.add_task(TaskRow("TASK-3", "New", datetime.now(timezone.utc).isoformat(), str(path)))
+
+        assert w._model.rowCount() == 3
+        assert w._model.row_at(0).key == "TASK-3"
+
+    def test_add_task_leaves_empty_state(self, qapp, tmp_path):
+        w = TaskDashboard()
+        w.load_tasks([])
+
+        path = tmp_path / "TASK-1.json"
+        path.write_text(json.dumps({"key": "TASK-1", "summary": "First", "description": "D"}))
+        w.add_task(TaskRow("TASK-1", "First", datetime.now(timezone.utc).isoformat(), str(path)))
+        qapp.processEvents()
+
+        assert w._stack.currentIndex() == 1
+        assert w._description.toPlainText() == "D"
+
+    def test_missing_file_falls_back_to_row_summary(self, qapp, tmp_path):
+        w = TaskDashboard()
+        w.load_tasks([TaskRow("TASK-9", "Gone", "2025-01-01T00:00:00+00:00",
+                              str(tmp_path / "missing.json"))])
+        qapp.processEvents()
+
+        assert w._title_label.text() == "Gone"
+        assert w._description.toPlainText() == ""
+
+    def test_search_replaces_rows(self, qapp, sample_rows):
+        calls = []
+
+        def search(text):
+            calls.append(text)
+            return [r for r in sample_rows if text.lower() in r.summary.lower()]
+
+        w = TaskDashboard(search=search)
+        w.load_tasks(sample_rows)
+
+        w._search_input.setText("login")
+        w._run_search()
+        assert calls == ["login"]
+        assert w._model.rowCount() == 1
+        assert w._model.row_at(0).key == "TASK-2"
+
+        w._search_input.clear()
+        w._run_search()
+        assert w._model.rowCount() == 2
+
+    def test_search_without_results_shows_empty_state(self, qapp, sample_rows):
+        w = TaskDashboard(search=lambda text: [])
+        w.load_tasks(sample_rows)
+
+        w._search_input.setText("nothing")
+        w._run_search()
+        assert w._stack.currentIndex() == 0
+        assert w._empty_label.text() == "No matching tasks"
+
+    def test_search_box_hidden_without_provider(self, qapp):
+        w = TaskDashboard()
+        assert w._search_input.isHidden()
+
     def test_escape_closes(self, qapp):
         w = TaskDashboard()
         w.show()
@@ -0,0 +1,133 @@
+import asyncio
+import os
+import sys
+
+import pytest
+import requests
+
+from bench.bench_jenkins import CONFIG, run_scale
+from bench.fake_jenkins import CRUMB, CRUMB_FIELD, FakeJenkins
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "playbooks", "tools"))
+
+import run_jenkins_jobs as rjj  # noqa: E402
+
+
+@pytest.fixture
+def jenkins():
+    with FakeJenkins(build_seconds=0.2, log_interval=0.05) as server:
+        yield server
+
+
+@pytest.fixture
+def session():
+    return rjj.make_session(CONFIG)
+
+
+@pytest.fixture
+def fast_polls(monkeypatch):
+    monkeypatch.setattr(rjj.PollSchedule, "next_delay", lambda self, remaining=None, deadline=None: 0.02)
+
+
+def _run_async(coro_fn, *args):
+    async def go():
+        async with rjj.make_async_client(CONFIG) as client:
+            return await coro_fn(client, *args)
+    return asyncio.run(go())
+
+
+class TestFakeJenkins:
+    def test_crumb(self, jenkins, session):
+        assert rjj.get_crumb(session, jenkins.url) == {CRUMB_FIELD: CRUMB}
+
+    def test_trigger_without_crumb_is_forbidden(self, jenkins, session):
+        with pytest.raises(RuntimeError, match="HTTP 403"):
+            rjj.trigger_job(session, jenkins.url, "build", None, {})
+
+    def test_trigger_returns_queue_item(self, jenkins, session):
+        queue_url = rjj.trigger_job(session, jenkins.url, "folder/deploy", {"ENV": "prod"},
+                                    {CRUMB_FIELD: CRUMB})
+        assert queue_url == f"{jenkins.url}/queue/item/1/api/json"
+        assert jenkins.triggered() == ["folder/deploy"]
+        assert jenkins.builds[0].params == {"ENV": "prod"}
+        assert jenkins.requests["POST trigger"] == 1
+
+    def test_queue_item_waits_for_executor(self, session):
+        with FakeJenkins(queue_seconds=5, crumb=False) as jenkins:
+            queue_url = rjj.trigger_job(session, jenkins.url, "build", None, {})
+            data = session.get(queue_url).json()
+        assert data["executable"] is None
+        assert "Waiting" in data["why"]
+
+    def test_build_numbers_per_job(self, jenkins, session):
+        crumb = rjj.get_crumb(session, jenkins.url)
+        for name in ("build", "test", "build"):
+            rjj.trigger_job(session, jenkins.url, name, None, crumb)
+        assert [(b.job, b.number) for b in jenkins.builds] == [("build", 1), ("test", 1), ("build", 2)]
+
+    def test_unknown_build(self, jenkins, session):
+        assert session.get(f"{jenkins.url}/job/nope/1/api/json").status_code == 404
+
+
+@pytest.mark.usefixtures("fast_polls")
+class TestRunJob:
+    def test_sync_run_job(self, jenkins, session, capsys):
+        crumb = rjj.get_crumb(session, jenkins.url)
+        name, result, url = rjj.run_job(session, jenkins.url, {"name": "folder/build"}, crumb, 10,
+                                        stream_logs=True)
+        assert (name, result) == ("folder/build", "SUCCESS")
+        assert url == f"{jenkins.url}/job/folder/job/build/1/"
+
+        out = capsys.readouterr().out.splitlines()
+        log = [line for line in out if line.startswith("  [folder/build]")]
+        assert log[0] == "  [folder/build] Started build #1 of folder/build"
+        assert log[-1] == "  [folder/build] Finished: SUCCESS"
+        assert log[1:-1] == [f"  [folder/build] step {n}" for n in range(1, len(log) - 1)]
+
+    @pytest.mark.parametrize("timeout", [0, 10])
+    def test_sync_missing_log_falls_back_to_result(self, session, capsys, timeout):
+        with FakeJenkins(build_seconds=0.1, logs=False) as jenkins:
+            crumb = rjj.get_crumb(session, jenkins.url)
+            name, result, _url = rjj.run_job(session, jenkins.url, {"name": "build"}, crumb, timeout,
+                                             stream_logs=True)
+        assert (name, result) == ("build", "SUCCESS")
+        assert jenkins.requests["GET progressive_text"] == 1
+        assert capsys.readouterr().out.count("Console log unavailable (HTTP 404)") == 1
+
+    def test_async_missing_log_falls_back_to_result(self, session):
+        with FakeJenkins(build_seconds=0.1, logs=False) as jenkins:
+            crumb = rjj.get_crumb(session, jenkins.url)
+            name, result, _url = _run_async(rjj.async_run_job, jenkins.url, {"name": "build"}, crumb, 0, True)
+        assert (name, result) == ("build", "SUCCESS")
+        assert jenkins.requests["GET progressive_text"] == 1
+
+    def test_async_run_job_reports_failure(self, session):
+        with FakeJenkins(build_seconds=0.1, results={"deploy": "FAILURE"}) as jenkins:
+            crumb = rjj.get_crumb(session, jenkins.url)
+            name, result, _url = _run_async(rjj.async_run_job, jenkins.url, {"name": "deploy"}, crumb, 10)
+        assert (name, result) == ("deploy", "FAILURE")
+
+    def test_graph(self, session):
+        jobs = [{"name": "build"}, {"name": "unit", "needs": ["build"]}, {"name": "deploy", "needs": "unit"}]
+        with FakeJenkins(build_seconds=0.05, results={"unit": "UNSTABLE"}) as jenkins:
+            crumb = rjj.get_crumb(session, jenkins.url)
+            results = _run_async(rjj.run_graph, jenkins.url, jobs, crumb, 10, False)
+        assert {name: result for name, result, _ in results} == {
+            "build": "SUCCESS", "unit": "UNSTABLE", "deploy": "SKIPPED (needs unit)",
+        }
+        assert jenkins.triggered() == ["build", "unit"]
+
+
+class TestScale:
+    def test_500_parallel_jobs_async(self):
+        report = run_scale(500, "async", build_seconds=0.2, queue_seconds=0.1)
+        assert report["results"] == {"SUCCESS": 500}
+        assert report["requests"]["POST trigger"] == 500
+        assert report["requests_per_job"] >= 3  # trigger, queue poll, build poll
+        assert report["peak_threads"] < 10  # one event loop, no thread per job
+        assert report["server_max_in_flight"] <= rjj.DEFAULT_MAX_CONNECTIONS
+
+    def test_parallel_jobs_threads(self):
+        report = run_scale(100, "threads", build_seconds=0.2, queue_seconds=0.1)
+        assert report["results"] == {"SUCCESS": 100}
+        assert report["peak_threads"] > 50  # one thread per job
@@ -0,0 +1,193 @@
+import argparse
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+from atlassian import Jira
+
+from bench.fake_jira import FakeJira, JQLError, parse_jql
+from services.jira_service import JiraService
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "playbooks", "tools"))
+
+import jira_release as jr  # noqa: E402
+
+
+@pytest.fixture
+def jira():
+    with FakeJira() as server:
+        yield server
+
+
+def _session():
+    session = requests.Session()
+    session.auth = ("user", "token")
+    session.headers["Content-Type"] = "application/json"
+    return session
+
+
+def _service(url, tmp_path):
+    config = {
+        "jira": {"base_url": url, "project_key": "PROJ", "mode": "live",
+                 "username": "user", "token": "secret"},
+        "task": {"data_dir": str(tmp_path)},
+    }
+    with patch("services.jira_service.load_config", return_value=config):
+        return JiraService()
+
+
+@pytest.fixture
+def ticket_file(tmp_path, monkeypatch):
+    path = tmp_path / "release_ticket_key.txt"
+    monkeypatch.setenv("RELEASE_TICKET_FILE", str(path))
+    return path
+
+
+class TestParseJql:
+    def test_clauses(self):
+        assert parse_jql('project = PROJ AND summary ~ "Release 1.2" ORDER BY key') == [
+            ("project", "=", "PROJ"), ("summary", "~", "Release 1.2"),
+        ]
+
+    def test_in(self):
+        assert parse_jql("key in (PROJ-1, PROJ-2)") == [("key", "in", {"PROJ-1", "PROJ-2"})]
+
+    def test_unsupported(self):
+        with pytest.raises(JQLError):
+            parse_jql("project = PROJ OR project = OTHER")
+
+
+class TestJiraService:
+    def test_submit_task_creates_issue(self, jira, tmp_path):
+        service = _service(jira.url, tmp_path)
+        record = service.submit_task("Fix login", "Steps", "Bug", "Core")
+        service.flush()
+
+        assert record.key == "PROJ-1"
+        assert record.url == f"{jira.url}/browse/PROJ-1"
+        fields = jira.issues["PROJ-1"]["fields"]
+        assert fields["summary"] == "Fix login"
+        assert fields["issuetype"] == {"name": "Bug"}
+        assert fields["components"] == [{"name": "Core"}]
+        assert jira.requests["POST create_issue"] == 1
+
+    def test_submit_tasks_one_request_each(self, jira, tmp_path):
+        service = _service(jira.url, tmp_path)
+        records = service.submit_tasks([(f"Task {n}", "", "Task", "") for n in range(5)])
+        service.flush()
+        assert [r.key for r in records] == [f"PROJ-{n}" for n in range(1, 6)]
+        assert jira.requests["POST create_issue"] == 5
+
+    def test_rejected_issue_type_raises(self, jira, tmp_path):
+        service = _service(jira.url, tmp_path)
+        with pytest.raises(requests.HTTPError):
+            service.submit_task("Summary", "", "Epic", "")
+        assert jira.issues == {}
+
+    def test_injected_server_error_raises(self, tmp_path):
+        with FakeJira(latency={"errors": {"http": 1.0}}) as jira:
+            service = _service(jira.url, tmp_path)
+            with pytest.raises(requests.HTTPError, match="503"):
+                service.submit_task("Summary", "", "Task", "")
+
+    def test_latency(self, tmp_path):
+        with FakeJira(latency={"latency_ms": 50}) as jira:
+            service = _service(jira.url, tmp_path)
+            start = time.perf_counter()
+            service.submit_task("Slow", "", "Task", "")
+            assert time.perf_counter() - start >= 0.05
+
+
+class TestFakeJiraApi:
+    def test_bulk_create_reports_failed_elements(self, jira):
+        client = Jira(url=jira.url, username="user", password="token")
+        result = client.create_issues([
+            {"fields": {"project": {"key": "PROJ"}, "summary": "One", "issuetype": {"name": "Task"}}},
+            {"fields": {"project": {"key": "PROJ"}, "summary": "", "issuetype": {"name": "Task"}}},
+            {"fields": {"project": {"key": "PROJ"}, "summary": "Three", "issuetype": {"name": "Bug"}}},
+        ])
+        assert [issue["key"] for issue in result["issues"]] == ["PROJ-1", "PROJ-2"]
+        assert result["errors"][0]["failedElementNumber"] == 1
+
+    def test_createmeta(self, jira):
+        client = Jira(url=jira.url, username="user", password="token")
+        meta = client.get("rest/api/2/issue/createmeta",
+                          params={"projectKeys": "PROJ", "expand": "projects.issuetypes.fields"})
+        issue_types = meta["projects"][0]["issuetypes"]
+        assert [t["name"] for t in issue_types] == ["Task", "Bug", "Story", "Release"]
+        assert issue_types[0]["fields"]["summary"]["required"] is True
+
+    def test_search_pages_are_capped(self, jira):
+        jira.add_issues(250)
+        data = _session().get(f"{jira.url}/rest/api/2/search",
+                              params={"jql": "project = PROJ", "maxResults": 500}).json()
+        assert data["total"] == 250
+        assert len(data["issues"]) == 100
+
+    def test_rate_limit_answers_429_with_retry_after(self):
+        with FakeJira(rate_limit=2, retry_after=3) as jira:
+            session = _session()
+            statuses = [session.get(f"{jira.url}/rest/api/2/search").status_code for _ in range(3)]
+            resp = session.get(f"{jira.url}/rest/api/2/search")
+        assert statuses == [200, 200, 429]
+        assert resp.headers["Retry-After"] == "3"
+        assert jira.rate_limited == 2
+
+    def test_unknown_route(self, jira):
+        assert _session().get(f"{jira.url}/rest/api/2/project").status_code == 404
+
+
+class TestJiraRelease:
+    def test_find_or_create_then_find(self, jira, ticket_file):
+        args = argparse.Namespace(project="PROJ", version="1.2", issue_type="Release")
+        jr.cmd_find_or_create(_session(), jira.url, args)
+        assert ticket_file.read_text() == "PROJ-1"
+
+        jr.cmd_find_or_create(_session(), jira.url, args)
+        assert ticket_file.read_text() == "PROJ-1"
+        assert jira.requests["POST create_issue"] == 1
+
+    def test_iter_issues_paginates(self, jira):
+        jira.add_issues(20)
+        keys = [i["key"] for i in jr.iter_issues(_session(), jira.url, "project = PROJ", page_size=7)]
+        assert keys == [f"PROJ-{n}" for n in range(1, 21)]
+        assert jira.requests["GET search"] == 3
+
+    def test_link_issues_skips_existing_links(self, jira, ticket_file, capsys):
+        release = jira.add_issue("Release 1.2", "Release")
+        ticket_file.write_text(release)
+        keys = jira.add_issues(30, summary="Fix {n}", fixVersion="1.2")
+        _session().post(f"{jira.url}/rest/api/2/issueLink", json={
+            "type": {"name": "Relates"}, "inwardIssue": {"key": release}, "outwardIssue": {"key": keys[0]},
+        })
+
+        args = argparse.Namespace(jql="fixVersion = 1.2", link_type="Relates", workers=4, rate=0, page_size=8)
+        jr.cmd_link_issues(_session(), jira.url, args, session_factory=_session)
+
+        assert {outward for _, inward, outward in jira.links if inward == release} == set(keys)
+        assert len(jira.links) == 30
+        assert "Linked 29 issue(s) to PROJ-1 (1 already linked, 0 failed, 30 found)" in capsys.readouterr().out
+
+    def test_link_issues_retries_rate_limited_requests(self, ticket_file):
+        # 17 requests against 10/s: the rejected links are retried after a second
+        with FakeJira(rate_limit=10, retry_after=1) as jira:
+            ticket_file.write_text(jira.add_issue("Release 1.2", "Release"))
+            jira.add_issues(15, fixVersion="1.2")
+            args = argparse.Namespace(jql="fixVersion = 1.2", link_type="Relates",
+                                      workers=8, rate=0, page_size=100)
+            jr.cmd_link_issues(_session(), jira.url, args, session_factory=_session)
+        assert jira.rate_limited > 0
+        assert len(jira.links) == 15
+
+    def test_transition(self, jira, ticket_file):
+        ticket_file.write_text(jira.add_issue("Release 1.2", "Release"))
+        jr.cmd_transition(_session(), jira.url, argparse.Namespace(status="done"))
+        assert jira.issues["PROJ-1"]["fields"]["status"] == {"name": "Done"}
+
+    def test_unavailable_transition_exits(self, jira, ticket_file):
+        ticket_file.write_text(jira.add_issue("Release 1.2", "Release"))
+        with pytest.raises(SystemExit, match="Available: In Progress, Done"):
+            jr.cmd_transition(_session(), jira.url, argparse.Namespace(status="To Do"))
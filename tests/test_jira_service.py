@@ -5,7 +5,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from services.jira_service import JiraService
-from services.task_service import TaskService
+from services.task_service import BatchSubmitError, TaskService
 
 
 MOCK_CONFIG = {
@@ -66,37 +66,60 @@ class TestJiraServiceInit:
 class TestGenerateMockTask:
     def test_returns_expected_fields(self, mock_service):
         result = mock_service.generate_mock_task("Sum", "Desc", "Bug", "Core")
-        assert result["summary"] == "Sum"
-        assert result["description"] == "Desc"
-        assert result["type"] == "Bug"
-        assert result["component"] == "Core"
-        assert result["key"].startswith("MOCK-")
-        assert "browse/MOCK-" in result["url"]
+        assert result.summary == "Sum"
+        assert result.description == "Desc"
+        assert result.type == "Bug"
+        assert result.component == "Core"
+        assert result.key.startswith("MOCK-")
+        assert "browse/MOCK-" in result.url
 
     def test_key_is_random(self, mock_service):
         keys = {
-            mock_service.generate_mock_task("S", "D", "T", "C")["key"]
+            mock_service.generate_mock_task("S", "D", "T", "C").key
             for _ in range(20)
         }
         assert len(keys) > 1  # at least 2 distinct keys across 20 runs
 
     def test_url_uses_base_url(self, mock_service):
         result = mock_service.generate_mock_task("S", "D", "T", "C")
-        assert result["url"].startswith("https://jira.example.com/browse/")
+        assert result.url.startswith("https://jira.example.com/browse/")
 
 
 class TestSubmitTaskMockMode:
     def test_returns_mock_result(self, mock_service):
         result = mock_service.submit_task("My Summary", "My Desc", "Task", "UI")
-        assert result["key"].startswith("MOCK-")
-        assert result["summary"] == "My Summary"
-        assert result["description"] == "My Desc"
-        assert result["type"] == "Task"
-        assert result["component"] == "UI"
+        assert result.key.startswith("MOCK-")
+        assert result.summary == "My Summary"
+        assert result.description == "My Desc"
+        assert result.type == "Task"
+        assert result.component == "UI"
 
     def test_empty_component(self, mock_service):
         result = mock_service.submit_task("Sum", "Desc", "Bug", "")
-        assert result["component"] == ""
+        assert result.component == ""
+
+    def test_simulator_defaults_to_half_second_delay(self, mock_service):
+        assert mock_service.simulator.latency == 0.5
+
+    def test_injected_error_raises(self):
+        config = {**MOCK_CONFIG, "jira": {**MOCK_CONFIG["jira"], "mock": {"errors": {"connection": 1.0}}}}
+        with patch("services.jira_service.load_config", return_value=config):
+            service = JiraService()
+        with pytest.raises(ConnectionError, match="Simulated connection reset"):
+            service.submit_task("Sum", "Desc", "Bug", "")
+
+
+class TestSubmitTasks:
+    def test_stops_at_first_failure(self, mock_service):
+        record = mock_service.generate_mock_task("One", "", "Task", "")
+        error = ConnectionError("reset")
+        with patch.object(mock_service, "submit_task", side_effect=[record, error, record]) as submit:
+            with pytest.raises(BatchSubmitError) as exc_info:
+                mock_service.submit_tasks([("One", "", "Task", ""), ("Two", "", "Task", ""),
+                                           ("Three", "", "Task", "")])
+        assert exc_info.value.records == [record]
+        assert exc_info.value.error is error
+        assert submit.call_count == 2
 
 
 class TestSubmitTaskLiveMode:
@@ -114,8 +137,8 @@ class TestSubmitTaskLiveMode:
             "issuetype": {"name": "Bug"},
             "components": [{"name": "Core"}],
         })
-        assert result["key"] == "PROJ-42"
-        assert result["url"] == "https://jira.example.com/browse/PROJ-42"
+        assert result.key == "PROJ-42"
+        assert result.url == "https://jira.example.com/browse/PROJ-42"
 
     def test_creates_issue_without_component(self, live_service):
         mock_client = MagicMock()
@@ -126,7 +149,7 @@ class TestSubmitTaskLiveMode:
 
         call_args = mock_client.create_issue.call_args
         assert call_args[1]["fields"]["components"] == []
-        assert result["key"] == "PROJ-10"
+        assert result.key == "PROJ-10"
 
     def test_initializes_client_on_first_call(self, live_service):
         assert live_service.client is None
@@ -157,7 +180,7 @@ class TestSubmitTaskLiveMode:
         live_service.client = mock_client
 
         result = live_service.submit_task("Sum", "Desc", "Task", "")
-        assert result["key"] == "UNKNOWN"
+        assert result.key == "UNKNOWN"
 
     def test_url_strips_trailing_slash(self):
         config = {
@@ -171,7 +194,7 @@ class TestSubmitTaskLiveMode:
         svc.client = mock_client
 
         result = svc.submit_task("Sum", "Desc", "Task", "")
-        assert result["url"] == "https://jira.example.com/browse/PROJ-5"
+        assert result.url == "https://jira.example.com/browse/PROJ-5"
 
 
 class TestReloadConfig:
@@ -0,0 +1,91 @@
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import pytest
+
+import services.task_index as task_index
+import services.task_journal as task_journal
+from services.journal_service import JournalService
+from services.json_service import JsonService
+from services.task_record import TaskRecord
+from services.task_loader import load_task, load_task_rows, load_todays_tasks
+
+
+MOCK_CONFIG = {
+    "jira": {"base_url": "https://jira.example.com", "project_key": "PROJ"},
+    "llm": {"base_url": "http://localhost", "endpoint": "/gen"},
+    "ui": {"issue_types": ["Task"], "components": ["Core"]},
+    "task": {"backend": "journal", "data_dir": ""},
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    monkeypatch.setattr(task_journal, "_journals", {})
+    monkeypatch.setattr(task_index, "_indexes", {})
+
+
+@pytest.fixture
+def service(tmp_path):
+    config = {**MOCK_CONFIG, "task": {"backend": "journal", "data_dir": str(tmp_path)}}
+    with patch("services.json_service.load_config", return_value=config):
+        svc = JournalService()
+    return svc
+
+
+class TestJournalService:
+    def test_appends_to_single_file(self, service, tmp_path):
+        service.submit_task("First", "D1", "Task", "Core")
+        result = service.submit_task("Second", "D2", "Bug", "UI")
+        service.flush()
+
+        assert result.key == "TASK-2"
+        assert result.url == f"{tmp_path / task_journal.JOURNAL_FILENAME}#TASK-2"
+        assert not list(tmp_path.rglob("*.json"))
+
+    def test_loader_reads_journal(self, service, tmp_path):
+        service.submit_task("First", "D1", "Task", "Core")
+        service.submit_task("Second", "D2", "Bug", "UI")
+        service.flush()
+
+        rows = load_task_rows(str(tmp_path), days=7)
+        assert [r.key for r in rows] == ["TASK-2", "TASK-1"]
+        assert load_task(rows[0].path).description == "D2"
+        assert [t.key for t in load_todays_tasks(str(tmp_path))] == ["TASK-2", "TASK-1"]
+
+    def test_loader_reads_past_out_of_order_records(self, service, tmp_path):
+        service.submit_task("Today", "D1", "Task", "Core")
+        old = TaskRecord(key="TASK-99", summary="Old", created_at="2020-01-01T00:00:00+00:00")
+        service.save_task_json(old).result()  # re-saved old task, appended last
+        service.submit_task("Also today", "D2", "Task", "Core")
+        service.flush()
+
+        rows = load_task_rows(str(tmp_path), days=7)
+        assert [r.key for r in rows] == ["TASK-2", "TASK-1"]
+
+    def test_task_path_matches_loader(self, service, tmp_path):
+        result = service.submit_task("Sum", "Desc", "Task", "")
+        assert service.task_path(result.key, result.created_at) == result.url
+
+    def test_search_index(self, service, tmp_path):
+        service.submit_task("Rotate API keys", "Quarterly rotation", "Task", "Core")
+        service.flush()
+        [row] = task_index.open_index(str(tmp_path)).search("rotation")
+        assert load_task(row.path).summary == "Rotate API keys"
+
+    def test_write_error_is_reported(self, service):
+        failed = Future()
+        failed.set_exception(OSError("disk full"))
+        errors = []
+        service.on_save_failed = lambda record, error: errors.append((record.key, str(error)))
+        with patch("services.journal_service.get_writer") as get_writer:
+            get_writer.return_value.append_journal.return_value = failed
+            service.submit_task("Sum", "Desc", "Task", "")
+        assert errors == [("TASK-1", "disk full")]
+
+    def test_keys_continue_after_switching_from_json(self, tmp_path):
+        config = {**MOCK_CONFIG, "task": {"backend": "json", "data_dir": str(tmp_path)}}
+        with patch("services.json_service.load_config", return_value=config):
+            JsonService().submit_task("Old", "D", "Task", "")
+            journal_svc = JournalService()
+        assert journal_svc.submit_task("New", "D", "Task", "").key == "TASK-2"
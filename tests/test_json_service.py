@@ -3,11 +3,15 @@
 
 import json
 import os
+from concurrent.futures import Future
+from datetime import datetime
+
 import pytest
 from unittest.mock import patch
 
 from services.json_service import JsonService, _next_task_id
-from services.task_service import TaskService
+from services.task_layout import COUNTER_FILENAME, task_file_path
+from services.task_service import BatchSubmitError, TaskService
 
 
 MOCK_CONFIG = {
@@ -49,44 +53,109 @@ class TestNextTaskId:
         (tmp_path / "other-5.json").write_text("{}")
         assert _next_task_id(str(tmp_path)) == 3
 
+    def test_scans_partitions(self, tmp_path):
+        day = tmp_path / "2025" / "01" / "02"
+        day.mkdir(parents=True)
+        (day / "TASK-7.json").write_text("{}")
+        assert _next_task_id(str(tmp_path)) == 8
+
+    def test_uses_counter_after_first_allocation(self, tmp_path):
+        (tmp_path / "TASK-1.json").write_text("{}")
+        assert _next_task_id(str(tmp_path)) == 2
+        assert (tmp_path / COUNTER_FILENAME).read_text().strip() == "2"
+        # The counter is authoritative: no directory scan on later calls
+        (tmp_path / "TASK-50.json").write_text("{}")
+        assert _next_task_id(str(tmp_path)) == 3
+
+    def test_corrupt_counter_rescans(self, tmp_path):
+        (tmp_path / "TASK-4.json").write_text("{}")
+        (tmp_path / COUNTER_FILENAME).write_text("garbage")
+        assert _next_task_id(str(tmp_path)) == 5
+
 
 class TestSubmitTask:
     def test_creates_json_file(self, service, tmp_path):
         result = service.submit_task("My Summary", "My Desc", "Task", "Core")
-        assert result["key"] == "TASK-1"
-        assert result["summary"] == "My Summary"
-        assert result["description"] == "My Desc"
-        assert result["type"] == "Task"
-        assert result["component"] == "Core"
-
-        file_path = tmp_path / "TASK-1.json"
+        service.flush()
+        assert result.key == "TASK-1"
+        assert result.summary == "My Summary"
+        assert result.description == "My Desc"
+        assert result.type == "Task"
+        assert result.component == "Core"
+
+        day = datetime.fromisoformat(result.created_at)
+        file_path = tmp_path / f"{day:%Y}" / f"{day:%m}" / f"{day:%d}" / "TASK-1.json"
         assert file_path.exists()
         data = json.loads(file_path.read_text())
         assert data["key"] == "TASK-1"
         assert data["summary"] == "My Summary"
+        assert data["schema_version"] == 1
         assert "created_at" in data
 
     def test_sequential_keys(self, service, tmp_path):
-        service.submit_task("First", "Desc", "Task", "Core")
-        service.submit_task("Second", "Desc", "Bug", "UI")
-        assert (tmp_path / "TASK-1.json").exists()
-        assert (tmp_path / "TASK-2.json").exists()
+        first = service.submit_task("First", "Desc", "Task", "Core")
+        second = service.submit_task("Second", "Desc", "Bug", "UI")
+        service.flush()
+        assert (first.key, second.key) == ("TASK-1", "TASK-2")
+        assert os.path.exists(first.url)
+        assert os.path.exists(second.url)
 
     def test_url_is_file_path(self, service, tmp_path):
         result = service.submit_task("Sum", "Desc", "Task", "")
-        assert result["url"] == str(tmp_path / "TASK-1.json")
+        assert result.url == task_file_path(str(tmp_path), "TASK-1", result.created_at)
 
     def test_creates_data_dir_if_missing(self, tmp_path):
         nested = tmp_path / "a" / "b" / "c"
         config = {**MOCK_CONFIG, "task": {"backend": "json", "data_dir": str(nested)}}
         with patch("services.json_service.load_config", return_value=config):
             svc = JsonService()
-        svc.submit_task("Sum", "Desc", "Task", "")
-        assert (nested / "TASK-1.json").exists()
+        result = svc.submit_task("Sum", "Desc", "Task", "")
+        svc.flush()
+        assert os.path.exists(result.url)
+        assert result.url.startswith(str(nested))
+
+    def test_submit_tasks_reserves_consecutive_keys(self, service):
+        service.submit_task("Before", "Desc", "Task", "")
+        results = service.submit_tasks([
+            ("One", "D1", "Task", "Core"),
+            ("Two", "D2", "Bug", "UI"),
+        ])
+        service.flush()
+
+        assert [r.key for r in results] == ["TASK-2", "TASK-3"]
+        assert results[1].type == "Bug"
+        assert all(os.path.exists(r.url) for r in results)
+        assert service.submit_tasks([]) == []
+
+    def test_submit_tasks_partial_failure(self, service):
+        save_task_json = service.save_task_json
+
+        def save(record):
+            if record.key == "TASK-2":
+                raise OSError("disk full")
+            return save_task_json(record)
+
+        with patch.object(service, "save_task_json", side_effect=save):
+            with pytest.raises(BatchSubmitError) as exc_info:
+                service.submit_tasks([("One", "D1", "Task", ""), ("Two", "D2", "Task", ""),
+                                      ("Three", "D3", "Task", "")])
+        assert [r.key for r in exc_info.value.records] == ["TASK-1"]
+        assert isinstance(exc_info.value.error, OSError)
+
+    def test_write_error_is_reported(self, service):
+        failed = Future()
+        failed.set_exception(OSError("disk full"))
+        errors = []
+        service.on_save_failed = lambda record, error: errors.append((record.key, str(error)))
+        with patch("services.task_service.get_writer") as get_writer:
+            get_writer.return_value.write_file.return_value = failed
+            result = service.submit_task("Sum", "Desc", "Task", "")
+        assert result.key == "TASK-1"
+        assert errors == [("TASK-1", "disk full")]
 
     def test_empty_component(self, service):
         result = service.submit_task("Sum", "Desc", "Bug", "")
-        assert result["component"] == ""
+        assert result.component == ""
 
 
 class TestReloadConfig:
@@ -110,3 +179,20 @@ class TestReloadConfig:
         with patch("services.json_service.load_config", return_value=config):
             svc = JsonService()
         assert svc.data_dir == "~/.config/CtrlLord/data"
+
+
+class TestSearchIndex:
+    def test_submit_updates_index(self, service, tmp_path, monkeypatch):
+        import services.task_index as task_index
+        monkeypatch.setattr(task_index, "_indexes", {})
+
+        service.submit_task("Rotate API keys", "Quarterly rotation", "Task", "Core")
+        service.flush()
+        rows = task_index.open_index(str(tmp_path)).search("rotation")
+        assert [r.key for r in rows] == ["TASK-1"]
+
+    def test_index_errors_are_logged(self, service, tmp_path, caplog):
+        record = service.submit_task("Sum", "Desc", "Task", "")
+        with patch("services.task_service.open_index", side_effect=OSError("read-only")):
+            service._index_task(str(tmp_path), record, record.url)
+        assert "Failed to index task TASK-1" in caplog.text
@@ -0,0 +1,113 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from PySide6.QtWidgets import QApplication
+
+from services.metrics import Registry, serve
+from ui.diagnostics import DiagnosticsDialog, format_metric
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+class TestMetrics:
+    def test_counter_and_gauge(self, registry):
+        c = registry.counter("requests_total", "Requests")
+        g = registry.gauge("depth", "Depth")
+        c.inc()
+        c.inc(2)
+        g.inc(3)
+        g.dec()
+        assert c.value == 3
+        assert g.value == 2
+
+    def test_same_name_returns_same_metric(self, registry):
+        assert registry.counter("a_total", "A") is registry.counter("a_total", "A")
+
+    def test_type_conflict_raises(self, registry):
+        registry.counter("x", "X")
+        with pytest.raises(ValueError, match="already registered as a counter"):
+            registry.gauge("x", "X")
+
+    def test_histogram_buckets_and_percentile(self, registry):
+        h = registry.histogram("latency_seconds", "Latency", buckets=(0.01, 0.1))
+        for _ in range(99):
+            h.observe(0.005)
+        h.observe(0.5)
+        assert h.counts == [99, 0, 1]
+        assert h.percentile(0.5) == 0.01
+        assert h.percentile(1.0) == 0.5
+        assert h.snapshot()["max"] == 0.5
+
+    def test_histogram_time_records_on_exception(self, registry):
+        h = registry.histogram("op_seconds", "Op")
+        with pytest.raises(RuntimeError):
+            with h.time():
+                raise RuntimeError("boom")
+        assert h.count == 1
+
+    def test_render_prometheus_text(self, registry):
+        registry.counter("fallbacks_total", "Fallbacks").inc()
+        h = registry.histogram("load_seconds", "Load", buckets=(0.1, 1))
+        h.observe(0.05)
+        h.observe(2)
+        text = registry.render()
+        assert "# TYPE fallbacks_total counter\nfallbacks_total 1\n" in text
+        assert 'load_seconds_bucket{le="0.1"} 1\n' in text
+        assert 'load_seconds_bucket{le="1"} 1\n' in text
+        assert 'load_seconds_bucket{le="+Inf"} 2\n' in text
+        assert "load_seconds_count 2\n" in text
+        assert "load_seconds_sum 2.05\n" in text
+
+    def test_serve_metrics_endpoint(self, registry):
+        registry.counter("hits_total", "Hits").inc(5)
+        server = serve(0, registry)
+        try:
+            host, port = server.server_address[:2]
+            assert host == "127.0.0.1"
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert "hits_total 5" in response.read().decode()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://{host}:{port}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestDiagnosticsDialog:
+    def test_shows_all_metrics(self, qapp, registry):
+        registry.counter("a_total", "A").inc()
+        registry.histogram("b_seconds", "B").observe(0.002)
+        dialog = DiagnosticsDialog(registry=registry)
+        assert dialog.table.rowCount() == 2
+        assert dialog.table.item(0, 0).text() == "a_total"
+        assert dialog.table.item(0, 1).text() == "1"
+        assert "1 calls" in dialog.table.item(1, 1).text()
+
+    def test_refresh_picks_up_new_values(self, qapp, registry):
+        c = registry.counter("a_total", "A")
+        dialog = DiagnosticsDialog(registry=registry)
+        c.inc(4)
+        dialog.refresh()
+        assert dialog.table.item(0, 1).text() == "4"
+
+    def test_format_empty_histogram(self):
+        assert format_metric({"name": "x_seconds", "type": "histogram", "count": 0}) == "no data"
+
+    def test_format_sub_millisecond_histogram(self):
+        snapshot = {"name": "x_seconds", "type": "histogram", "count": 1,
+                    "mean": 0.000_02, "p50": 0.000_025, "p99": 0.000_025, "max": 0.000_02}
+        assert format_metric(snapshot) == "1 calls, mean 20us, p50 <= 25us, p99 <= 25us, max 20us"
@@ -2,7 +2,7 @@
 # tests/test_parser.py
 
 import pytest
-from services.parser import parse_task_text
+from services.parser import parse_task_text, split_batch
 
 
 class TestBasicParsing:
@@ -107,3 +107,25 @@ class TestEdgeCases:
         summary, desc = parse_task_text("# Title\n\tTabbed description")
         assert summary == "Title"
         assert "Tabbed description" in desc
+
+
+class TestSplitBatch:
+    def test_one_item_per_line(self):
+        assert split_batch("fix login\n\nupdate docs\n") == ["fix login", "update docs"]
+
+    def test_strips_bullets_numbers_and_checkboxes(self):
+        text = "- fix login\n* update docs\n+ tag release\n1. ship it\n2) call Bob\n- [ ] triage\n[x] done"
+        assert split_batch(text) == ["fix login", "update docs", "tag release", "ship it",
+                                     "call Bob", "triage", "done"]
+
+    def test_inline_bullets(self):
+        assert split_batch("• fix login • update docs") == ["fix login", "update docs"]
+
+    def test_skips_headings(self):
+        assert split_batch("Action items:\n- fix login") == ["fix login"]
+
+    def test_keeps_leading_dash_without_space(self):
+        assert split_batch("-5 degrees bug") == ["-5 degrees bug"]
+
+    def test_single_line(self):
+        assert split_batch("  Fix login bug  ") == ["Fix login bug"]
@@ -0,0 +1,92 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from services import profiler
+
+
+def _busy_worker(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    t = threading.Thread(target=_busy_worker, args=(stop,), name="busy")
+    t.start()
+    yield t
+    stop.set()
+    t.join()
+
+
+class TestSampleStacks:
+    def test_collapsed_stacks_name_threads(self, busy_thread):
+        stacks = profiler.sample_stacks(0.1, interval=0.005)
+        busy = [stack for stack in stacks if stack.startswith("busy;")]
+        assert busy
+        assert any("_busy_worker (test_profiler.py)" in stack for stack in busy)
+        # The sampling thread itself is left out
+        assert not any("sample_stacks" in stack for stack in stacks)
+
+    def test_unnamed_thread_named_by_entry_point(self):
+        def leaf():
+            pass
+        frame = type("F", (), {"f_back": None, "f_code": leaf.__code__})()
+        assert profiler._thread_name(1, frame, {}) == leaf.__code__.co_qualname
+
+
+class TestProfile:
+    def test_writes_collapsed_and_tracemalloc_files(self, tmp_path, busy_thread):
+        def allocate():
+            time.sleep(0.02)
+            _keep.append([bytearray(1024) for _ in range(100)])
+
+        _keep = []
+        t = threading.Thread(target=allocate)
+        t.start()
+        collapsed, allocations = profiler.profile(0.1, out_dir=str(tmp_path), interval=0.005)
+        t.join()
+
+        assert os.path.dirname(collapsed) == str(tmp_path)
+        for line in open(collapsed):
+            stack, count = line.rsplit(" ", 1)
+            assert ";" in stack and int(count) > 0
+        report = open(allocations).read()
+        assert report.startswith("Allocated while profiling:")
+        assert "test_profiler.py" in report
+
+    def test_only_one_profile_at_a_time(self, tmp_path):
+        with profiler._running:
+            with pytest.raises(RuntimeError, match="already running"):
+                profiler.profile(0.01, out_dir=str(tmp_path))
+
+    def test_start_profile_reports_result(self, tmp_path):
+        results = []
+        profiler.start_profile(0.01, on_done=results.append, out_dir=str(tmp_path)).join(5)
+        (paths,) = results
+        assert all(os.path.exists(path) for path in paths)
+
+    def test_start_profile_reports_failure(self, tmp_path):
+        results = []
+        with profiler._running:
+            profiler.start_profile(0.01, on_done=results.append, out_dir=str(tmp_path)).join(5)
+        assert isinstance(results[0], RuntimeError)
+
+
+class TestRequest:
+    def test_read_request_consumes_file(self, tmp_path, monkeypatch):
+        request = tmp_path / "request"
+        monkeypatch.setattr(profiler, "REQUEST_FILE", str(request))
+        request.write_text(json.dumps({"duration": 5}))
+        assert profiler.read_request() == 5
+        assert not request.exists()
+        assert profiler.read_request() == profiler.DEFAULT_DURATION
+
+    def test_cli_without_running_app(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(profiler, "LOCK_FILE", str(tmp_path / "missing.lock"))
+        assert profiler.main(["--duration", "1"]) == 1
+        assert "does not seem to be running" in capsys.readouterr().err
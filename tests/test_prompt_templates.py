@@ -0,0 +1,68 @@
+import hashlib
+import os
+
+import pytest
+
+from services.prompt_templates import TEMPLATE_LOADS, PromptTemplate, TemplateCache
+
+
+def _touch(path, text, bump_ns):
+    path.write_text(text)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump_ns))
+
+
+class TestPromptTemplate:
+    def test_render(self):
+        assert PromptTemplate("p", "Task: {{input}}!").render("login") == "Task: login!"
+
+    def test_render_replaces_every_placeholder(self):
+        assert PromptTemplate("p", "{{input}} / {{input}}").render("x") == "x / x"
+
+    def test_without_placeholder(self):
+        template = PromptTemplate("p", "static")
+        assert template.render("x") == "static"
+        assert template.prefix == "static"
+
+    def test_input_is_not_expanded(self):
+        assert PromptTemplate("p", "A {{input}} B").render("{{input}}") == "A {{input}} B"
+
+    def test_prefix_hash(self):
+        template = PromptTemplate("p", "You are a Jira assistant.\n{{input}}\nEnd")
+        assert template.prefix == "You are a Jira assistant.\n"
+        assert template.prefix_hash == hashlib.sha256(b"You are a Jira assistant.\n").hexdigest()
+        assert PromptTemplate("q", "You are a Jira assistant.\n{{input}}").prefix_hash == template.prefix_hash
+
+
+class TestTemplateCache:
+    def test_reads_once(self, tmp_path):
+        path = tmp_path / "prompt.md"
+        path.write_text("Task: {{input}}")
+        cache = TemplateCache()
+        loads = TEMPLATE_LOADS.value
+        first = cache.get(str(path))
+        assert cache.get(str(path)) is first
+        assert TEMPLATE_LOADS.value == loads + 1
+
+    def test_reloads_when_file_changes(self, tmp_path):
+        path = tmp_path / "prompt.md"
+        path.write_text("Old: {{input}}")
+        cache = TemplateCache()
+        old = cache.get(str(path))
+        _touch(path, "New: {{input}}", bump_ns=1_000_000_000)
+        new = cache.get(str(path))
+        assert new is not old
+        assert new.render("x") == "New: x"
+        assert new.prefix_hash != old.prefix_hash
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(OSError):
+            TemplateCache().get(str(tmp_path / "missing.md"))
+
+    def test_clear(self, tmp_path):
+        path = tmp_path / "prompt.md"
+        path.write_text("{{input}}")
+        cache = TemplateCache()
+        first = cache.get(str(path))
+        cache.clear()
+        assert cache.get(str(path)) is not first
@@ -0,0 +1,220 @@
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "playbooks", "tools"))
+
+import run_jenkins_jobs as rjj  # noqa: E402
+
+
+BASE_URL = "http://jenkins.test"
+
+
+def _job(name, needs=None):
+    job = {"name": name}
+    if needs is not None:
+        job["needs"] = needs
+    return job
+
+
+class FakeJenkins:
+    """httpx MockTransport handler: every build finishes on its first poll."""
+
+    def __init__(self, results=None):
+        self.results = results or {}
+        self.triggered = []
+        self.running = 0
+        self.max_running = 0
+        self._names = {}
+
+    def __call__(self, request):
+        path = request.url.path
+        if path.endswith("/crumbIssuer/api/json"):
+            return httpx.Response(404)
+        if path.endswith("/build") or path.endswith("/buildWithParameters"):
+            name = path[len("/job/"):].rsplit("/", 1)[0].replace("/job/", "/")
+            n = len(self.triggered)
+            self.triggered.append(name)
+            self._names[n] = name
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            return httpx.Response(201, headers={"Location": f"{BASE_URL}/queue/item/{n}/"})
+        if path.startswith("/queue/item/"):
+            n = path.split("/")[3]
+            return httpx.Response(200, json={"executable": {"url": f"{BASE_URL}/build/{n}/"}})
+        if path.startswith("/build/"):
+            n = int(path.split("/")[2])
+            self.running -= 1
+            name = self._names[n]
+            return httpx.Response(200, json={
+                "building": False,
+                "result": self.results.get(name, "SUCCESS"),
+                "url": f"{BASE_URL}/build/{n}/",
+            })
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def no_wait(monkeypatch):
+    monkeypatch.setattr(rjj.PollSchedule, "next_delay", lambda self, remaining=None, deadline=None: 0)
+
+
+def _run_graph(fake, jobs, fail_fast=False, max_concurrency=0, timings=None):
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(fake)) as client:
+            return await rjj.run_graph(client, BASE_URL, jobs, {}, 10, fail_fast,
+                                       max_concurrency, timings=timings)
+    return dict((name, result) for name, result, _url in asyncio.run(go()))
+
+
+class TestValidateGraph:
+    def test_topological_order(self):
+        jobs = [_job("deploy", ["test"]), _job("test", ["build"]), _job("build")]
+        assert rjj.validate_graph(jobs) == ["build", "test", "deploy"]
+
+    def test_needs_accepts_single_string(self):
+        jobs = [_job("build"), _job("test", "build")]
+        assert rjj.validate_graph(jobs) == ["build", "test"]
+
+    def test_unknown_dependency(self):
+        with pytest.raises(ValueError, match="unknown job 'lint'"):
+            rjj.validate_graph([_job("build", ["lint"])])
+
+    def test_cycle(self):
+        jobs = [_job("a", ["b"]), _job("b", ["c"]), _job("c", ["a"])]
+        with pytest.raises(ValueError, match="cycle"):
+            rjj.validate_graph(jobs)
+
+    def test_duplicate_names(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            rjj.validate_graph([_job("a"), _job("a")])
+
+
+class TestCriticalPath:
+    def test_longest_chain_wins(self):
+        jobs = [_job("build"), _job("unit", ["build"]), _job("e2e", ["build"]),
+                _job("deploy", ["unit", "e2e"])]
+        timings = {
+            "build": (0, 10),
+            "unit": (10, 15),
+            "e2e": (10, 40),
+            "deploy": (40, 45),
+        }
+        chain, total = rjj.critical_path(jobs, timings)
+        assert chain == ["build", "e2e", "deploy"]
+        assert total == 45
+
+    def test_ignores_jobs_that_did_not_run(self):
+        jobs = [_job("build"), _job("deploy", ["build"])]
+        chain, total = rjj.critical_path(jobs, {"build": (0, 3)})
+        assert chain == ["build"]
+        assert total == 3
+
+    def test_empty(self):
+        assert rjj.critical_path([_job("a")], {}) == ([], 0.0)
+
+
+@pytest.mark.usefixtures("no_wait")
+class TestRunGraph:
+    def test_all_jobs_succeed(self):
+        jobs = [_job("build"), _job("unit", ["build"]), _job("e2e", ["build"]),
+                _job("deploy", ["unit", "e2e"])]
+        fake = FakeJenkins()
+        timings = {}
+        results = _run_graph(fake, jobs, timings=timings)
+
+        assert set(results.values()) == {"SUCCESS"}
+        assert fake.triggered[0] == "build"
+        assert fake.triggered[-1] == "deploy"
+        assert set(timings) == {"build", "unit", "e2e", "deploy"}
+
+    def test_failure_skips_downstream_only(self):
+        jobs = [_job("build"), _job("unit", ["build"]), _job("lint"),
+                _job("deploy", ["unit"])]
+        fake = FakeJenkins(results={"build": "FAILURE"})
+        results = _run_graph(fake, jobs)
+
+        assert results["build"] == "FAILURE"
+        assert results["lint"] == "SUCCESS"
+        assert results["unit"] == "SKIPPED (needs build)"
+        assert results["deploy"] == "SKIPPED (needs unit)"
+        assert "unit" not in fake.triggered
+
+    def test_fail_fast_stops_independent_jobs(self):
+        jobs = [_job("build"), _job("lint", ["build"]), _job("docs"), _job("publish", ["docs"])]
+        fake = FakeJenkins(results={"build": "FAILURE"})
+        results = _run_graph(fake, jobs, fail_fast=True, max_concurrency=1)
+
+        assert results["build"] == "FAILURE"
+        assert results["lint"] == "SKIPPED (needs build)"
+        assert results["docs"] == "SKIPPED (fail fast)"
+        assert results["publish"] == "SKIPPED (fail fast)"
+        assert fake.triggered == ["build"]
+
+    @pytest.mark.parametrize("execution, argv, expected", [
+        ({}, [], "Mode: graph | Engine: async | Fail fast: False"),
+        ({"fail_fast": True}, [], "Fail fast: True"),
+        ({}, ["--fail-fast"], "Fail fast: True"),
+        ({"mode": "sequential"}, [], "Fail fast: False"),  # "needs" implies graph mode
+    ])
+    def test_fail_fast_is_opt_in_for_graphs(self, tmp_path, monkeypatch, capsys, execution, argv, expected):
+        config = tmp_path / "jobs.yaml"
+        config.write_text(yaml.safe_dump({
+            "jenkins": {"url": BASE_URL},
+            "execution": execution,
+            "jobs": [_job("build"), _job("deploy", ["build"])],
+        }))
+        monkeypatch.setattr(sys, "argv", ["run_jenkins_jobs.py", "-c", str(config), "--dry-run", *argv])
+        rjj.main()
+        assert expected in capsys.readouterr().out
+
+    def test_sequential_mode_fails_fast_by_default(self, tmp_path, monkeypatch, capsys):
+        config = tmp_path / "jobs.yaml"
+        config.write_text(yaml.safe_dump({"jenkins": {"url": BASE_URL}, "jobs": [_job("build")]}))
+        monkeypatch.setattr(sys, "argv", ["run_jenkins_jobs.py", "-c", str(config), "--dry-run"])
+        rjj.main()
+        assert "Mode: sequential | Engine: async | Fail fast: True" in capsys.readouterr().out
+
+    def test_respects_concurrency_limit(self):
+        jobs = [_job(f"job-{i}") for i in range(8)]
+        fake = FakeJenkins()
+        results = _run_graph(fake, jobs, max_concurrency=2)
+
+        assert len(results) == 8
+        assert fake.max_running <= 2
+
+
+class TestPollSchedule:
+    def test_backoff_grows_and_caps(self):
+        schedule = rjj.PollSchedule(minimum=1, maximum=8)
+        delays = [schedule.next_delay() for _ in range(6)]
+        assert all(0 < d <= 8 for d in delays)
+        assert delays[-1] >= 4  # capped at 8 with at most 50% jitter
+
+    def test_uses_estimated_remaining(self):
+        schedule = rjj.PollSchedule(minimum=1, maximum=30)
+        assert schedule.next_delay(remaining=40) >= 10
+
+    def test_reset(self):
+        schedule = rjj.PollSchedule(minimum=1, maximum=30)
+        for _ in range(5):
+            schedule.next_delay()
+        schedule.reset()
+        assert schedule.next_delay() <= 1
+
+
+class TestLogPrinter:
+    def test_holds_back_partial_lines(self, capsys):
+        log = rjj.LogPrinter("job")
+        assert log.feed("first\nsec", {"X-Text-Size": "9"})
+        assert log.offset == 9
+        assert log.feed("ond\n", {"X-Text-Size": "13"})
+        assert not log.feed("", {"X-Text-Size": "13"})
+        log.close()
+
+        out = capsys.readouterr().out.splitlines()
+        assert out == ["  [job] first", "  [job] second"]
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from services import serialization
+from services.serialization import CODECS, DecodeError
+
+TASK = {
+    "key": "TASK-1",
+    "summary": "Fix login – SSO “redirect”",
+    "description": "Line one\nLine two",
+    "type": "Bug",
+    "component": "",
+    "created_at": "2025-01-01T10:00:00+00:00",
+}
+
+
+@pytest.fixture(params=sorted(CODECS))
+def codec(request):
+    return CODECS[request.param]
+
+
+class TestCodecs:
+    def test_round_trip(self, codec):
+        assert codec.loads(codec.dumps(TASK)) == TASK
+        assert codec.loads(codec.dumps(TASK, pretty=True)) == TASK
+
+    def test_pretty_output_matches_stdlib(self, codec):
+        expected = json.dumps(TASK, indent=2, ensure_ascii=False).encode()
+        assert codec.dumps(TASK, pretty=True) == expected
+
+    def test_compact_output_matches_stdlib(self, codec):
+        expected = json.dumps(TASK, separators=(",", ":"), ensure_ascii=False).encode()
+        assert codec.dumps(TASK) == expected
+
+    def test_reads_stdlib_default_output(self, codec):
+        assert codec.loads(json.dumps(TASK, indent=2).encode()) == TASK
+
+    @pytest.mark.parametrize("data", [b"not json{{{", b'{"key": "TASK-1"', b"\xff\xfe"])
+    def test_malformed_input_raises_decode_error(self, codec, data):
+        with pytest.raises(DecodeError):
+            codec.loads(data)
+
+
+def test_default_prefers_fast_codec():
+    available = [name for name in ("orjson", "msgspec") if name in CODECS]
+    assert serialization.BACKEND == (available[0] if available else "json")
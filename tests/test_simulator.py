@@ -0,0 +1,93 @@
+import statistics
+
+import pytest
+
+from services.simulator import (
+    Simulator, SimulatedConnectionError, SimulatedHTTPError, SimulatedTimeout,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def __call__(self):
+        return self.now
+
+
+def _simulator(cfg, clock=None):
+    clock = clock or FakeClock()
+    return Simulator({"seed": 1, **cfg}, sleep=clock.sleep, clock=clock), clock
+
+
+class TestLatency:
+    def test_default_latency(self):
+        sim = Simulator(default_latency_ms=500)
+        assert sim.sample_latency() == 0.5
+
+    def test_fixed(self):
+        sim, clock = _simulator({"latency_ms": 120})
+        sim.call()
+        assert clock.sleeps == [0.12]
+
+    def test_normal_is_clamped_at_zero(self):
+        sim, _ = _simulator({"latency": "normal", "latency_ms": 10, "stddev_ms": 50})
+        samples = [sim.sample_latency() for _ in range(2000)]
+        assert min(samples) == 0.0
+        assert 0.005 < statistics.mean(samples) < 0.04
+
+    def test_lognormal_median_and_p99(self):
+        sim, _ = _simulator({"latency": "lognormal", "latency_ms": 100, "p99_ms": 2000})
+        samples = sorted(sim.sample_latency() for _ in range(20000))
+        assert samples[len(samples) // 2] == pytest.approx(0.1, rel=0.1)
+        assert samples[int(len(samples) * 0.99)] == pytest.approx(2.0, rel=0.2)
+
+    def test_unknown_distribution(self):
+        with pytest.raises(ValueError, match="Unknown latency distribution"):
+            Simulator({"latency": "pareto"})
+
+
+class TestFaults:
+    def test_error_rates(self):
+        sim, _ = _simulator({"errors": {"http": 0.2, "connection": 0.1}})
+        outcomes = {"ok": 0, "http": 0, "connection": 0}
+        for _ in range(5000):
+            try:
+                sim.call()
+                outcomes["ok"] += 1
+            except SimulatedHTTPError as e:
+                assert e.status == 503
+                outcomes["http"] += 1
+            except SimulatedConnectionError:
+                outcomes["connection"] += 1
+        assert outcomes["http"] == pytest.approx(1000, rel=0.15)
+        assert outcomes["connection"] == pytest.approx(500, rel=0.2)
+
+    def test_unknown_error_type(self):
+        with pytest.raises(ValueError, match="Unknown simulated error"):
+            Simulator({"errors": {"dns": 0.1}})
+
+    def test_slow_call_times_out_after_timeout(self):
+        sim, clock = _simulator({"latency_ms": 3000, "timeout_ms": 1000})
+        with pytest.raises(SimulatedTimeout):
+            sim.call()
+        assert clock.sleeps == [1.0]
+
+    def test_injected_timeout_is_a_timeout_error(self):
+        sim, _ = _simulator({"errors": {"timeout": 1.0}, "timeout_ms": 200})
+        with pytest.raises(TimeoutError):
+            sim.call()
+
+
+class TestThroughputCap:
+    def test_calls_are_spaced_by_max_qps(self):
+        sim, clock = _simulator({"max_qps": 4})
+        for _ in range(5):
+            sim.call()
+        assert clock.now == pytest.approx(1.0)
+        assert clock.sleeps == pytest.approx([0, 0.25, 0, 0.25, 0, 0.25, 0, 0.25, 0])
@@ -1,6 +1,9 @@
 
 # tests/test_task_generator_service.py
 
+import threading
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 import httpx
@@ -80,6 +83,59 @@ class TestMockMode:
             assert field in result
 
 
+class TestMockSimulator:
+    def test_injected_error_returns_fallback(self):
+        config = {**MOCK_CONFIG, "llm": {**MOCK_CONFIG["llm"], "mock": {"errors": {"http": 1.0}}}}
+        with patch("services.task_generator_service.load_config", return_value=config):
+            service = TaskGeneratorService()
+        result = service.build_task_payload("Flaky")
+        assert result["summary"] == "[Fallback] Flaky"
+        assert "Simulated HTTP 503" in result["description"]
+
+    def test_simulated_latency(self, mock_service):
+        mock_service.simulator._sleep = sleeps = MagicMock()
+        mock_service.simulator.latency = 0.2
+        mock_service.build_task_payload("Slow")
+        sleeps.assert_called_once_with(0.2)
+
+
+class TestBuildTaskPayloads:
+    def test_keeps_input_order(self, mock_service):
+        results = mock_service.build_task_payloads(["a", "b", "c"])
+        assert [r["summary"] for r in results] == ["generated a", "generated b", "generated c"]
+
+    def test_empty(self, mock_service):
+        assert mock_service.build_task_payloads([]) == []
+
+    def test_concurrency_is_capped(self, mock_service):
+        running, peak, lock = [0], [0], threading.Lock()
+
+        def build(summary):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return {"summary": summary}
+
+        mock_service.concurrency = 2
+        with patch.object(mock_service, "build_task_payload", side_effect=build):
+            results = mock_service.build_task_payloads([str(n) for n in range(6)])
+        assert [r["summary"] for r in results] == [str(n) for n in range(6)]
+        assert peak[0] == 2
+
+    def test_reports_each_payload(self, mock_service):
+        seen = []
+        mock_service.build_task_payloads(["a", "b"], on_payload=lambda i, p: seen.append((i, p["summary"])))
+        assert sorted(seen) == [(0, "generated a"), (1, "generated b")]
+
+    def test_concurrency_from_config(self):
+        config = {**MOCK_CONFIG, "llm": {**MOCK_CONFIG["llm"], "concurrency": 8}}
+        with patch("services.task_generator_service.load_config", return_value=config):
+            assert TaskGeneratorService().concurrency == 8
+
+
 class TestLiveMode:
     def test_successful_llm_call(self, live_service, tmp_path):
         prompt_file = tmp_path / "prompt.md"
@@ -207,6 +263,157 @@ class TestLiveModeErrors:
         assert "[Fallback]" in result["summary"]
 
 
+class TestBatchEndpoint:
+    @pytest.fixture
+    def batch_service(self, tmp_path):
+        prompt_file = tmp_path / "prompt.md"
+        prompt_file.write_text("Task: {{input}}")
+        config = {**LIVE_CONFIG, "llm": {**LIVE_CONFIG["llm"], "batch_endpoint": "/generate-jira/batch",
+                                         "batch_window_ms": 200}}
+        with patch("services.task_generator_service.load_config", return_value=config):
+            service = TaskGeneratorService()
+        service.prompt_path = str(prompt_file)
+        return service
+
+    @staticmethod
+    def _response(data):
+        response = MagicMock()
+        response.json.return_value = data
+        response.raise_for_status = MagicMock()
+        return response
+
+    def test_disabled_by_default(self, live_service):
+        assert live_service.batch_endpoint == ""
+        assert live_service._coalescer is None
+
+    def test_concurrent_prompts_share_one_request(self, batch_service):
+        def reply(url, json, timeout):
+            return self._response({"tasks": [
+                {"summary": prompt.upper(), "description": "d", "type": "Task"} for prompt in json["prompts"]
+            ]})
+
+        with patch("services.task_generator_service.httpx.post", side_effect=reply) as mock_post:
+            results = batch_service.build_task_payloads(["a", "b", "c"])
+
+        mock_post.assert_called_once()
+        assert mock_post.call_args[0][0] == "http://localhost:8001/generate-jira/batch"
+        assert sorted(mock_post.call_args[1]["json"]["prompts"]) == ["Task: a", "Task: b", "Task: c"]
+        assert [r["summary"] for r in results] == ["TASK: A", "TASK: B", "TASK: C"]
+
+    def test_failed_item_falls_back_alone(self, batch_service):
+        def reply(url, json, timeout):
+            return self._response([
+                {"error": "overloaded"} if prompt.endswith("b") else {"summary": prompt, "description": "d", "type": "Task"}
+                for prompt in json["prompts"]
+            ])
+
+        with patch("services.task_generator_service.httpx.post", side_effect=reply):
+            results = batch_service.build_task_payloads(["a", "b"])
+        assert results[0]["summary"] == "Task: a"
+        assert results[1]["summary"] == "[Fallback] b"
+        assert "overloaded" in results[1]["description"]
+
+    def test_short_response_falls_back_for_missing_items(self, batch_service):
+        batch_service._coalescer.window = 0.01
+        reply = self._response({"tasks": []})
+        with patch("services.task_generator_service.httpx.post", return_value=reply):
+            result = batch_service.build_task_payload("a")
+        assert result["summary"] == "[Fallback] a"
+
+    def test_prefix_hashes(self, batch_service):
+        batch_service.send_prefix_hash = True
+        batch_service._coalescer.window = 0.01
+        reply = self._response({"tasks": [{"summary": "s", "description": "d", "type": "Task"}]})
+        with patch("services.task_generator_service.httpx.post", return_value=reply) as mock_post:
+            batch_service.build_task_payload("a")
+        assert mock_post.call_args[1]["json"] == {
+            "prompts": ["Task: a"], "prefix_hashes": [batch_service.prompt_template().prefix_hash],
+        }
+
+    def test_request_failure_falls_back_for_every_item(self, batch_service):
+        with patch("services.task_generator_service.httpx.post",
+                   side_effect=httpx.ConnectError("Connection refused")) as mock_post:
+            results = batch_service.build_task_payloads(["a", "b"])
+        mock_post.assert_called_once()
+        assert [r["summary"] for r in results] == ["[Fallback] a", "[Fallback] b"]
+
+
+class TestPromptTemplates:
+    @pytest.fixture
+    def templates_service(self, tmp_path):
+        for name in ("default", "bug", "bug_regression", "short"):
+            (tmp_path / f"{name}.md").write_text(f"{name}: {{{{input}}}}")
+        config = {**LIVE_CONFIG, "llm": {
+            **LIVE_CONFIG["llm"],
+            "prompt_path": str(tmp_path / "default.md"),
+            "templates": {
+                "short": str(tmp_path / "short.md"),
+                "Bug": {"default": str(tmp_path / "bug.md"), "regression": str(tmp_path / "bug_regression.md")},
+                "Story": str(tmp_path / "short.md"),
+            },
+        }}
+        with patch("services.task_generator_service.load_config", return_value=config):
+            return TaskGeneratorService()
+
+    @pytest.mark.parametrize("issue_type, name, expected", [
+        (None, "default", "default: x"),
+        (None, "short", "short: x"),
+        ("Bug", "default", "bug: x"),
+        ("Bug", "regression", "bug_regression: x"),
+        ("Bug", "short", "short: x"),
+        ("Story", "default", "short: x"),
+        ("Task", "default", "default: x"),
+        (None, "unknown", "default: x"),
+    ])
+    def test_selection(self, templates_service, issue_type, name, expected):
+        assert templates_service.prompt_template(issue_type, name).render("x") == expected
+
+    def test_has_issue_type_template(self, templates_service):
+        assert templates_service.has_issue_type_template("Bug")
+        assert templates_service.has_issue_type_template("Story")
+        assert not templates_service.has_issue_type_template("Task")
+
+    def test_configured_template_name(self, templates_service):
+        templates_service.template = "short"
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"summary": "s", "description": "d", "type": "Task"}
+        with patch("services.task_generator_service.httpx.post", return_value=mock_response) as mock_post:
+            templates_service.build_task_payload("a")
+        assert mock_post.call_args[1]["json"] == {"prompt": "short: a"}
+
+    def test_payload_uses_issue_type_template(self, templates_service):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"summary": "s", "description": "d", "type": "Bug"}
+        with patch("services.task_generator_service.httpx.post", return_value=mock_response) as mock_post:
+            templates_service.build_task_payload("crash", issue_type="Bug", template="regression")
+        assert mock_post.call_args[1]["json"] == {"prompt": "bug_regression: crash"}
+
+    def test_template_is_read_once(self, live_service, tmp_path):
+        prompt_file = tmp_path / "prompt.md"
+        prompt_file.write_text("{{input}}")
+        live_service.prompt_path = str(prompt_file)
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"summary": "s", "description": "d", "type": "Task"}
+        with patch("services.task_generator_service.httpx.post", return_value=mock_response), \
+                patch("services.prompt_templates.open", side_effect=open, create=True) as mock_open:
+            live_service.build_task_payload("a")
+            live_service.build_task_payload("b")
+        mock_open.assert_called_once()
+
+    def test_send_prefix_hash(self, live_service, tmp_path):
+        prompt_file = tmp_path / "prompt.md"
+        prompt_file.write_text("Static part\n{{input}}")
+        live_service.prompt_path = str(prompt_file)
+        live_service.send_prefix_hash = True
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"summary": "s", "description": "d", "type": "Task"}
+        with patch("services.task_generator_service.httpx.post", return_value=mock_response) as mock_post:
+            live_service.build_task_payload("a")
+        body = mock_post.call_args[1]["json"]
+        assert body["prompt"] == "Static part\na"
+        assert body["prefix_hash"] == live_service.prompt_template().prefix_hash
+
+
 class TestMissingResponseFields:
     def test_missing_summary_uses_input(self, live_service, tmp_path):
         prompt_file = tmp_path / "prompt.md"
@@ -0,0 +1,75 @@
+import multiprocessing
+import threading
+
+import pytest
+
+from services.task_ids import TaskIdAllocator
+from services.task_layout import COUNTER_FILENAME
+
+
+def _allocate_many(data_dir, count, out):
+    allocator = TaskIdAllocator(data_dir, durable=False)
+    out.extend(allocator.allocate() for _ in range(count))
+
+
+def _allocate_in_process(data_dir, count, queue):
+    ids = []
+    _allocate_many(data_dir, count, ids)
+    queue.put(ids)
+
+
+class TestTaskIdAllocator:
+    def test_sequential(self, tmp_path):
+        allocator = TaskIdAllocator(str(tmp_path))
+        assert [allocator.allocate() for _ in range(3)] == [1, 2, 3]
+        assert (tmp_path / COUNTER_FILENAME).read_text() == "3\n"
+
+    def test_reserve_block(self, tmp_path):
+        allocator = TaskIdAllocator(str(tmp_path))
+        allocator.allocate()
+        assert allocator.reserve(5) == range(2, 7)
+        assert allocator.allocate() == 7
+
+    def test_reserve_rejects_empty_block(self, tmp_path):
+        with pytest.raises(ValueError):
+            TaskIdAllocator(str(tmp_path)).reserve(0)
+
+    def test_seeds_once(self, tmp_path):
+        calls = []
+
+        def seed(data_dir):
+            calls.append(data_dir)
+            return 41
+
+        allocator = TaskIdAllocator(str(tmp_path), seed=seed)
+        assert allocator.allocate() == 42
+        assert allocator.allocate() == 43
+        assert calls == [str(tmp_path)]
+
+    def test_creates_data_dir(self, tmp_path):
+        assert TaskIdAllocator(str(tmp_path / "a" / "b")).allocate() == 1
+
+    def test_threads_never_share_ids(self, tmp_path):
+        results = [[] for _ in range(8)]
+        threads = [threading.Thread(target=_allocate_many, args=(str(tmp_path), 50, out))
+                   for out in results]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        ids = [i for out in results for i in out]
+        assert sorted(ids) == list(range(1, 401))
+
+    def test_processes_never_share_ids(self, tmp_path):
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        procs = [ctx.Process(target=_allocate_in_process, args=(str(tmp_path), 25, queue))
+                 for _ in range(4)]
+        for p in procs:
+            p.start()
+        ids = [i for _ in procs for i in queue.get(timeout=30)]
+        for p in procs:
+            p.join()
+
+        assert sorted(ids) == list(range(1, 101))
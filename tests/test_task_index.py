@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+
+import pytest
+
+import services.task_index as task_index
+from services.task_index import TaskIndex, open_index, _fts_query, _scan_search, INDEX_FILENAME
+from services.task_record import TaskRecord
+
+
+def _task(key, summary, description="", issue_type="Task", component="Core",
+          created_at="2025-01-01T10:00:00+00:00"):
+    return TaskRecord(
+        key=key, summary=summary, description=description,
+        type=issue_type, component=component, created_at=created_at,
+    )
+
+
+def _task_dict(*args, **kwargs):
+    return _task(*args, **kwargs).to_dict()
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = TaskIndex(str(tmp_path / INDEX_FILENAME))
+    yield idx
+    idx.close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_index_cache(monkeypatch):
+    monkeypatch.setattr(task_index, "_indexes", {})
+
+
+class TestFtsQuery:
+    def test_words_become_prefix_terms(self):
+        assert _fts_query("fix log") == '"fix"* "log"*'
+
+    def test_quotes_and_operators_are_neutralised(self):
+        assert _fts_query('"OR" NEAR(') == '"OR"* "NEAR("*'
+
+    def test_blank(self):
+        assert _fts_query("   ") == ""
+
+
+class TestTaskIndex:
+    def test_search_matches_summary_and_description(self, index):
+        index.add(_task("TASK-1", "Fix login bug", "SSO redirect loops"), "/d/TASK-1.json")
+        index.add(_task("TASK-2", "Add dashboard", "Show recent tasks"), "/d/TASK-2.json")
+
+        assert [r.key for r in index.search("login")] == ["TASK-1"]
+        assert [r.key for r in index.search("redirect")] == ["TASK-1"]
+        assert [r.key for r in index.search("dash")] == ["TASK-2"]
+
+    def test_search_returns_rows(self, index):
+        index.add(_task("TASK-1", "Fix login bug"), "/d/TASK-1.json")
+        [row] = index.search("login")
+        assert row.summary == "Fix login bug"
+        assert row.path == "/d/TASK-1.json"
+        assert row.created_at == "2025-01-01T10:00:00+00:00"
+
+    def test_matches_type_and_component(self, index):
+        index.add(_task("TASK-1", "One", issue_type="Bug", component="Payments"), "/d/1")
+        assert [r.key for r in index.search("payments")] == ["TASK-1"]
+        assert [r.key for r in index.search("bug")] == ["TASK-1"]
+
+    def test_summary_hits_rank_first(self, index):
+        index.add(_task("TASK-1", "Unrelated", "mentions cache once"), "/d/1")
+        index.add(_task("TASK-2", "Cache eviction"), "/d/2")
+        assert [r.key for r in index.search("cache")] == ["TASK-2", "TASK-1"]
+
+    def test_all_words_must_match(self, index):
+        index.add(_task("TASK-1", "Fix login bug"), "/d/1")
+        index.add(_task("TASK-2", "Fix logout bug"), "/d/2")
+        assert [r.key for r in index.search("fix login")] == ["TASK-1"]
+
+    def test_re_adding_updates_in_place(self, index):
+        index.add(_task("TASK-1", "Old title"), "/d/1")
+        index.add(_task("TASK-1", "New title"), "/d/1")
+        assert index.count() == 1
+        assert index.search("old") == []
+        assert [r.summary for r in index.search("new")] == ["New title"]
+
+    def test_limit(self, index):
+        for i in range(20):
+            index.add(_task(f"TASK-{i}", f"Common words {i}"), f"/d/{i}")
+        assert len(index.search("common", limit=5)) == 5
+
+    def test_rebuild_from_data_dir(self, index, tmp_path):
+        (tmp_path / "TASK-1.json").write_text(json.dumps(_task_dict("TASK-1", "From disk")))
+        (tmp_path / "BAD.json").write_text("{{")
+        assert index.rebuild(str(tmp_path)) == 1
+        assert [r.key for r in index.search("disk")] == ["TASK-1"]
+
+    def test_search_large_index_is_fast(self, index):
+        words = ["alpha", "beta", "gamma", "delta", "login", "cache", "deploy", "report"]
+        with index._conn:
+            index._conn.executemany(
+                "INSERT INTO tasks (key, summary, description) VALUES (?, ?, ?)",
+                (
+                    (f"TASK-{i}", f"{words[i % 8]} {words[(i * 3) % 8]} item {i}",
+                     f"{words[(i * 5) % 8]} details")
+                    for i in range(20_000)
+                ),
+            )
+
+        start = time.perf_counter()
+        rows = index.search("login det")
+        elapsed = time.perf_counter() - start
+
+        assert rows
+        assert elapsed < 0.5
+
+
+class TestOpenIndex:
+    def test_builds_from_existing_files_once(self, tmp_path):
+        (tmp_path / "TASK-1.json").write_text(json.dumps(_task_dict("TASK-1", "Existing task")))
+        idx = open_index(str(tmp_path))
+        assert (tmp_path / INDEX_FILENAME).exists()
+        assert [r.key for r in idx.search("existing")] == ["TASK-1"]
+        assert open_index(str(tmp_path)) is idx
+
+    def test_new_index_is_built_in_the_background(self, tmp_path, monkeypatch):
+        (tmp_path / "TASK-1.json").write_text(json.dumps(_task_dict("TASK-1", "Existing task")))
+        release = threading.Event()
+        rebuild = TaskIndex.rebuild
+
+        def slow_rebuild(self, data_dir):
+            release.wait(5)
+            return rebuild(self, data_dir)
+
+        monkeypatch.setattr(TaskIndex, "rebuild", slow_rebuild)
+        idx = open_index(str(tmp_path))
+        assert not idx.ready.is_set()
+        assert [r.key for r in idx.search("existing")] == ["TASK-1"]  # scanned
+
+        idx.add(_task("TASK-2", "Saved during the build"), str(tmp_path / "TASK-2.json"))
+        release.set()
+        assert idx.ready.wait(5)
+        assert idx.count() == 2
+        assert [r.key for r in idx.search("build")] == ["TASK-2"]
+
+    def test_existing_index_is_ready(self, tmp_path):
+        idx = TaskIndex(str(tmp_path / INDEX_FILENAME))
+        idx.rebuild(str(tmp_path))
+        idx.close()
+        assert open_index(str(tmp_path)).ready.is_set()
+
+    def test_incomplete_index_is_rebuilt(self, tmp_path):
+        (tmp_path / "TASK-1.json").write_text(json.dumps(_task_dict("TASK-1", "Existing task")))
+        TaskIndex(str(tmp_path / INDEX_FILENAME)).close()  # created, never built
+        idx = open_index(str(tmp_path))
+        assert idx.ready.wait(5)
+        assert idx.is_built()
+        assert idx.count() == 1
+
+    def test_failed_build_is_retried(self, tmp_path, monkeypatch):
+        (tmp_path / "TASK-1.json").write_text(json.dumps(_task_dict("TASK-1", "Existing task")))
+        monkeypatch.setattr(task_index, "BUILD_RETRY_DELAY", 0)
+        rebuild = TaskIndex.rebuild
+        calls = []
+
+        def flaky_rebuild(self, data_dir):
+            calls.append(data_dir)
+            if len(calls) == 1:
+                raise OSError("disk busy")
+            return rebuild(self, data_dir)
+
+        monkeypatch.setattr(TaskIndex, "rebuild", flaky_rebuild)
+        idx = open_index(str(tmp_path))
+        assert idx.ready.wait(5)
+        assert len(calls) == 2
+        assert not idx.unusable
+        assert idx.count() == 1
+
+    def test_unusable_index_falls_back_to_scanning(self, tmp_path, monkeypatch, caplog):
+        (tmp_path / "TASK-1.json").write_text(json.dumps(_task_dict("TASK-1", "Existing task")))
+        monkeypatch.setattr(task_index, "BUILD_RETRY_DELAY", 0)
+
+        def broken_rebuild(self, data_dir):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(TaskIndex, "rebuild", broken_rebuild)
+        idx = open_index(str(tmp_path))
+        deadline = time.monotonic() + 5
+        while not idx.unusable and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert idx.unusable
+        assert not idx.ready.is_set()
+        assert [r.key for r in idx.search("existing")] == ["TASK-1"]
+        assert len([r for r in caplog.records if r.levelname == "ERROR"]) == 1
+
+
+class TestScanSearch:
+    def test_matches_like_the_index(self, tmp_path):
+        for task in (
+            _task("TASK-1", "Fix login", "Crash on submit", created_at="2025-01-01T10:00:00+00:00"),
+            _task("TASK-2", "Update docs", "Login page screenshots", created_at="2025-01-03T10:00:00+00:00"),
+            _task("TASK-3", "Login redirect", created_at="2025-01-02T10:00:00+00:00"),
+            _task("TASK-4", "Unrelated"),
+        ):
+            (tmp_path / f"{task.key}.json").write_text(json.dumps(task.to_dict()))
+        rows = _scan_search(str(tmp_path), "log", 10)
+        assert [r.key for r in rows] == ["TASK-3", "TASK-1", "TASK-2"]
+        assert [r.key for r in _scan_search(str(tmp_path), "login crash", 10)] == ["TASK-1"]
+        assert _scan_search(str(tmp_path), "  ", 10) == []
+        assert len(_scan_search(str(tmp_path), "log", 2)) == 2
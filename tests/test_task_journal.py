@@ -0,0 +1,128 @@
+import json
+import os
+
+import pytest
+
+import services.task_journal as task_journal
+from services.task_journal import TaskJournal, parse_locator, open_journal, JOURNAL_FILENAME
+from services.task_record import TaskRecord
+
+
+def _task_dict(*args):
+    return _task(*args).to_dict()
+
+
+@pytest.fixture(autouse=True)
+def fresh_journal_cache(monkeypatch):
+    monkeypatch.setattr(task_journal, "_journals", {})
+
+
+@pytest.fixture
+def journal(tmp_path):
+    j = TaskJournal(str(tmp_path / JOURNAL_FILENAME))
+    yield j
+    j.close()
+
+
+def _task(key, summary="s"):
+    return TaskRecord(key, summary, created_at="2025-01-01T10:00:00+00:00")
+
+
+class TestTaskJournal:
+    def test_append_and_get(self, journal):
+        journal.append(_task("TASK-1", "First"))
+        journal.append(_task("TASK-2", "Second"))
+        assert journal.get("TASK-2").summary == "Second"
+        assert journal.get("TASK-9") is None
+
+    def test_records_are_compact_lines(self, journal):
+        journal.append(_task("TASK-1"))
+        with open(journal.path) as f:
+            assert f.read() == (
+                '{"key":"TASK-1","summary":"s","description":"","type":"","component":"",'
+                '"url":"","created_at":"2025-01-01T10:00:00+00:00","schema_version":1}\n'
+            )
+
+    def test_iter_records_both_directions(self, journal):
+        for n in range(1, 4):
+            journal.append(_task(f"TASK-{n}"))
+        assert [r.key for r in journal.iter_records()] == ["TASK-1", "TASK-2", "TASK-3"]
+        assert [r.key for r in journal.iter_records(reverse=True)] == ["TASK-3", "TASK-2", "TASK-1"]
+
+    def test_newer_record_supersedes(self, journal):
+        journal.append(_task("TASK-1", "old"))
+        journal.append(_task("TASK-1", "new"))
+        assert [r.summary for r in journal.iter_records()] == ["new"]
+        assert journal.get("TASK-1").summary == "new"
+
+    def test_reopen_restores_index(self, journal, tmp_path):
+        journal.append(_task("TASK-1"))
+        journal.append(_task("TASK-2"))
+        journal.close()
+        reopened = TaskJournal(journal.path)
+        assert reopened.keys() == ["TASK-1", "TASK-2"]
+        reopened.close()
+
+
+class TestRecovery:
+    def test_truncates_torn_tail(self, tmp_path):
+        path = tmp_path / JOURNAL_FILENAME
+        good = json.dumps(_task_dict("TASK-1")) + "\n"
+        path.write_text(good + '{"key": "TASK-2", "summ')
+
+        j = TaskJournal(str(path))
+        assert j.keys() == ["TASK-1"]
+        assert path.read_text() == good
+
+        j.append(_task("TASK-2"))
+        assert [r.key for r in j.iter_records()] == ["TASK-1", "TASK-2"]
+        j.close()
+
+    def test_skips_corrupt_middle_record(self, tmp_path):
+        path = tmp_path / JOURNAL_FILENAME
+        path.write_text(json.dumps(_task_dict("TASK-1")) + "\nnot json\n" + json.dumps(_task_dict("TASK-2")) + "\n")
+        j = TaskJournal(str(path))
+        assert [r.key for r in j.iter_records()] == ["TASK-1", "TASK-2"]
+        j.close()
+
+    def test_skips_newer_schema_version(self, tmp_path):
+        newer = {**_task_dict("TASK-2"), "schema_version": 99}
+        path = tmp_path / JOURNAL_FILENAME
+        path.write_text(json.dumps(_task_dict("TASK-1")) + "\n" + json.dumps(newer) + "\n")
+        j = TaskJournal(str(path))
+        assert [r.key for r in j.iter_records()] == ["TASK-1"]
+        assert j.get("TASK-2") is None
+        j.close()
+
+
+class TestCompaction:
+    def test_compact_keeps_latest_records(self, journal):
+        journal.append(_task("TASK-1", "old"))
+        journal.append(_task("TASK-2"))
+        journal.append(_task("TASK-1", "new"))
+        journal.compact()
+
+        with open(journal.path) as f:
+            assert len(f.readlines()) == 2
+        assert [r.key for r in journal.iter_records()] == ["TASK-2", "TASK-1"]
+        assert journal.get("TASK-1").summary == "new"
+        journal.append(_task("TASK-3"))
+        assert journal.get("TASK-3") is not None
+
+    def test_compacts_automatically(self, journal, monkeypatch):
+        monkeypatch.setattr(task_journal, "COMPACT_MIN_DEAD", 3)
+        for n in range(5):
+            journal.append(_task("TASK-1", f"v{n}"))
+        with open(journal.path) as f:
+            assert len(f.readlines()) < 5
+        assert journal.get("TASK-1").summary == "v4"
+
+
+class TestLocator:
+    def test_round_trip(self, tmp_path):
+        j = open_journal(str(tmp_path))
+        assert parse_locator(j.locator("TASK-1")) == (str(tmp_path / JOURNAL_FILENAME), "TASK-1")
+
+    def test_plain_paths_are_not_locators(self, tmp_path):
+        assert parse_locator(str(tmp_path / "TASK-1.json")) is None
+        assert parse_locator(os.path.join("odd#dir", "TASK-1.json")) is None
@@ -0,0 +1,84 @@
+import json
+import os
+from datetime import date, datetime, timezone, timedelta
+
+import pytest
+
+import services.task_index as task_index
+from services.task_layout import (
+    partition_dir, task_file_path, recent_partitions, iter_task_paths, migrate_flat_layout, main,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_index_cache(monkeypatch):
+    monkeypatch.setattr(task_index, "_indexes", {})
+
+
+class TestPaths:
+    def test_partition_dir(self, tmp_path):
+        assert partition_dir(str(tmp_path), date(2025, 3, 7)) == str(tmp_path / "2025" / "03" / "07")
+
+    def test_task_file_path(self, tmp_path):
+        path = task_file_path(str(tmp_path), "TASK-1", "2025-03-07T23:59:00+00:00")
+        assert path == str(tmp_path / "2025" / "03" / "07" / "TASK-1.json")
+
+    def test_recent_partitions_only_existing(self, tmp_path):
+        today = datetime.now(timezone.utc).date()
+        for age in (0, 2, 9):
+            os.makedirs(partition_dir(str(tmp_path), today - timedelta(days=age)))
+        assert recent_partitions(str(tmp_path), days=7) == [
+            partition_dir(str(tmp_path), today),
+            partition_dir(str(tmp_path), today - timedelta(days=2)),
+        ]
+
+    def test_iter_task_paths_walks_all_layouts(self, tmp_path):
+        (tmp_path / "TASK-1.json").write_text("{}")
+        day = tmp_path / "2025" / "01" / "01"
+        day.mkdir(parents=True)
+        (day / "TASK-2.json").write_text("{}")
+        (tmp_path / "index.sqlite3").write_text("")
+        names = sorted(os.path.basename(p) for p in iter_task_paths(str(tmp_path)))
+        assert names == ["TASK-1.json", "TASK-2.json"]
+
+
+class TestMigrateFlatLayout:
+    def test_moves_tasks_into_partitions(self, tmp_path):
+        task = {"key": "TASK-1", "created_at": "2025-03-07T10:00:00+00:00"}
+        (tmp_path / "TASK-1.json").write_text(json.dumps(task))
+
+        assert migrate_flat_layout(str(tmp_path)) == 1
+        assert not (tmp_path / "TASK-1.json").exists()
+        moved = tmp_path / "2025" / "03" / "07" / "TASK-1.json"
+        assert json.loads(moved.read_text()) == task
+
+    def test_leaves_non_task_files(self, tmp_path):
+        (tmp_path / "playbook_params.json").write_text(json.dumps({"deploy": {"env": "prod"}}))
+        (tmp_path / "BAD.json").write_text("{{")
+        assert migrate_flat_layout(str(tmp_path)) == 0
+        assert (tmp_path / "playbook_params.json").exists()
+        assert (tmp_path / "BAD.json").exists()
+
+    def test_missing_created_at_uses_mtime(self, tmp_path):
+        path = tmp_path / "TASK-1.json"
+        path.write_text(json.dumps({"key": "TASK-1"}))
+        stamp = datetime(2024, 12, 31, 12, tzinfo=timezone.utc).timestamp()
+        os.utime(path, (stamp, stamp))
+
+        migrate_flat_layout(str(tmp_path))
+        assert (tmp_path / "2024" / "12" / "31" / "TASK-1.json").exists()
+
+    def test_is_idempotent(self, tmp_path):
+        (tmp_path / "TASK-1.json").write_text(json.dumps({"key": "TASK-1", "created_at": "2025-03-07T10:00:00"}))
+        migrate_flat_layout(str(tmp_path))
+        assert migrate_flat_layout(str(tmp_path)) == 0
+
+    def test_main_rebuilds_index(self, tmp_path, capsys):
+        task = {"key": "TASK-1", "summary": "Rotate keys", "created_at": "2025-03-07T10:00:00+00:00"}
+        (tmp_path / "TASK-1.json").write_text(json.dumps(task))
+        task_index.open_index(str(tmp_path))  # index now points at the flat file
+
+        assert main([str(tmp_path)]) == 0
+        [row] = task_index.open_index(str(tmp_path)).search("rotate")
+        assert row.path == str(tmp_path / "2025" / "03" / "07" / "TASK-1.json")
+        assert "Migrated 1 task(s)" in capsys.readouterr().out
@@ -1,11 +1,28 @@
 import json
 from datetime import datetime, timezone, timedelta
+from pathlib import Path
 
-from services.task_loader import load_todays_tasks
+from services.task_layout import partition_dir
+from services.task_loader import TaskRow, load_todays_tasks, load_task_rows, load_task
+
+
+def _today_dir(tmp_path):
+    path = Path(partition_dir(str(tmp_path), datetime.now(timezone.utc).date()))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def _write_task(tmp_path, filename, task):
-    (tmp_path / filename).write_text(json.dumps(task))
+    """Write task into the partition of its created_at (today if missing)."""
+    if "created_at" in task:
+        day = datetime.fromisoformat(task["created_at"]).date()
+        directory = Path(partition_dir(str(tmp_path), day))
+        directory.mkdir(parents=True, exist_ok=True)
+    else:
+        directory = _today_dir(tmp_path)
+    path = directory / filename
+    path.write_text(json.dumps(task))
+    return path
 
 
 class TestLoadTodaysTasks:
@@ -32,7 +49,7 @@ class TestLoadTodaysTasks:
 
         tasks = load_todays_tasks(str(tmp_path))
         assert len(tasks) == 1
-        assert tasks[0]["key"] == "TASK-1"
+        assert tasks[0].key == "TASK-1"
 
     def test_sorted_descending(self, tmp_path):
         now = datetime.now(timezone.utc)
@@ -51,11 +68,11 @@ class TestLoadTodaysTasks:
 
         tasks = load_todays_tasks(str(tmp_path))
         assert len(tasks) == 2
-        assert tasks[0]["key"] == "TASK-2"
-        assert tasks[1]["key"] == "TASK-1"
+        assert tasks[0].key == "TASK-2"
+        assert tasks[1].key == "TASK-1"
 
     def test_skips_malformed_json(self, tmp_path):
-        (tmp_path / "BAD.json").write_text("not json{{{")
+        (_today_dir(tmp_path) / "BAD.json").write_text("not json{{{")
         now = datetime.now(timezone.utc)
         _write_task(tmp_path, "TASK-1.json", {
             "key": "TASK-1", "summary": "Good",
@@ -66,6 +83,13 @@ class TestLoadTodaysTasks:
         tasks = load_todays_tasks(str(tmp_path))
         assert len(tasks) == 1
 
+    def test_skips_newer_schema_version(self, tmp_path):
+        now = datetime.now(timezone.utc).isoformat()
+        _write_task(tmp_path, "TASK-1.json", {"key": "TASK-1", "created_at": now, "schema_version": 1})
+        _write_task(tmp_path, "TASK-2.json", {"key": "TASK-2", "created_at": now, "schema_version": 99})
+
+        assert [t.key for t in load_todays_tasks(str(tmp_path))] == ["TASK-1"]
+
     def test_skips_missing_created_at(self, tmp_path):
         _write_task(tmp_path, "TASK-1.json", {
             "key": "TASK-1", "summary": "No date",
@@ -89,5 +113,58 @@ class TestLoadTodaysTasks:
 
         tasks = load_todays_tasks(str(tmp_path))
         assert len(tasks) == 2
-        keys = {t["key"] for t in tasks}
+        keys = {t.key for t in tasks}
         assert keys == {"MOCK-abc123", "TASK-1"}
+
+
+class TestLoadTaskRows:
+    def test_includes_recent_days_only(self, tmp_path):
+        now = datetime.now(timezone.utc)
+        for key, age in (("TASK-1", 0), ("TASK-2", 3), ("TASK-3", 10)):
+            _write_task(tmp_path, f"{key}.json", {
+                "key": key, "summary": f"{age} days old",
+                "description": "d", "type": "Task", "component": "Core",
+                "created_at": (now - timedelta(days=age)).isoformat(),
+            })
+
+        rows = load_task_rows(str(tmp_path), days=7)
+        assert [r.key for r in rows] == ["TASK-1", "TASK-2"]
+
+    def test_default_is_today(self, tmp_path):
+        now = datetime.now(timezone.utc)
+        _write_task(tmp_path, "TASK-1.json", {
+            "key": "TASK-1", "summary": "s", "created_at": now.isoformat(),
+        })
+        _write_task(tmp_path, "TASK-2.json", {
+            "key": "TASK-2", "summary": "s",
+            "created_at": (now - timedelta(days=1)).isoformat(),
+        })
+        assert [r.key for r in load_task_rows(str(tmp_path))] == ["TASK-1"]
+
+    def test_row_fields(self, tmp_path):
+        now = datetime.now(timezone.utc).isoformat()
+        path = _write_task(tmp_path, "TASK-1.json", {
+            "key": "TASK-1", "summary": "Sum", "description": "long text",
+            "created_at": now,
+        })
+        [row] = load_task_rows(str(tmp_path))
+        assert row == TaskRow("TASK-1", "Sum", now, str(path))
+
+    def test_ignores_flat_legacy_files(self, tmp_path):
+        now = datetime.now(timezone.utc).isoformat()
+        (tmp_path / "TASK-1.json").write_text(json.dumps({"key": "TASK-1", "created_at": now}))
+        assert load_task_rows(str(tmp_path)) == []
+
+    def test_nonexistent_dir(self, tmp_path):
+        assert load_task_rows(str(tmp_path / "nope")) == []
+
+
+class TestLoadTask:
+    def test_loads_full_task(self, tmp_path):
+        path = _write_task(tmp_path, "TASK-1.json", {"key": "TASK-1", "description": "full"})
+        assert load_task(str(path)).description == "full"
+
+    def test_missing_or_malformed_returns_none(self, tmp_path):
+        (tmp_path / "BAD.json").write_text("{{")
+        assert load_task(str(tmp_path / "BAD.json")) is None
+        assert load_task(str(tmp_path / "nope.json")) is None
@@ -1,9 +1,16 @@
+import json
+
 import pytest
 from unittest.mock import MagicMock
 
 from PySide6.QtCore import QCoreApplication
 
-from services.task_queue import TaskQueueWorker, TaskPayload
+from services.task_queue import (
+    TaskQueueWorker, TaskPayload, QUEUE_DEPTH, SUBMIT_FAILURES, SUBMIT_LATENCY,
+)
+from services import tracing
+from services.task_record import TaskRecord
+from services.task_service import BatchSubmitError
 
 
 @pytest.fixture(scope="session")
@@ -17,14 +24,14 @@ def qapp():
 @pytest.fixture
 def mock_jira():
     jira = MagicMock()
-    jira.submit_task.return_value = {
-        "key": "MOCK-1",
-        "url": "https://jira.example.com/browse/MOCK-1",
-        "summary": "Test",
-        "description": "Desc",
-        "type": "Task",
-        "component": "Core",
-    }
+    jira.submit_task.return_value = TaskRecord(
+        key="MOCK-1",
+        url="https://jira.example.com/browse/MOCK-1",
+        summary="Test",
+        description="Desc",
+        type="Task",
+        component="Core",
+    )
     return jira
 
 
@@ -39,6 +46,18 @@ def payload():
 
 
 class TestTaskQueueWorker:
+    def test_failed_save_is_reported(self, qapp, mock_jira):
+        worker = TaskQueueWorker(mock_jira)
+        errors = []
+        worker.task_failed.connect(lambda msg, p: errors.append((msg, p)))
+        failures = SUBMIT_FAILURES.value
+
+        record = TaskRecord("TASK-7", "Sum", "Desc", "Bug", "Core")
+        mock_jira.on_save_failed(record, OSError("disk full"))
+
+        assert errors == [("TASK-7 could not be saved: disk full", TaskPayload("Sum", "Desc", "Bug", "Core"))]
+        assert SUBMIT_FAILURES.value == failures + 1
+
     def test_enqueue_and_complete_signal(self, qapp, mock_jira, payload):
         worker = TaskQueueWorker(mock_jira)
         results = []
@@ -51,7 +70,7 @@ class TestTaskQueueWorker:
         qapp.processEvents()
 
         assert len(results) == 1
-        assert results[0]["key"] == "MOCK-1"
+        assert results[0].key == "MOCK-1"
         mock_jira.submit_task.assert_called_once_with(
             "Test task", "A description", "Task", "Core"
         )
@@ -74,19 +93,54 @@ class TestTaskQueueWorker:
         assert "Network error" in errors[0][0]
         assert errors[0][1] is payload
 
+    def test_metrics_track_depth_latency_and_failures(self, qapp, mock_jira, payload):
+        mock_jira.submit_task.side_effect = [mock_jira.submit_task.return_value, Exception("down")]
+        depth, failures, submits = QUEUE_DEPTH.value, SUBMIT_FAILURES.value, SUBMIT_LATENCY.count
+
+        worker = TaskQueueWorker(mock_jira)
+        worker.enqueue(payload)
+        worker.enqueue(payload)
+        assert QUEUE_DEPTH.value == depth + 2
+        worker.stop()
+        worker.start()
+        worker.wait(5000)
+        qapp.processEvents()
+
+        assert QUEUE_DEPTH.value == depth
+        assert SUBMIT_LATENCY.count == submits + 2
+        assert SUBMIT_FAILURES.value == failures + 1
+
+    def test_trace_continues_on_worker_thread(self, qapp, mock_jira, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        tracing.configure({"enabled": True, "path": str(path)})
+        try:
+            worker = TaskQueueWorker(mock_jira)
+            worker.enqueue(TaskPayload("Traced", "", "Task", "Core", trace_id="t1", parent_span_id="p1"))
+            worker.stop()
+            worker.start()
+            worker.wait(5000)
+            qapp.processEvents()
+        finally:
+            tracing.configure({})
+
+        spans = {s["name"]: s for s in map(json.loads, path.read_text().splitlines())}
+        assert set(spans) == {"queue.enqueue", "queue.wait", "queue.submit"}
+        assert all(s["trace_id"] == "t1" and s["parent_id"] == "p1" for s in spans.values())
+        assert spans["queue.submit"]["attributes"]["key"] == "MOCK-1"
+
     def test_multiple_tasks_processed_in_order(self, qapp, mock_jira):
         call_order = []
 
         def tracking_submit(summary, desc, itype, comp):
             call_order.append(summary)
-            return {
-                "key": f"MOCK-{len(call_order)}",
-                "url": f"https://jira.example.com/browse/MOCK-{len(call_order)}",
-                "summary": summary,
-                "description": desc,
-                "type": itype,
-                "component": comp,
-            }
+            return TaskRecord(
+                key=f"MOCK-{len(call_order)}",
+                url=f"https://jira.example.com/browse/MOCK-{len(call_order)}",
+                summary=summary,
+                description=desc,
+                type=itype,
+                component=comp,
+            )
 
         mock_jira.submit_task.side_effect = tracking_submit
 
@@ -115,14 +169,14 @@ class TestTaskQueueWorker:
         jira = MagicMock()
         jira.submit_task.side_effect = [
             Exception("Fail first"),
-            {
-                "key": "MOCK-2",
-                "url": "https://jira.example.com/browse/MOCK-2",
-                "summary": "Second",
-                "description": "Desc",
-                "type": "Task",
-                "component": "Core",
-            },
+            TaskRecord(
+                key="MOCK-2",
+                url="https://jira.example.com/browse/MOCK-2",
+                summary="Second",
+                description="Desc",
+                type="Task",
+                component="Core",
+            ),
         ]
 
         worker = TaskQueueWorker(jira)
@@ -141,4 +195,58 @@ class TestTaskQueueWorker:
         assert len(errors) == 1
         assert "Fail first" in errors[0]
         assert len(results) == 1
-        assert results[0]["key"] == "MOCK-2"
+        assert results[0].key == "MOCK-2"
+
+
+class TestEnqueueBatch:
+    def _run(self, qapp, worker, payloads):
+        completed, failed = [], []
+        worker.batch_completed.connect(completed.append)
+        worker.task_failed.connect(lambda msg, p: failed.append((msg, p)))
+        worker.enqueue_batch(payloads)
+        worker.stop()
+        worker.start()
+        worker.wait(5000)
+        qapp.processEvents()
+        return completed, failed
+
+    def test_submits_together(self, qapp, mock_jira, payload):
+        record = mock_jira.submit_task.return_value
+        mock_jira.submit_tasks.return_value = [record, record]
+        depth = QUEUE_DEPTH.value
+
+        completed, failed = self._run(qapp, TaskQueueWorker(mock_jira), [payload, payload])
+
+        mock_jira.submit_tasks.assert_called_once_with([
+            ("Test task", "A description", "Task", "Core"),
+            ("Test task", "A description", "Task", "Core"),
+        ])
+        assert completed == [[record, record]]
+        assert failed == []
+        assert QUEUE_DEPTH.value == depth
+
+    def test_partial_failure(self, qapp, mock_jira):
+        record = mock_jira.submit_task.return_value
+        mock_jira.submit_tasks.side_effect = BatchSubmitError([record], Exception("HTTP 503"))
+        payloads = [TaskPayload(f"Task {n}", "", "Task", "Core") for n in range(3)]
+        failures = SUBMIT_FAILURES.value
+
+        completed, failed = self._run(qapp, TaskQueueWorker(mock_jira), payloads)
+
+        assert completed == [[record]]
+        assert failed == [("HTTP 503", payloads[1]), ("HTTP 503", payloads[2])]
+        assert SUBMIT_FAILURES.value == failures + 2
+
+    def test_other_errors_fail_every_task(self, qapp, payload):
+        jira = MagicMock()
+        jira.submit_tasks.side_effect = OSError("disk full")
+
+        completed, failed = self._run(qapp, TaskQueueWorker(jira), [payload, payload])
+
+        assert completed == []
+        assert [msg for msg, _ in failed] == ["disk full", "disk full"]
+
+    def test_empty_batch_is_ignored(self, qapp, mock_jira):
+        worker = TaskQueueWorker(mock_jira)
+        worker.enqueue_batch([])
+        assert worker._queue.empty()
@@ -0,0 +1,46 @@
+import dataclasses
+from datetime import datetime
+
+import pytest
+
+from services.task_record import TaskRecord, SCHEMA_VERSION, UnsupportedSchemaError
+
+
+class TestTaskRecord:
+    def test_round_trip(self):
+        record = TaskRecord("TASK-1", "Sum", "Desc", "Bug", "Core", "/d/TASK-1.json",
+                            "2025-01-01T10:00:00+00:00")
+        assert TaskRecord.from_dict(record.to_dict()) == record
+
+    def test_to_dict_uses_stored_keys(self):
+        data = TaskRecord("TASK-1", type="Bug").to_dict()
+        assert data["type"] == "Bug"
+        assert data["schema_version"] == SCHEMA_VERSION
+
+    def test_from_legacy_dict(self):
+        record = TaskRecord.from_dict({
+            "key": "TASK-1", "summary": "Old", "description": None, "type": "Task",
+            "created_at": "2024-05-01T00:00:00+00:00", "extra": "ignored",
+        })
+        assert record.description == ""
+        assert record.component == ""
+        assert record.schema_version == SCHEMA_VERSION
+
+    def test_keeps_current_version(self):
+        record = TaskRecord.from_dict({"key": "TASK-1", "schema_version": SCHEMA_VERSION})
+        assert record.schema_version == SCHEMA_VERSION
+
+    @pytest.mark.parametrize("version", [SCHEMA_VERSION + 1, 0, "1", None])
+    def test_rejects_newer_or_invalid_version(self, version):
+        with pytest.raises(UnsupportedSchemaError, match="TASK-1"):
+            TaskRecord.from_dict({"key": "TASK-1", "summary": "s", "schema_version": version})
+
+    def test_created_at_defaults_to_now(self):
+        created = datetime.fromisoformat(TaskRecord("TASK-1").created_at)
+        assert created.tzinfo is not None
+
+    def test_is_frozen_and_slotted(self):
+        record = TaskRecord("TASK-1")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.summary = "changed"
+        assert not hasattr(record, "__dict__")
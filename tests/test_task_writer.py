@@ -0,0 +1,117 @@
+import json
+import os
+import threading
+
+import pytest
+
+import services.task_writer as task_writer
+from services.task_journal import TaskJournal, JOURNAL_FILENAME
+from services.task_record import TaskRecord
+from services.task_writer import TaskWriter, durability_mode, DEFAULT_DURABILITY
+
+
+@pytest.fixture
+def writer():
+    w = TaskWriter()
+    yield w
+    w.flush()
+
+
+@pytest.fixture
+def paused(writer, monkeypatch):
+    """Hold the writer thread before its next commit until the event is set."""
+    release = threading.Event()
+    commit = writer._commit
+
+    def held(group):
+        release.wait(5)
+        commit(group)
+
+    monkeypatch.setattr(writer, "_commit", held)
+    yield release
+    release.set()
+
+
+class TestDurabilityMode:
+    def test_default(self):
+        assert durability_mode({}) == DEFAULT_DURABILITY
+
+    def test_configured(self):
+        assert durability_mode({"task": {"durability": "fsync_dir"}}) == "fsync_dir"
+
+    def test_unknown_falls_back(self):
+        assert durability_mode({"task": {"durability": "paranoid"}}) == DEFAULT_DURABILITY
+
+
+class TestWriteFile:
+    @pytest.mark.parametrize("durability", ["none", "fsync", "fsync_dir"])
+    def test_writes_json(self, writer, tmp_path, durability):
+        path = str(tmp_path / "2025" / "01" / "01" / "TASK-1.json")
+        record = TaskRecord("TASK-1", "Sum")
+        future = writer.write_file(path, record, durability)
+        assert future.result(5) == path
+        assert json.loads(open(path).read()) == record.to_dict()
+        assert os.listdir(os.path.dirname(path)) == ["TASK-1.json"]
+
+    def test_failed_write_keeps_old_file(self, writer, tmp_path, monkeypatch):
+        path = tmp_path / "TASK-1.json"
+        path.write_text('{"key": "TASK-1", "summary": "old"}')
+
+        def crash(_fd):
+            raise OSError("disk gone")
+
+        monkeypatch.setattr(task_writer.os, "fsync", crash)
+        future = writer.write_file(str(path), TaskRecord("TASK-1", "new"), "fsync")
+        with pytest.raises(OSError, match="disk gone"):
+            future.result(5)
+        assert json.loads(path.read_text())["summary"] == "old"
+        assert os.listdir(tmp_path) == ["TASK-1.json"]
+
+    def test_pending_until_committed(self, writer, paused, tmp_path):
+        path = str(tmp_path / "TASK-1.json")
+        record = TaskRecord("TASK-1")
+        future = writer.write_file(path, record)
+        assert writer.pending(path) is record
+        assert not os.path.exists(path)
+
+        paused.set()
+        future.result(5)
+        assert writer.pending(path) is None
+
+
+class TestGroupCommit:
+    def test_queued_writes_commit_together(self, writer, paused, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr(task_writer, "fsync_dir", synced.append)
+
+        futures = [writer.write_file(str(tmp_path / f"TASK-{n}.json"), TaskRecord(f"TASK-{n}"), "fsync_dir")
+                   for n in range(20)]
+        paused.set()
+        for f in futures:
+            f.result(5)
+
+        assert writer.writes == 20
+        assert writer.groups <= 2
+        assert len(synced) == writer.groups  # one directory fsync per group, not per file
+
+    def test_journal_records_share_one_append(self, writer, paused, tmp_path, monkeypatch):
+        journal = TaskJournal(str(tmp_path / JOURNAL_FILENAME))
+        calls = []
+        append_many = journal.append_many
+
+        def counting(records, durability="none"):
+            calls.append((len(records), durability))
+            append_many(records, durability)
+
+        monkeypatch.setattr(journal, "append_many", counting)
+        futures = [writer.append_journal(journal, TaskRecord(f"TASK-{n}"), "none") for n in range(5)]
+        futures.append(writer.append_journal(journal, TaskRecord("TASK-5"), "fsync"))
+        paused.set()
+        for f in futures:
+            f.result(5)
+
+        assert sum(n for n, _ in calls) == 6
+        assert len(calls) <= 2
+        assert calls[-1][1] == "fsync"
+        assert len(journal.keys()) == 6
+        journal.close()
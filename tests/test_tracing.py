@@ -0,0 +1,94 @@
+import json
+import threading
+
+import pytest
+
+from services import tracing
+
+
+@pytest.fixture
+def span_file(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracing.configure({"enabled": True, "path": str(path)})
+    yield path
+    tracing.configure({})
+
+
+def _spans(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestSpans:
+    def test_nested_spans_share_trace(self, span_file):
+        with tracing.span("outer") as outer:
+            with tracing.span("inner", step=1) as inner:
+                assert tracing.current() is inner
+        assert tracing.current() is None
+
+        inner_data, outer_data = _spans(span_file)
+        assert inner_data["trace_id"] == outer_data["trace_id"] == outer.trace_id
+        assert inner_data["parent_id"] == outer.span_id
+        assert outer_data["parent_id"] == ""
+        assert inner_data["attributes"] == {"step": 1}
+        assert outer_data["duration"] >= inner_data["duration"] >= 0
+
+    def test_trace_handed_to_another_thread(self, span_file):
+        with tracing.span("submit") as parent:
+            pass
+
+        def worker():
+            with tracing.span("backend", parent.trace_id, parent.span_id):
+                pass
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        backend = _spans(span_file)[1]
+        assert backend["trace_id"] == parent.trace_id
+        assert backend["parent_id"] == parent.span_id
+
+    def test_exception_recorded(self, span_file):
+        with pytest.raises(ValueError):
+            with tracing.span("fails"):
+                raise ValueError("bad")
+        assert _spans(span_file)[0]["attributes"]["error"] == "ValueError: bad"
+
+    def test_record_requires_trace(self, span_file):
+        tracing.record("orphan", 1.0, 2.0, "")
+        tracing.record("wait", 1.0, 2.5, "t1", "p1")
+        (span,) = _spans(span_file)
+        assert span["name"] == "wait"
+        assert span["duration"] == 1.5
+
+    def test_disabled_writes_nothing(self, tmp_path):
+        tracing.configure({"enabled": False, "path": str(tmp_path / "t.jsonl")})
+        with tracing.span("ignored"):
+            pass
+        assert not (tmp_path / "t.jsonl").exists()
+
+
+class TestWaterfall:
+    def _trace(self):
+        return [
+            {"trace_id": "t", "span_id": "a", "parent_id": "", "name": "launcher.show",
+             "start": 100.0, "duration": 0.01, "attributes": {}},
+            {"trace_id": "t", "span_id": "c", "parent_id": "b", "name": "save_task_json",
+             "start": 100.5, "duration": 0.5, "attributes": {"key": "TASK-7"}},
+            {"trace_id": "t", "span_id": "b", "parent_id": "", "name": "queue.submit",
+             "start": 100.2, "duration": 0.8, "attributes": {}},
+        ]
+
+    def test_waterfall_orders_and_indents(self):
+        lines = tracing.waterfall(self._trace(), width=10).splitlines()
+        assert lines[0] == "trace t  1000.0ms  TASK-7"
+        assert lines[1].split()[0] == "launcher.show"
+        assert lines[2].split()[0] == "queue.submit"
+        assert lines[3].startswith("    save_task_json")
+        assert "|     █████|" in lines[3]
+
+    def test_cli_prints_last_traces(self, tmp_path, capsys):
+        path = tmp_path / "traces.jsonl"
+        path.write_text("".join(json.dumps(s) + "\n" for s in self._trace()) + '{"torn')
+        assert tracing.main([str(path)]) == 0
+        assert "queue.submit" in capsys.readouterr().out
+        assert tracing.main([str(path), "--trace", "missing"]) == 1
@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from PySide6.QtWidgets import QApplication
+
+from services.watchdog import StallWatchdog, STALLS
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def watchdog(qapp):
+    w = StallWatchdog(threshold_ms=50, heartbeat_ms=10)
+    w.start()
+    yield w
+    w.stop()
+
+
+def _pump(qapp, seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+def _blocking_call():
+    time.sleep(0.2)
+
+
+class TestStallWatchdog:
+    def test_records_stall_with_stack(self, qapp, watchdog):
+        stalls = STALLS.value
+        _pump(qapp, 0.05)
+        _blocking_call()
+        _pump(qapp, 0.05)
+
+        assert len(watchdog.events) == 1
+        event = watchdog.events[0]
+        assert 0.15 <= event.duration < 1
+        assert "_blocking_call" in event.stack
+        assert STALLS.value == stalls + 1
+
+    def test_responsive_loop_records_nothing(self, qapp, watchdog):
+        _pump(qapp, 0.2)
+        assert not watchdog.events
+
+    def test_zero_threshold_disables(self, qapp, watchdog):
+        watchdog.threshold_ms = 0
+        _pump(qapp, 0.02)
+        _blocking_call()
+        _pump(qapp, 0.05)
+        assert not watchdog.events
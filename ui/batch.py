@@ -0,0 +1,65 @@
+from PySide6.QtWidgets import QListWidget, QListWidgetItem, QAbstractItemView
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+
+DRAFT_ROLE = Qt.UserRole  # generated {"summary", "description", "type"}, None while pending
+
+
+class BatchList(QListWidget):
+    """Reviewable drafts of a batch of tasks.
+
+    Each row shows its pasted summary until the draft has been generated,
+    then the generated summary, checked. Unchecked rows are skipped;
+    double-click a row to edit its summary. The type and description are
+    shown in the tooltip.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFont(QFont("Helvetica Neue", 15))
+        self.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
+        self.setStyleSheet("""
+            QListWidget {
+                padding: 8px 16px;
+                border: none;
+                background: transparent;
+            }
+            QListWidget::item {
+                padding: 4px 0px;
+            }
+        """)
+
+    def set_summaries(self, summaries: list[str]):
+        self.clear()
+        for summary in summaries:
+            item = QListWidgetItem(f"… {summary}")
+            item.setFlags(Qt.ItemIsEnabled)
+            item.setForeground(Qt.gray)
+            item.setData(DRAFT_ROLE, None)
+            self.addItem(item)
+
+    def set_draft(self, row: int, draft: dict):
+        item = self.item(row)
+        if item is None:
+            return
+        item.setData(DRAFT_ROLE, draft)
+        item.setText(draft["summary"])
+        item.setToolTip(f"{draft['type']}\n\n{draft['description']}")
+        item.setData(Qt.ForegroundRole, None)
+        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Checked)
+
+    def pending(self) -> int:
+        """Number of drafts still being generated."""
+        return sum(1 for i in range(self.count()) if self.item(i).data(DRAFT_ROLE) is None)
+
+    def checked_drafts(self) -> list[dict]:
+        """Generated, checked drafts in list order, with any edited summaries."""
+        drafts = []
+        for i in range(self.count()):
+            item = self.item(i)
+            draft = item.data(DRAFT_ROLE)
+            if draft is None or item.checkState() != Qt.Checked:
+                continue
+            drafts.append({**draft, "summary": item.text().strip() or draft["summary"]})
+        return drafts
@@ -1,14 +1,54 @@
 from PySide6.QtWidgets import (
-    QWidget, QHBoxLayout, QVBoxLayout, QLabel,
-    QListWidget, QTextEdit, QStackedWidget,
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit,
+    QListView, QTextEdit, QStackedWidget,
     QGraphicsDropShadowEffect, QApplication,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QEvent, QTimer
 from PySide6.QtGui import QFont, QColor, QCursor
 
+from services.task_loader import TaskRow, load_task
+from services.task_record import TaskRecord
+
+
+class TaskListModel(QAbstractListModel):
+    """List model over lightweight TaskRows (key and summary only)."""
 
-class TaskDashboard(QWidget):
     def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[TaskRow] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{row.key}: {row.summary}"
+        if role == Qt.ToolTipRole:
+            return row.summary
+        return None
+
+    def set_rows(self, rows: list[TaskRow]):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def prepend(self, row: TaskRow):
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, row)
+        self.endInsertRows()
+
+    def row_at(self, i: int) -> TaskRow | None:
+        return self._rows[i] if 0 <= i < len(self._rows) else None
+
+
+SEARCH_DELAY_MS = 150
+
+
+class TaskDashboard(QWidget):
+    def __init__(self, parent=None, days: int = 7, search=None):
         super().__init__(parent)
         self.setWindowFlags(
             Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool
@@ -16,7 +56,14 @@ class TaskDashboard(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setFixedSize(750, 500)
 
-        self._tasks = []
+        self._days = days
+        self._search = search  # callable(text) -> list[TaskRow], or None
+        self._recent_rows: list[TaskRow] = []
+        self._model = TaskListModel(self)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._run_search)
         self._init_ui()
 
     def _init_ui(self):
@@ -51,26 +98,41 @@ class TaskDashboard(QWidget):
         left_layout.setContentsMargins(16, 16, 0, 16)
         left_layout.setSpacing(4)
 
-        header = QLabel("Today's Tasks")
+        header = QLabel("Today's Tasks" if self._days <= 1 else "Recent Tasks")
         header.setFont(QFont("Helvetica Neue", 16, QFont.Bold))
         left_layout.addWidget(header)
 
         from datetime import datetime, timezone
-        self._date_label = QLabel(datetime.now(timezone.utc).strftime("%A, %B %d"))
+        date_text = (
+            datetime.now(timezone.utc).strftime("%A, %B %d")
+            if self._days <= 1 else f"Last {self._days} days"
+        )
+        self._date_label = QLabel(date_text)
         self._date_label.setStyleSheet("color: #888; font-size: 12px;")
         left_layout.addWidget(self._date_label)
         left_layout.addSpacing(8)
 
-        self._list = QListWidget()
+        self._search_input = QLineEdit()
+        self._search_input.setPlaceholderText("Search all tasks...")
+        self._search_input.setClearButtonEnabled(True)
+        self._search_input.setStyleSheet("font-size: 13px; padding: 4px; margin-right: 16px;")
+        self._search_input.textChanged.connect(lambda _text: self._search_timer.start())
+        self._search_input.setVisible(self._search is not None)
+        left_layout.addWidget(self._search_input)
+
+        self._list = QListView()
+        self._list.setModel(self._model)
+        self._list.setUniformItemSizes(True)
+        self._list.setEditTriggers(QListView.NoEditTriggers)
         self._list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: none;
                 font-size: 13px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 6px 4px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: palette(highlight);
                 color: palette(highlighted-text);
                 border-radius: 6px;
@@ -83,10 +145,10 @@ class TaskDashboard(QWidget):
         self._stack = QStackedWidget()
 
         # Empty state
-        empty = QLabel("No tasks created today")
-        empty.setAlignment(Qt.AlignCenter)
-        empty.setStyleSheet("color: #888; font-size: 14px;")
-        self._stack.addWidget(empty)  # index 0
+        self._empty_label = QLabel(self._empty_text())
+        self._empty_label.setAlignment(Qt.AlignCenter)
+        self._empty_label.setStyleSheet("color: #888; font-size: 14px;")
+        self._stack.addWidget(self._empty_label)  # index 0
 
         # Content view
         detail = QWidget()
@@ -108,7 +170,7 @@ class TaskDashboard(QWidget):
             "color: #555; font-size: 12px; text-decoration: underline;"
         )
         self._key_label.setCursor(QCursor(Qt.PointingHandCursor))
-        self._key_label.mousePressEvent = self._copy_key
+        self._key_label.installEventFilter(self)
         meta_line.addWidget(self._key_label)
 
         self._meta_label = QLabel()
@@ -134,42 +196,87 @@ class TaskDashboard(QWidget):
 
         outer.addWidget(container)
 
-        self._list.currentRowChanged.connect(self._on_row_changed)
+        self._list.selectionModel().currentRowChanged.connect(
+            lambda current, _previous: self._on_row_changed(current.row())
+        )
 
-    def load_tasks(self, tasks: list[dict]):
-        self._tasks = tasks
-        self._list.clear()
-        self._description.clear()
-        self._title_label.clear()
-        self._key_label.clear()
-        self._meta_label.clear()
+    def eventFilter(self, obj, event):
+        if obj is self._key_label and event.type() == QEvent.Type.MouseButtonPress:
+            self._copy_key()
+            return True
+        return super().eventFilter(obj, event)
+
+    def _empty_text(self):
+        if self._search_input_text():
+            return "No matching tasks"
+        if self._days <= 1:
+            return "No tasks created today"
+        return f"No tasks in the last {self._days} days"
+
+    def _search_input_text(self):
+        return self._search_input.text().strip()
 
-        if not tasks:
+    def load_tasks(self, rows: list[TaskRow]):
+        self._recent_rows = list(rows)
+        if self._search_input_text():
+            self._run_search()
+        else:
+            self._show_rows(self._recent_rows)
+
+    def _show_rows(self, rows: list[TaskRow]):
+        self._model.set_rows(rows)
+        self._clear_detail()
+
+        if not rows:
+            self._empty_label.setText(self._empty_text())
             self._stack.setCurrentIndex(0)
             return
 
         self._stack.setCurrentIndex(1)
-        for task in tasks:
-            key = task.get("key", "")
-            summary = task.get("summary", "")
-            self._list.addItem(f"{key}: {summary}")
+        self._select_row(0)
 
-        self._list.setCurrentRow(0)
+    def add_task(self, row: TaskRow):
+        """Insert a newly created task at the top without reloading from disk."""
+        self._recent_rows.insert(0, row)
+        if self._search_input_text():
+            return
+        self._model.prepend(row)
+        if self._stack.currentIndex() == 0:
+            self._stack.setCurrentIndex(1)
+            self._select_row(0)
+
+    def _run_search(self):
+        self._search_timer.stop()
+        text = self._search_input_text()
+        if not text or self._search is None:
+            self._show_rows(self._recent_rows)
+            return
+        self._show_rows(self._search(text))
+
+    def _select_row(self, row):
+        self._list.setCurrentIndex(self._model.index(row, 0))
+
+    def _clear_detail(self):
+        self._description.clear()
+        self._title_label.clear()
+        self._key_label.clear()
+        self._meta_label.clear()
 
     def _on_row_changed(self, row):
-        if row < 0 or row >= len(self._tasks):
+        entry = self._model.row_at(row)
+        if entry is None:
             return
-        task = self._tasks[row]
-        self._title_label.setText(task.get("summary", ""))
-        key = task.get("key", "")
-        self._key_label.setText(key)
+        # Descriptions are only read from disk for the selected task
+        task = load_task(entry.path) or TaskRecord(entry.key, entry.summary)
+        self._title_label.setText(task.summary or entry.summary)
+        self._key_label.setText(entry.key)
         parts = filter(None, [
-            task.get("type"),
-            task.get("component"),
+            task.type,
+            task.component,
         ])
         suffix = " | ".join(parts)
         self._meta_label.setText(f"  |  {suffix}" if suffix else "")
-        self._description.setPlainText(task.get("description", ""))
+        self._description.setPlainText(task.description)
 
     def _copy_key(self, _event=None):
         key = self._key_label.text()
@@ -182,6 +289,9 @@ class TaskDashboard(QWidget):
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
+            if self._search_input_text():
+                self._search_input.clear()
+                return
             self.hide()
         else:
             super().keyPressEvent(event)
@@ -0,0 +1,85 @@
+from PySide6.QtWidgets import (
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QHeaderView, QPushButton,
+)
+from PySide6.QtCore import QTimer, Slot
+
+from services.metrics import REGISTRY
+
+REFRESH_INTERVAL_MS = 1000
+
+
+def _format_seconds(seconds) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 0.001:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds * 1e6:.0f}us"
+
+
+def format_metric(snapshot: dict) -> str:
+    """One-line summary of a metric snapshot from ``Registry.snapshot()``."""
+    if snapshot["type"] != "histogram":
+        value = snapshot["value"]
+        return f"{value:.1f}" if isinstance(value, float) else str(value)
+    if not snapshot["count"]:
+        return "no data"
+    if snapshot["name"].endswith("_seconds"):
+        fmt = _format_seconds
+    else:
+        fmt = "{:.1f}".format
+    return (
+        f"{snapshot['count']} calls, mean {fmt(snapshot['mean'])}, "
+        f"p50 <= {fmt(snapshot['p50'])}, p99 <= {fmt(snapshot['p99'])}, max {fmt(snapshot['max'])}"
+    )
+
+
+class DiagnosticsDialog(QDialog):
+    """Live view of the in-process metrics, refreshed every second."""
+
+    def __init__(self, parent=None, registry=REGISTRY):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.setMinimumSize(700, 400)
+        self._registry = registry
+
+        self.table = QTableWidget(0, 2)
+        self.table.setHorizontalHeaderLabels(["Metric", "Value"])
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+
+        copy_button = QPushButton("Copy as Prometheus text")
+        copy_button.clicked.connect(self.copy_metrics)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(copy_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addLayout(buttons)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start()
+        self.refresh()
+
+    @Slot()
+    def refresh(self):
+        snapshot = self._registry.snapshot()
+        self.table.setRowCount(len(snapshot))
+        for row, (name, metric) in enumerate(snapshot.items()):
+            name_item = QTableWidgetItem(name)
+            name_item.setToolTip(metric["help"])
+            self.table.setItem(row, 0, name_item)
+            self.table.setItem(row, 1, QTableWidgetItem(format_metric({"name": name, **metric})))
+
+    @Slot()
+    def copy_metrics(self):
+        QApplication.clipboard().setText(self._registry.render())
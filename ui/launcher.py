@@ -1,5 +1,8 @@
 # ui/launcher.py
+import contextvars
+import functools
 import logging
+import threading
 import traceback
 
 from PySide6.QtWidgets import (
@@ -9,37 +12,64 @@ from PySide6.QtWidgets import (
     QStyle, QStyledItemDelegate, QStyleOptionViewItem,
     QGraphicsDropShadowEffect, QSystemTrayIcon, QMenu
 )
-from PySide6.QtCore import Qt, QTimer, Slot, QEvent
+from PySide6.QtCore import Qt, QTimer, Signal, Slot, QEvent
 from PySide6.QtGui import (
     QFont, QClipboard, QColor, QIcon, QAction, QCursor,
     QTextCharFormat, QTextCursor, QGuiApplication
 )
 
-from services.parser import parse_task_text
+from services.parser import parse_task_text, split_batch
 from services.jira_service import JiraService
+from services.journal_service import JournalService
 from services.json_service import JsonService
 from services.task_generator_service import TaskGeneratorService
 from services.task_queue import TaskQueueWorker, TaskPayload
-from services.task_loader import load_todays_tasks
+from services.task_loader import TaskRow, load_task_rows
+from services.task_index import open_index
+from services.task_layout import utc_today
 from services.playbook_loader import load_playbooks
 from services.config import load_config, get_resource_path
+from services.watchdog import DEFAULT_THRESHOLD_MS, StallWatchdog
+from services import metrics, profiler, tracing
 
 from ui.toast import ToastMessage
+from ui.batch import BatchList
 from ui.styles import NoCheckmarkBoldSelectedDelegate
 from ui.config import ConfigEditorDialog
+from ui.diagnostics import DiagnosticsDialog
 from ui.dashboard import TaskDashboard
 from ui.playbook_dashboard import PlaybookDashboard
 
 logger = logging.getLogger(__name__)
 
 MAX_CLIPBOARD_LENGTH = 500
+DEFAULT_DASHBOARD_DAYS = 7
+SUBMIT_HINT = "Press Shift+Enter to submit"
 
 BACKENDS = {
     "jira": JiraService,
     "json": JsonService,
+    "journal": JournalService,
 }
 
 
+def _traced(name, new_trace=False):
+    """Run a CtrlLord method as a span of the current task's trace.
+
+    With ``new_trace``, a trace is started first unless a task is already
+    being edited.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if new_trace and self.step == 0:
+                self._trace_id = tracing.new_trace_id()
+            with tracing.span(name, self._trace_id):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 def _create_task_service():
     config = load_config()
     backend = config.get("task", {}).get("backend", "json")
@@ -50,6 +80,9 @@ def _create_task_service():
 
 
 class CtrlLord(QWidget):
+    _profile_finished = Signal(object)  # (collapsed_path, tracemalloc_path) or exception
+    _draft_generated = Signal(int, int, object)  # (batch id, row, payload) from the generator pool
+
     def __init__(self):
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
@@ -58,6 +91,13 @@ class CtrlLord(QWidget):
 
         self.step = 0
         self._active_toasts = []
+        self._dashboard_days = DEFAULT_DASHBOARD_DAYS
+        self._dashboard_loaded_for = None  # UTC day the dashboard rows were loaded on
+        self._metrics_server = None
+        self._metrics_port = None
+        self._trace_id = ""
+        self._batch_id = 0
+        self._draft_summary = ""  # input the current draft was generated from
 
         self.generator = TaskGeneratorService()
         self.task_service = _create_task_service()
@@ -65,12 +105,17 @@ class CtrlLord(QWidget):
         self._worker = TaskQueueWorker(self.task_service)
         self._worker.task_completed.connect(self._on_task_completed)
         self._worker.task_failed.connect(self._on_task_failed)
+        self._worker.batch_completed.connect(self._on_batch_completed)
         self._worker.start()
 
         QApplication.instance().aboutToQuit.connect(self._shutdown_worker)
 
+        self._watchdog = StallWatchdog(parent=self)
+        self._profile_finished.connect(self._on_profile_finished)
+        self._draft_generated.connect(self._on_draft_generated)
         self.init_ui()
         self.create_tray()
+        self._watchdog.start()
 
     def create_tray(self):
         # Load tray icon
@@ -86,7 +131,7 @@ class CtrlLord(QWidget):
         open_action = QAction("Create Task", self)
         open_action.triggered.connect(self.show_launcher)
         menu.addAction(open_action)
-        dashboard_action = QAction("Today's Tasks", self)
+        dashboard_action = QAction("Recent Tasks", self)
         dashboard_action.triggered.connect(self.toggle_dashboard)
         menu.addAction(dashboard_action)
         playbook_action = QAction("Playbooks", self)
@@ -96,6 +141,12 @@ class CtrlLord(QWidget):
         settings_action = QAction("Settings", self)
         settings_action.triggered.connect(self.show_config)
         menu.addAction(settings_action)
+        diagnostics_action = QAction("Diagnostics", self)
+        diagnostics_action.triggered.connect(self.show_diagnostics)
+        menu.addAction(diagnostics_action)
+        self._profile_action = QAction(f"Profile for {profiler.DEFAULT_DURATION}s", self)
+        self._profile_action.triggered.connect(lambda: self.start_profile())
+        menu.addAction(self._profile_action)
         menu.addSeparator()
         quit_action = QAction("Quit", self)
         quit_action.triggered.connect(QApplication.quit)
@@ -113,7 +164,7 @@ class CtrlLord(QWidget):
                     if obj == self.input:
                         self.handle_enter()
                         return True
-                    elif obj == self.textarea and event.modifiers() & Qt.ShiftModifier:
+                    elif obj in (self.textarea, self.batch_list) and event.modifiers() & Qt.ShiftModifier:
                         self.handle_enter()
                         return True
                     # Otherwise: allow Enter to insert newline in textarea
@@ -128,7 +179,11 @@ class CtrlLord(QWidget):
         margins = self.layout.contentsMargins()
         spacing = self.layout.spacing()
 
-        content_height = int(doc.size().height()) + 100  # Padding for cursor, scrollbar, etc.
+        if self.step == 2:
+            rows = self.batch_list.count()
+            content_height = max(0, self.batch_list.sizeHintForRow(0)) * rows + 60
+        else:
+            content_height = int(doc.size().height()) + 100  # Padding for cursor, scrollbar, etc.
         component_height = self.component_line.sizeHint().height()
         base_height = self.input.height() if self.step == 0 else 0
 
@@ -140,6 +195,13 @@ class CtrlLord(QWidget):
     def reset_ui(self):
         self.textarea.clear()
         self.input.clear()
+        self._batch_id += 1  # drop drafts still being generated
+        self.batch_list.clear()
+        self.batch_list.hide()
+        self.textarea.show()
+        self.type_label.show()
+        self.type_dropdown.show()
+        self.hint.setText(SUBMIT_HINT)
         self.details_section.hide()
         self.input.show()
         self.setFixedHeight(180)
@@ -161,12 +223,42 @@ class CtrlLord(QWidget):
             self.show_toast(str(e))
             return
 
+        self._update_metrics_server(config.get("metrics", {}))
+        tracing.configure(config.get("tracing", {}))
+
+        # Re-read the task list from disk next time the dashboard opens
+        self._dashboard_loaded_for = None
+        days = config["ui"].get("dashboard_days", DEFAULT_DASHBOARD_DAYS)
+        if days != self._dashboard_days and hasattr(self, "_dashboard"):
+            self._dashboard.deleteLater()
+            del self._dashboard
+        self._dashboard_days = days
+        self._watchdog.threshold_ms = config["ui"].get("stall_threshold_ms", DEFAULT_THRESHOLD_MS)
+
         logger.info("UI reloading categories")
         self.type_dropdown.clear()
         self.type_dropdown.addItems(config["ui"]["issue_types"])
         self.component_dropdown.clear()
         self.component_dropdown.addItems(config["ui"]["components"])
 
+    def _update_metrics_server(self, metrics_cfg):
+        """Start, stop or move the /metrics endpoint to match ``[metrics]``."""
+        port = metrics_cfg.get("port", metrics.DEFAULT_PORT) if metrics_cfg.get("enabled") else None
+        if port == self._metrics_port:
+            return
+        if self._metrics_server is not None:
+            self._metrics_server.shutdown()
+            self._metrics_server.server_close()
+            self._metrics_server = None
+        self._metrics_port = None
+        if port is None:
+            return
+        try:
+            self._metrics_server = metrics.serve(port)
+            self._metrics_port = port
+        except OSError as e:
+            logger.error("Could not serve metrics on port %s: %s", port, e)
+
     def init_ui(self):
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(20, 20, 20, 20)
@@ -227,9 +319,9 @@ class CtrlLord(QWidget):
         self.details_section.setGraphicsEffect(shadow)
 
         # hint
-        hint = QLabel("Press Shift+Enter to submit")
-        hint.setStyleSheet("color: #888; font-size: 11px; padding-top: 10px; padding-left: 20px;")
-        self.details_layout.addWidget(hint)
+        self.hint = QLabel(SUBMIT_HINT)
+        self.hint.setStyleSheet("color: #888; font-size: 11px; padding-top: 10px; padding-left: 20px;")
+        self.details_layout.addWidget(self.hint)
 
         # Description
         self.textarea = QTextEdit()
@@ -245,6 +337,12 @@ class CtrlLord(QWidget):
         self.details_layout.addWidget(self.textarea)
         self.textarea.textChanged.connect(self.adjust_height_to_content)
 
+        # Batch mode: generated drafts of several pasted action items
+        self.batch_list = BatchList()
+        self.batch_list.installEventFilter(self)
+        self.batch_list.hide()
+        self.details_layout.addWidget(self.batch_list)
+
         # Component line
         self.component_line = QWidget()
         self.component_line.setFixedHeight(32)
@@ -253,8 +351,8 @@ class CtrlLord(QWidget):
         self.component_layout.setSpacing(6)
 
         # Issue Type line
-        type_label = QLabel("Type:")
-        type_label.setFont(QFont("Helvetica Neue", 13))
+        self.type_label = QLabel("Type:")
+        self.type_label.setFont(QFont("Helvetica Neue", 13))
         self.type_dropdown = QComboBox()
         self.type_dropdown.setItemDelegate(NoCheckmarkBoldSelectedDelegate(self.type_dropdown))
         self.type_dropdown.setStyleSheet("""
@@ -275,7 +373,8 @@ class CtrlLord(QWidget):
                 font-weight: normal;
             }
         """)
-        self.component_layout.addWidget(type_label)
+        self.type_dropdown.activated.connect(self._on_type_activated)
+        self.component_layout.addWidget(self.type_label)
         self.component_layout.addWidget(self.type_dropdown)
 
 
@@ -306,13 +405,22 @@ class CtrlLord(QWidget):
             self.prepare_task_preview()
         elif self.step == 1:
             self.submit_task()
+        elif self.step == 2:
+            self.submit_batch()
 
+    @_traced("launcher.prepare_task_preview")
     def prepare_task_preview(self):
         summary = self.input.text().strip()
         if not summary:
             self.show_toast("Please enter a task summary")
             return
 
+        items = split_batch(summary)
+        if len(items) > 1:
+            self.prepare_batch_preview(items)
+            return
+
+        self._draft_summary = summary
         task_generated_data = self.generator.build_task_payload(summary)
 
         # Use first component from dropdown as default instead of hardcoded value
@@ -330,6 +438,20 @@ class CtrlLord(QWidget):
         # Show step 2 fields
         self.details_section.show()
 
+        self._show_draft_text()
+
+        type_index = self.type_dropdown.findText(self.task_data["type"])
+        if type_index >= 0:
+            self.type_dropdown.setCurrentIndex(type_index)
+
+        index = self.component_dropdown.findText(self.task_data["component"])
+        if index >= 0:
+            self.component_dropdown.setCurrentIndex(index)
+
+        self.step = 1
+
+    def _show_draft_text(self):
+        self.textarea.clear()
         cursor = self.textarea.textCursor()
 
         summary_text = self.task_data["summary"] or ""
@@ -343,19 +465,107 @@ class CtrlLord(QWidget):
         cursor.insertText(description_text, default_format)
 
         self.textarea.setTextCursor(cursor)
+        self.textarea.document().setModified(False)
         self.textarea.setFocus()
         QTimer.singleShot(0, self.adjust_height_to_content)
 
-        type_index = self.type_dropdown.findText(self.task_data["type"])
-        if type_index >= 0:
-            self.type_dropdown.setCurrentIndex(type_index)
+    @Slot(int)
+    def _on_type_activated(self, index):
+        # A draft generated before the type was known is regenerated with the
+        # chosen type's own prompt template, unless it has been edited
+        issue_type = self.type_dropdown.itemText(index)
+        if self.step != 1 or self.textarea.document().isModified():
+            return
+        if self.generator.has_issue_type_template(issue_type):
+            self.regenerate_draft(issue_type)
+
+    @_traced("launcher.regenerate_draft")
+    def regenerate_draft(self, issue_type: str):
+        generated = self.generator.build_task_payload(self._draft_summary, issue_type=issue_type)
+        self.task_data.update(
+            type=issue_type,
+            summary=generated.get("summary", self._draft_summary),
+            description=generated.get("description", ""),
+        )
+        self._show_draft_text()
 
-        index = self.component_dropdown.findText(self.task_data["component"])
-        if index >= 0:
-            self.component_dropdown.setCurrentIndex(index)
+    def prepare_batch_preview(self, summaries: list[str]):
+        """Show one draft per action item and generate them in the background."""
+        self._batch_id += 1
+        self.input.hide()
+        self.textarea.hide()
+        self.type_label.hide()
+        self.type_dropdown.hide()
+        self.batch_list.set_summaries(summaries)
+        self.batch_list.show()
+        self.details_section.show()
+        self.batch_list.setFocus()
+        self.step = 2
+        self._update_batch_hint()
+        QTimer.singleShot(0, self.adjust_height_to_content)
 
-        self.step = 1
+        batch_id = self._batch_id
+
+        def on_payload(row, payload):
+            self._draft_generated.emit(batch_id, row, payload)
 
+        # The generator's LLM spans join this task's trace
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run, args=(self.generator.build_task_payloads, summaries, on_payload),
+            name="batch-generator", daemon=True,
+        ).start()
+
+    @Slot(int, int, object)
+    def _on_draft_generated(self, batch_id, row, payload):
+        if batch_id != self._batch_id:
+            return
+        issue_type = payload.get("type", "Task")
+        if self.type_dropdown.findText(issue_type) < 0 and self.type_dropdown.count() > 0:
+            issue_type = self.type_dropdown.itemText(0)
+        self.batch_list.set_draft(row, {
+            "summary": payload.get("summary", ""),
+            "description": payload.get("description", ""),
+            "type": issue_type,
+        })
+        self._update_batch_hint()
+
+    def _update_batch_hint(self):
+        pending = self.batch_list.pending()
+        count = self.batch_list.count()
+        if pending:
+            self.hint.setText(f"Generating {pending} of {count} tasks...")
+        else:
+            self.hint.setText(f"{count} tasks · uncheck to skip, double-click to edit · "
+                              f"Shift+Enter to submit")
+
+    @_traced("launcher.submit_batch")
+    def submit_batch(self):
+        pending = self.batch_list.pending()
+        if pending:
+            self.show_toast(f"Still generating {pending} task(s)...")
+            return
+        drafts = self.batch_list.checked_drafts()
+        if not drafts:
+            self.show_toast("No tasks selected")
+            return
+
+        component = self.component_dropdown.currentText()
+        parent_span_id = tracing.current().span_id
+        self._worker.enqueue_batch([
+            TaskPayload(
+                summary=draft["summary"],
+                description=draft["description"],
+                issue_type=draft["type"],
+                component=component,
+                trace_id=self._trace_id,
+                parent_span_id=parent_span_id,
+            )
+            for draft in drafts
+        ])
+        self.reset_ui()
+
+    @_traced("launcher.submit_task")
     def submit_task(self):
         summary, description = parse_task_text(self.textarea.toPlainText())
 
@@ -371,14 +581,16 @@ class CtrlLord(QWidget):
             description=description,
             issue_type=issue_type,
             component=component,
+            trace_id=self._trace_id,
+            parent_span_id=tracing.current().span_id,
         )
         self._worker.enqueue(payload)
         self.reset_ui()
 
-    @Slot(dict)
-    def _on_task_completed(self, result):
-        jira_url = result.get("url")
-        task_key = result.get("key")
+    @Slot(object)
+    def _on_task_completed(self, record):
+        jira_url = record.url
+        task_key = record.key
         toast_text = f'Task <a href="{jira_url}">{task_key}</a> created (copied)'
 
         try:
@@ -388,6 +600,32 @@ class CtrlLord(QWidget):
             toast_text = "Task created, but clipboard copy failed."
 
         self._show_background_toast(toast_text)
+        self._add_to_dashboard(record)
+
+    @Slot(object)
+    def _on_batch_completed(self, records):
+        links = ", ".join(f'<a href="{record.url}">{record.key}</a>' for record in records)
+        toast_text = f"{len(records)} tasks created: {links} (copied)"
+        try:
+            QApplication.clipboard().setText("\n".join(record.key for record in records))
+        except Exception as e:
+            logger.warning("Clipboard copy failed: %s", e)
+            toast_text = f"{len(records)} tasks created, but clipboard copy failed."
+
+        self._show_background_toast(toast_text)
+        for record in records:
+            self._add_to_dashboard(record)
+
+    def _add_to_dashboard(self, record):
+        data_dir = getattr(self.task_service, "data_dir", "")
+        # A stale list is reloaded from disk when the dashboard next opens
+        if self._dashboard_loaded_for == utc_today() and data_dir:
+            self._dashboard.add_task(TaskRow(
+                record.key,
+                record.summary,
+                record.created_at,
+                self.task_service.task_path(record.key, record.created_at),
+            ))
 
     @Slot(str, object)
     def _on_task_failed(self, error, payload):
@@ -413,6 +651,8 @@ class CtrlLord(QWidget):
     def _shutdown_worker(self):
         self._worker.stop()
         self._worker.wait(5000)
+        self._watchdog.stop()
+        self._update_metrics_server({})
 
     def fix_screen_position(self):
         screen = QGuiApplication.primaryScreen().availableGeometry()
@@ -423,22 +663,34 @@ class CtrlLord(QWidget):
     @Slot()
     def toggle_dashboard(self):
         if not hasattr(self, "_dashboard"):
-            self._dashboard = TaskDashboard()
+            self._dashboard = TaskDashboard(days=self._dashboard_days, search=self._search_tasks)
+            self._dashboard_loaded_for = None
 
         if self._dashboard.isVisible():
             self._dashboard.hide()
             return
 
-        config = load_config()
-        data_dir = config.get("task", {}).get("data_dir", "~/.config/CtrlLord/data")
-        tasks = load_todays_tasks(data_dir)
-        self._dashboard.load_tasks(tasks)
+        # Later tasks are added incrementally by _on_task_completed; after
+        # midnight (UTC) the rows are for the wrong days and are re-read
+        today = utc_today()
+        if self._dashboard_loaded_for != today:
+            data_dir = getattr(self.task_service, "data_dir", "") or "~/.config/CtrlLord/data"
+            self._dashboard.load_tasks(load_task_rows(data_dir, self._dashboard_days))
+            self._dashboard_loaded_for = today
 
         screen = QGuiApplication.primaryScreen().availableGeometry()
         x = (screen.width() - self._dashboard.width()) // 2
         y = int(screen.height() * 0.1) + self.height() + 10
         self._dashboard.show_at(x, y)
 
+    def _search_tasks(self, text):
+        data_dir = getattr(self.task_service, "data_dir", "") or "~/.config/CtrlLord/data"
+        try:
+            return open_index(data_dir).search(text)
+        except Exception as e:
+            logger.error("Task search failed: %s", e)
+            return []
+
     @Slot()
     def toggle_playbook_dashboard(self):
         if not hasattr(self, "_playbook_dashboard"):
@@ -471,6 +723,32 @@ class CtrlLord(QWidget):
             self.refresh_from_config()
 
     @Slot()
+    def show_diagnostics(self):
+        if not hasattr(self, "_diagnostics"):
+            self._diagnostics = DiagnosticsDialog()
+        self._diagnostics.show()
+        self._diagnostics.raise_()
+        self._diagnostics.activateWindow()
+
+    def start_profile(self, duration: float = profiler.DEFAULT_DURATION):
+        """Profile all threads in the background; a toast shows where the results went."""
+        if not self._profile_action.isEnabled():
+            logger.info("A profile is already running")
+            return
+        self._profile_action.setEnabled(False)
+        self._show_background_toast(f"Profiling for {duration:g}s...")
+        profiler.start_profile(duration, on_done=self._profile_finished.emit)
+
+    @Slot(object)
+    def _on_profile_finished(self, result):
+        self._profile_action.setEnabled(True)
+        if isinstance(result, Exception):
+            self._show_background_toast(f"Profiling failed: {result}")
+        else:
+            self._show_background_toast(f"Profile saved to {result[0]}")
+
+    @Slot()
+    @_traced("launcher.show", new_trace=True)
     def show_launcher(self):
         self.fix_screen_position()
 